@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.benchmark_file_test_processes.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import argparse
+import os
+import queue
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+PLUGIN_ID = 'benchmark_cpu_file_test'
+
+PLUGIN_SOURCE = '''
+def on_library_management_file_test(data):
+    # Simulate a CPU bound file test (eg. parsing a container header in pure python)
+    total = 0
+    for i in range({iterations}):
+        total += (i * i) % 7
+    data['add_file_to_pending_tasks'] = False
+    return data
+'''
+
+
+def install_benchmark_plugin(home_directory, iterations):
+    plugin_path = os.path.join(home_directory, '.unmanic', 'plugins', PLUGIN_ID)
+    os.makedirs(plugin_path)
+    with open(os.path.join(plugin_path, '__init__.py'), 'w'):
+        pass
+    with open(os.path.join(plugin_path, 'plugin.py'), 'w') as f:
+        f.write(PLUGIN_SOURCE.format(iterations=iterations))
+    return [{
+        'plugin_id':   PLUGIN_ID,
+        'name':        'Benchmark CPU file test',
+        'author':      'benchmark',
+        'version':     '1.0.0',
+        'icon':        '',
+        'description': '',
+    }]
+
+
+def run_workers(paths, worker_count, test_paths):
+    """
+    Distribute the paths over a number of threads, each calling test_paths() with batches from a shared queue
+
+    :param paths:
+    :param worker_count:
+    :param test_paths:
+    :return:
+    """
+    work = queue.Queue()
+    for i in range(0, len(paths), 20):
+        work.put(paths[i:i + 20])
+
+    def worker(index):
+        while True:
+            try:
+                batch = work.get_nowait()
+            except queue.Empty:
+                return
+            test_paths(index, batch)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(worker_count)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare file tester threads against file test processes")
+    parser.add_argument('--files', type=int, default=400)
+    parser.add_argument('--iterations', type=int, default=100000,
+                        help="Loop iterations run by the benchmark plugin for each file")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    args = parser.parse_args()
+
+    home_directory = tempfile.mkdtemp(prefix='unmanic_benchmark_file_test_')
+    os.environ['HOME_DIR'] = home_directory
+    try:
+        plugins_list = install_benchmark_plugin(home_directory, args.iterations)
+
+        from unmanic.libs.filetest import FileTest
+        from unmanic.libs.filetestprocess import FileTestProcess
+        from unmanic.libs.unplugins import PluginExecutor
+
+        plugin_modules = PluginExecutor().build_plugin_data_from_plugin_list_filtered_by_plugin_type(
+            plugins_list, 'library_management.file_test')
+        paths = ['/library/file-{}.mkv'.format(i) for i in range(args.files)]
+        print("Files: {} Plugin iterations per file: {} CPUs: {}".format(args.files, args.iterations, os.cpu_count()))
+
+        for workers in args.workers:
+            file_test = FileTest(1, plugin_modules=plugin_modules)
+
+            def test_in_thread(index, batch):
+                for path in batch:
+                    file_test.run_plugin_tests(path, [])
+
+            duration = run_workers(paths, workers, test_in_thread)
+            print("{:<24} {:>10.3f}s {:>10.1f} files/s".format('threads({})'.format(workers), duration,
+                                                               args.files / duration))
+
+            processes = [FileTestProcess(1, plugin_modules) for _ in range(workers)]
+            for process in processes:
+                process.start()
+            # Warm up so the child plugin imports are not timed
+            for process in processes:
+                process.test_batch([(paths[0], [])])
+
+            def test_in_process(index, batch):
+                results = processes[index].test_batch([(path, []) for path in batch])
+                if len(results) != len(batch):
+                    print("File test process returned {} of {} results".format(len(results), len(batch)),
+                          file=sys.stderr)
+
+            try:
+                duration = run_workers(paths, workers, test_in_process)
+            finally:
+                for process in processes:
+                    process.stop()
+            print("{:<24} {:>10.3f}s {:>10.1f} files/s".format('processes({})'.format(workers), duration,
+                                                               args.files / duration))
+    finally:
+        shutil.rmtree(home_directory, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.benchmark_foreman_dispatch.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import argparse
+import os
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+
+
+def setup_database(config_path, worker_count):
+    from unmanic.libs.unmodels.lib import Database
+    from unmanic.libs.unmodels import (EnabledPlugins, Libraries, LibraryPluginFlow, LibraryTags, Plugins, Tags,
+                                       Tasks, TaskStatusCounts, WorkerGroupTags, WorkerGroups, WorkerSchedules)
+    from unmanic.libs.unmodels.taskstatuscounts import TASK_STATUS_COUNT_TRIGGERS
+    db_connection = Database.select_database({
+        "TYPE": "SQLITE",
+        "FILE": os.path.join(config_path, 'unmanic.db'),
+    })
+    db_connection.create_tables([EnabledPlugins, Libraries, LibraryPluginFlow, LibraryTags, Plugins, Tags, Tasks,
+                                 TaskStatusCounts, WorkerGroupTags, WorkerGroups, WorkerSchedules])
+    for statement in TASK_STATUS_COUNT_TRIGGERS:
+        db_connection.execute_sql(statement).fetchall()
+    Libraries.insert(id=1, name='Benchmark library', path='/library').on_conflict_ignore().execute()
+    WorkerGroups.insert(id=1, name='Benchmark', number_of_workers=worker_count).on_conflict_ignore().execute()
+    return db_connection
+
+
+def run_post_processor(task_queue, abort_flag):
+    """Stand in for the PostProcessor. Marks each processed task as complete as soon as it is processed"""
+    while not abort_flag.is_set():
+        if not task_queue.wait_for_processed_tasks(timeout=0.5):
+            continue
+        task_item = task_queue.get_next_processed_tasks()
+        if task_item:
+            task_item.set_status('complete')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure how long the Foreman takes to hand short tasks to idle workers")
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--tasks', type=int, nargs='+', default=[20, 100, 400])
+    parser.add_argument('--task-duration', type=float, default=0.01,
+                        help="Seconds each fake runner takes to process a task")
+    args = parser.parse_args()
+
+    config_path = tempfile.mkdtemp(prefix='unmanic_benchmark_foreman_dispatch_')
+    abort_flag = threading.Event()
+    foreman = None
+    try:
+        setup_database(config_path, args.workers)
+        from unmanic import config
+        settings = config.Config(config_path=config_path)
+
+        from unmanic.libs.foreman import Foreman
+        from unmanic.libs.plugins import PluginsHandler
+        from unmanic.libs.task import TaskStatusCounters
+        from unmanic.libs.taskqueue import TaskQueue
+        from unmanic.libs.unmodels import Tasks
+        from unmanic.libs.workers import Worker
+
+        # Measure the dispatch only. There are no plugins, remote links or session limits.
+        PluginsHandler.run_event_plugins_for_plugin_type = lambda handler, plugin_type, data: None
+        Foreman.configuration_changed = lambda self: False
+        Foreman.validate_worker_config = lambda self: True
+        Foreman.link_manager_tread_heartbeat = lambda self: None
+
+        # Fake runners. Record when each worker starts and finishes every task
+        timeline = []
+        timeline_lock = threading.Lock()
+
+        def fake_runners(worker):
+            started = time.perf_counter()
+            time.sleep(args.task_duration)
+            with timeline_lock:
+                timeline.append((worker.thread_id, started, time.perf_counter()))
+            return True
+
+        Worker._Worker__exec_worker_runners_on_set_task = fake_runners
+
+        task_queue = TaskQueue({})
+        TaskStatusCounters().reload()
+        post_processor = threading.Thread(target=run_post_processor, args=(task_queue, abort_flag), daemon=True)
+        post_processor.start()
+        foreman = Foreman({}, settings, task_queue, threading.Event())
+        foreman.daemon = True
+        foreman.start()
+        # Let the workers start up
+        time.sleep(1)
+
+        print("Workers: {} Task duration: {:.1f}ms".format(args.workers, args.task_duration * 1000))
+        print("{:>7} {:>10} {:>10} {:>12} {:>14} {:>14} {:>14}".format(
+            'tasks', 'wall', 'ideal', 'tasks/s', 'overhead/task', 'handoff p50', 'handoff max'))
+        for task_count in args.tasks:
+            Tasks.delete().execute()
+            TaskStatusCounters().reload()
+            with timeline_lock:
+                timeline.clear()
+            start = time.perf_counter()
+            Tasks.insert_many([{
+                'abspath':    '/library/{}/file-{}.mkv'.format(task_count, i),
+                'library_id': 1,
+                'priority':   task_count - i,
+                'type':       'local',
+                'status':     'pending',
+            } for i in range(task_count)]).execute()
+            TaskStatusCounters().reload()
+            while TaskStatusCounters().count(status='complete') < task_count:
+                time.sleep(0.001)
+            wall = time.perf_counter() - start
+
+            # The handoff is the gap between a worker finishing one task and starting the next
+            handoffs = []
+            last_finished = {}
+            for worker_id, started, finished in sorted(timeline, key=lambda entry: entry[1]):
+                if worker_id in last_finished:
+                    handoffs.append(started - last_finished[worker_id])
+                last_finished[worker_id] = finished
+            ideal = task_count * args.task_duration / args.workers
+            print("{:>7} {:>9.3f}s {:>9.3f}s {:>12.1f} {:>12.2f}ms {:>12.2f}ms {:>12.2f}ms".format(
+                task_count, wall, ideal, task_count / wall, (wall - ideal) * 1000 * args.workers / task_count,
+                statistics.median(handoffs) * 1000 if handoffs else 0, max(handoffs) * 1000 if handoffs else 0))
+    finally:
+        abort_flag.set()
+        if foreman:
+            foreman.stop()
+        shutil.rmtree(config_path, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
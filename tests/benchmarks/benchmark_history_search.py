@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.benchmark_history_search.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+
+WORDS = ['movie', 'series', 'season', 'episode', 'documentary', 'concert', 'trailer', 'extras', 'special', 'final',
+         'night', 'river', 'mountain', 'city', 'ocean', 'forest', 'winter', 'summer', 'empire', 'garden']
+
+
+def build_label(rng, index):
+    words = ' '.join(rng.choice(WORDS).title() for _ in range(3))
+    return '{} {} S{:02d}E{:02d} ({}).mkv'.format(words, index, rng.randint(1, 20), rng.randint(1, 30),
+                                                  rng.randint(1950, 2025))
+
+
+def setup_database(config_path, rows, with_search_index):
+    from unmanic.libs.unmodels.lib import Database
+    from unmanic.libs.unmodels import CompletedTasks
+    from unmanic.libs.unmodels.searchindexes import create_search_index_statements
+    db_connection = Database.select_database({
+        "TYPE": "SQLITE",
+        "FILE": os.path.join(config_path, 'unmanic.db'),
+    })
+    db_connection.create_tables([CompletedTasks])
+    if with_search_index:
+        # Create the index on the empty table. The triggers then index each row as it is inserted.
+        for statement in create_search_index_statements('completedtasks', 'task_label'):
+            # Writes are queued. Wait for each statement to complete.
+            db_connection.execute_sql(statement).fetchall()
+    rng = random.Random(1)
+    start_time = time.perf_counter()
+    for start in range(0, rows, 5000):
+        CompletedTasks.insert_many([{
+            'task_label':          build_label(rng, i),
+            'abspath':             '/library/{}'.format(i),
+            'task_success':        True,
+            'processed_by_worker': 'worker-1',
+        } for i in range(start, min(rows, start + 5000))]).execute()
+    return time.perf_counter() - start_time
+
+
+def time_search(history, search_value, repeat):
+    """
+    Time the queries run by the history API for a search: a filtered count and the first page of results
+
+    :param history:
+    :param search_value:
+    :param repeat:
+    :return:
+    """
+    order = {"column": 'finish_time', "dir": 'desc'}
+    start = time.perf_counter()
+    for _ in range(repeat):
+        count = history.get_historic_task_list_filtered_and_sorted(order=order, start=0, length=0,
+                                                                   search_value=search_value).count()
+        list(history.get_historic_task_list_filtered_and_sorted(order=order, start=0, length=10,
+                                                                search_value=search_value))
+    return (time.perf_counter() - start) / repeat, count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare history search latency with and without the search index")
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--search', nargs='+', default=['Documentary', 'S07E21', '123456', 'River City', 'no match'])
+    args = parser.parse_args()
+
+    results = {}
+    for with_search_index in [False, True]:
+        config_path = tempfile.mkdtemp(prefix='unmanic_benchmark_history_search_')
+        try:
+            insert_duration = setup_database(config_path, args.rows, with_search_index)
+            print("Inserted {} rows {} the search index in {:.1f}s".format(
+                args.rows, 'with' if with_search_index else 'without', insert_duration))
+            from unmanic import config
+            config.Config(config_path=config_path)
+            from unmanic.libs.history import History
+            history = History()
+            for search_value in args.search:
+                results[(search_value, with_search_index)] = time_search(history, search_value, args.repeat)
+        finally:
+            shutil.rmtree(config_path, ignore_errors=True)
+
+    print("Rows: {}".format(args.rows))
+    print("{:<16} {:>10} {:>12} {:>12}".format('search', 'matches', 'LIKE', 'FTS5'))
+    for search_value in args.search:
+        like_duration, count = results[(search_value, False)]
+        fts_duration, fts_count = results[(search_value, True)]
+        if count != fts_count:
+            print("Result count mismatch for '{}': {} != {}".format(search_value, count, fts_count))
+        print("{:<16} {:>10} {:>10.1f}ms {:>10.1f}ms".format(search_value, count, like_duration * 1000,
+                                                             fts_duration * 1000))
+
+
+if __name__ == '__main__':
+    main()
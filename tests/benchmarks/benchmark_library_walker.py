@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.benchmark_library_walker.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from unmanic.libs.librarywalker import LibraryWalker
+
+
+def build_tree(root, depth, fanout, files_per_directory):
+    """
+    Build a synthetic library tree
+
+    :param root:
+    :param depth:
+    :param fanout:
+    :param files_per_directory:
+    :return:
+    """
+    file_count = 0
+    directories = [(root, 0)]
+    while directories:
+        directory, level = directories.pop()
+        for i in range(files_per_directory):
+            with open(os.path.join(directory, 'episode-{}.mkv'.format(i)), 'w'):
+                pass
+            file_count += 1
+        if level >= depth:
+            continue
+        for i in range(fanout):
+            child = os.path.join(directory, 'season-{}'.format(i))
+            os.mkdir(child)
+            directories.append((child, level + 1))
+    return file_count
+
+
+def os_walk_files(library_path, follow_symlinks):
+    """
+    The library scanner's previous implementation
+
+    :param library_path:
+    :param follow_symlinks:
+    :return:
+    """
+    for root, sub_folders, files in os.walk(library_path, followlinks=follow_symlinks):
+        for file_path in files:
+            yield os.path.join(root, file_path)
+
+
+def time_walk(walk):
+    start = time.perf_counter()
+    count = sum(1 for _ in walk)
+    return time.perf_counter() - start, count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the library walker against os.walk on a synthetic tree")
+    parser.add_argument('--depth', type=int, default=5)
+    parser.add_argument('--fanout', type=int, default=4)
+    parser.add_argument('--files', type=int, default=10, help="Files per directory")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--latency-ms', type=float, default=0.0,
+                        help="Simulated latency added to every directory listing (eg. to model an NFS/SMB mount)")
+    args = parser.parse_args()
+
+    # Both implementations list directories through os.scandir, so both pay the simulated latency
+    if args.latency_ms:
+        real_scandir = os.scandir
+
+        def slow_scandir(*a, **kw):
+            time.sleep(args.latency_ms / 1000.0)
+            return real_scandir(*a, **kw)
+
+        os.scandir = slow_scandir
+
+    root = tempfile.mkdtemp(prefix='unmanic_benchmark_walk_')
+    try:
+        file_count = build_tree(root, args.depth, args.fanout, args.files)
+        print("Synthetic tree: depth={} fanout={} files={} latency={}ms".format(
+            args.depth, args.fanout, file_count, args.latency_ms))
+
+        duration, count = time_walk(os_walk_files(root, True))
+        print("{:<24} {:>10.3f}s {:>10} files".format('os.walk', duration, count))
+        for workers in args.workers:
+            duration, count = time_walk(LibraryWalker(root, follow_symlinks=True, max_workers=workers))
+            print("{:<24} {:>10.3f}s {:>10} files".format('LibraryWalker({})'.format(workers), duration, count))
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.benchmark_plugin_child_process.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import argparse
+import time
+from multiprocessing import Manager
+
+import psutil
+
+
+def chatty_child(messages, log_queue=None, prog_queue=None):
+    for i in range(messages):
+        log_queue.put("line {}".format(i))
+        prog_queue.put(i * 100 / messages)
+
+
+def idle_child(seconds, log_queue=None, prog_queue=None):
+    log_queue.put("sleeping")
+    time.sleep(seconds)
+    prog_queue.put(100)
+
+
+def run_child(target, *args):
+    """
+    Run the target in a PluginChildProcess.
+    Returns the wall time, parent CPU time, the number of log lines and progress updates received and the last progress
+
+    :param target:
+    :param args:
+    :return:
+    """
+    from unmanic.libs.unplugins.child_process import PluginChildProcess
+    progress_updates = []
+
+    def parser(line_text, pid=None, proc_start_time=None, unset=False):
+        if line_text is not None:
+            progress_updates.append(line_text)
+
+    data = {
+        'worker_log':              [],
+        'command_progress_parser': parser,
+        'current_command':         [],
+    }
+    child_process = PluginChildProcess('benchmark', data)
+    start = time.perf_counter()
+    start_cpu = time.process_time()
+    assert child_process.run(target, *args)
+    cpu = time.process_time() - start_cpu
+    wall = time.perf_counter() - start
+    return wall, cpu, len(data['worker_log']), len(progress_updates), progress_updates[-1] if progress_updates else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure PluginChildProcess log and progress message throughput")
+    parser.add_argument('--messages', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--idle-seconds', type=float, default=3)
+    args = parser.parse_args()
+
+    from unmanic.libs.unplugins.child_process import set_shared_manager
+    manager = Manager()
+    set_shared_manager(manager)
+    manager_process = psutil.Process(manager._process.pid)
+    try:
+        def manager_cpu():
+            cpu_times = manager_process.cpu_times()
+            return cpu_times.user + cpu_times.system
+
+        print("{:<22} {:>9} {:>14} {:>12} {:>13} {:>10} {:>10} {:>10}".format(
+            'child', 'wall', 'log lines/s', 'parent cpu', 'manager cpu', 'logs', 'progress', 'last'))
+        runs = [('chatty({})'.format(messages), chatty_child, messages) for messages in args.messages]
+        runs.append(('idle({}s)'.format(args.idle_seconds), idle_child, args.idle_seconds))
+        for name, target, arg in runs:
+            start_manager_cpu = manager_cpu()
+            wall, cpu, log_lines, progress_updates, last_progress = run_child(target, arg)
+            print("{:<22} {:>8.3f}s {:>14.1f} {:>11.3f}s {:>12.3f}s {:>10} {:>10} {:>10}".format(
+                name, wall, log_lines / wall, cpu, manager_cpu() - start_manager_cpu, log_lines, progress_updates,
+                last_progress))
+    finally:
+        manager.shutdown()
+
+
+if __name__ == '__main__':
+    main()
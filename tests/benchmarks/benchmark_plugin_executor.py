@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.benchmark_plugin_executor.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+PLUGIN_ID = 'benchmark_noop_runner'
+
+PLUGIN_SOURCE = '''
+def on_library_management_file_test(data, task_data_store=None, file_metadata=None):
+    return data
+'''
+
+
+def install_benchmark_plugin(home_directory):
+    plugin_path = os.path.join(home_directory, '.unmanic', 'plugins', PLUGIN_ID)
+    os.makedirs(plugin_path)
+    with open(os.path.join(plugin_path, '__init__.py'), 'w'):
+        pass
+    with open(os.path.join(plugin_path, 'plugin.py'), 'w') as f:
+        f.write(PLUGIN_SOURCE)
+    return plugin_path
+
+
+def time_calls(calls, function):
+    start = time.perf_counter()
+    for _ in range(calls):
+        function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the overhead PluginExecutor adds to each plugin runner call")
+    parser.add_argument('--calls', type=int, default=50000)
+    args = parser.parse_args()
+
+    home_directory = tempfile.mkdtemp(prefix='unmanic_benchmark_plugin_executor_')
+    os.environ['HOME_DIR'] = home_directory
+    try:
+        install_benchmark_plugin(home_directory)
+
+        from unmanic import config
+        config.Config()
+        from unmanic.libs.plugins import PluginsHandler
+        from unmanic.libs.unplugins import PluginExecutor
+
+        plugin_type = 'library_management.file_test'
+        data = {
+            'library_id':                1,
+            'path':                      '/library/file.mkv',
+            'issues':                    [],
+            'add_file_to_pending_tasks': None,
+            'priority_score':            0,
+            'shared_info':               {},
+        }
+        plugin_executor = PluginExecutor()
+        # Import the plugin so it is not included in the timings
+        assert plugin_executor.execute_plugin_runner(data, PLUGIN_ID, plugin_type)
+        runner = plugin_executor._PluginExecutor__load_plugin_module(
+            PLUGIN_ID, os.path.join(home_directory, '.unmanic', 'plugins', PLUGIN_ID)).on_library_management_file_test
+        plugin_handler = PluginsHandler()
+
+        direct = time_calls(args.calls, lambda: runner(data))
+        executor = time_calls(args.calls, lambda: plugin_executor.execute_plugin_runner(data, PLUGIN_ID, plugin_type))
+        handler = time_calls(args.calls, lambda: plugin_handler.exec_plugin_runner(data, PLUGIN_ID, plugin_type))
+
+        print("Calls: {}".format(args.calls))
+        print("{:<44} {:>10} {:>14} {:>10}".format('call', 'wall', 'calls/s', 'us/call'))
+        for name, duration in (("runner(data)", direct),
+                               ("PluginExecutor.execute_plugin_runner()", executor),
+                               ("PluginsHandler.exec_plugin_runner()", handler)):
+            print("{:<44} {:>9.3f}s {:>14.1f} {:>10.2f}".format(
+                name, duration, args.calls / duration, duration * 1000000 / args.calls))
+        print("Executor overhead per call: {:.2f}us".format((executor - direct) * 1000000 / args.calls))
+    finally:
+        shutil.rmtree(home_directory, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.benchmark_plugin_settings.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+PLUGIN_ID = 'benchmark_plugin_settings'
+
+PLUGIN_SOURCE = '''
+from unmanic.libs.unplugins.settings import PluginSettings
+
+
+class Settings(PluginSettings):
+    settings = {settings}
+'''
+
+
+def install_benchmark_plugin(home_directory, setting_count):
+    plugin_path = os.path.join(home_directory, '.unmanic', 'plugins', PLUGIN_ID)
+    os.makedirs(plugin_path)
+    with open(os.path.join(plugin_path, '__init__.py'), 'w'):
+        pass
+    settings = {'setting_{}'.format(i): 'value {}'.format(i) for i in range(setting_count)}
+    with open(os.path.join(plugin_path, 'plugin.py'), 'w') as f:
+        f.write(PLUGIN_SOURCE.format(settings=repr(settings)))
+
+
+def run_threads(thread_count, calls, target):
+    threads = [threading.Thread(target=target, args=(calls,)) for _ in range(thread_count)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the throughput of PluginSettings.get_setting()")
+    parser.add_argument('--calls', type=int, default=20000, help="Calls made by each thread")
+    parser.add_argument('--settings', type=int, default=20, help="Number of settings the plugin has")
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 4])
+    args = parser.parse_args()
+
+    home_directory = tempfile.mkdtemp(prefix='unmanic_benchmark_plugin_settings_')
+    os.environ['HOME_DIR'] = home_directory
+    try:
+        install_benchmark_plugin(home_directory, args.settings)
+
+        from unmanic import config
+        config.Config()
+        from unmanic.libs.unplugins import PluginExecutor
+
+        # Load the plugin module and write the library settings file
+        plugin_module = PluginExecutor()._PluginExecutor__load_plugin_module(
+            PLUGIN_ID, os.path.join(home_directory, '.unmanic', 'plugins', PLUGIN_ID))
+        plugin_module.Settings().get_setting()
+        plugin_settings = plugin_module.Settings(library_id=1)
+        plugin_settings.set_setting('setting_0', 'configured')
+
+        def get_single_setting(calls):
+            for _ in range(calls):
+                plugin_settings.get_setting('setting_0')
+
+        def get_all_settings(calls):
+            for _ in range(calls):
+                plugin_module.Settings(library_id=1).get_setting()
+
+        print("Settings: {} Calls per thread: {}".format(args.settings, args.calls))
+        print("{:<28} {:>8} {:>10} {:>14} {:>10}".format('call', 'threads', 'wall', 'calls/s', 'us/call'))
+        for name, target in (("get_setting('setting_0')", get_single_setting), ("get_setting()", get_all_settings)):
+            for thread_count in args.threads:
+                duration = run_threads(thread_count, args.calls, target)
+                total_calls = thread_count * args.calls
+                print("{:<28} {:>8} {:>9.3f}s {:>14.1f} {:>10.2f}".format(
+                    name, thread_count, duration, total_calls / duration, duration * 1000000 / total_calls))
+
+        # Ensure a change written to the file is still seen by the next read
+        assert plugin_settings.get_setting('setting_0') == 'configured'
+        plugin_module.Settings(library_id=1).set_setting('setting_0', 'changed')
+        assert plugin_settings.get_setting('setting_0') == 'changed'
+    finally:
+        shutil.rmtree(home_directory, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.benchmark_task_creation.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import argparse
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
+
+
+def setup_database(config_path):
+    from unmanic.libs.unmodels.lib import Database
+    from unmanic.libs.unmodels import Libraries, Tasks
+    db_connection = Database.select_database({
+        "TYPE": "SQLITE",
+        "FILE": os.path.join(config_path, 'unmanic.db'),
+    })
+    db_connection.create_tables([Libraries, Tasks])
+    Libraries.insert(id=1, name='Benchmark library', path='/library').on_conflict_ignore().execute()
+    return db_connection
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-path task creation against bulk task creation")
+    parser.add_argument('--tasks', type=int, default=5000)
+    parser.add_argument('--chunk-size', type=int, default=500,
+                        help="Number of queued paths the TaskHandler creates together")
+    args = parser.parse_args()
+
+    config_path = tempfile.mkdtemp(prefix='unmanic_benchmark_task_creation_')
+    try:
+        setup_database(config_path)
+        from unmanic import config
+        config.Config(config_path=config_path)
+
+        from unmanic.libs.plugins import PluginsHandler
+        from unmanic.libs.taskhandler import TaskHandler
+        from unmanic.libs.unmodels import Tasks
+
+        # Measure the DB work only. No event plugins are installed.
+        PluginsHandler.get_enabled_plugin_modules_by_type = lambda handler, plugin_type, library_id=None: []
+        PluginsHandler.run_event_plugins_for_plugin_type = lambda handler, plugin_type, data: None
+
+        task_handler = TaskHandler({
+            "inotifytasks":   queue.Queue(),
+            "scheduledtasks": queue.Queue(),
+        }, None, threading.Event())
+        task_handler.task_insert_chunk_size = args.chunk_size
+        print("Tasks: {} Chunk size: {}".format(args.tasks, args.chunk_size))
+
+        for mode in ['per-path', 'bulk']:
+            Tasks.delete().execute()
+            items = [{'pathname': '/library/{}/file-{}.mkv'.format(mode, i), 'library_id': 1} for i in range(args.tasks)]
+            start = time.perf_counter()
+            if mode == 'per-path':
+                for item in items:
+                    task_handler.add_path_to_task_queue(item['pathname'], item['library_id'])
+            else:
+                for item in items:
+                    task_handler.scheduledtasks.put(item)
+                task_handler.process_scheduledtasks_queue()
+            duration = time.perf_counter() - start
+            created = Tasks.select().where(Tasks.status == 'pending').count()
+            print("{:<12} {:>10.3f}s {:>10.1f} tasks/s ({} created)".format(mode, duration, args.tasks / duration, created))
+    finally:
+        shutil.rmtree(config_path, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
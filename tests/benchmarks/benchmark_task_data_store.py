@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.benchmark_task_data_store.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import argparse
+import time
+from multiprocessing import Manager
+
+
+def run_operations(store, tasks, keys):
+    """
+    Run each store operation over every task and key.
+    Returns a list of (operation, count, seconds).
+
+    :param store:
+    :param tasks:
+    :param keys:
+    :return:
+    """
+    results = []
+
+    def timed(name, count, function):
+        start = time.perf_counter()
+        function()
+        results.append((name, count, time.perf_counter() - start))
+
+    def set_runner_values():
+        for task_id in range(tasks):
+            store.bind_runner_context(task_id, 'benchmark_plugin', 'on_worker_process')
+            for key in range(keys):
+                store.set_runner_value(key, {'streams': [key]})
+        store.clear_context()
+
+    def get_runner_values():
+        for task_id in range(tasks):
+            store.bind_runner_context(task_id, 'benchmark_plugin', 'on_worker_process')
+            for key in range(keys):
+                store.get_runner_value(key)
+        store.clear_context()
+
+    def set_task_states():
+        for task_id in range(tasks):
+            for key in range(keys):
+                store.set_task_state(key, key, task_id=task_id)
+
+    def get_task_states():
+        for task_id in range(tasks):
+            for key in range(keys):
+                store.get_task_state(key, task_id=task_id)
+
+    def export_task_states():
+        for task_id in range(tasks):
+            store.export_task_state(task_id)
+
+    def clear_tasks_one_at_a_time():
+        for task_id in range(tasks):
+            store.clear_task(task_id)
+
+    def clear_tasks_in_bulk():
+        store.clear_tasks(range(tasks))
+
+    timed('set_runner_value', tasks * keys, set_runner_values)
+    timed('get_runner_value', tasks * keys, get_runner_values)
+    timed('set_task_state', tasks * keys, set_task_states)
+    timed('get_task_state', tasks * keys, get_task_states)
+    timed('export_task_state', tasks, export_task_states)
+    timed('clear_task', tasks, clear_tasks_one_at_a_time)
+    if hasattr(store, 'clear_tasks'):
+        set_task_states()
+        timed('clear_tasks', tasks, clear_tasks_in_bulk)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure TaskDataStore operations per second")
+    parser.add_argument('--tasks', type=int, default=200)
+    parser.add_argument('--keys', type=int, default=10)
+    args = parser.parse_args()
+
+    from unmanic.libs.task import TaskDataStore
+
+    backends = [('local', None)]
+    manager = Manager()
+    try:
+        backends.append(('manager proxy', manager))
+        rows = {}
+        for backend, backend_manager in backends:
+            # The proxy backend replaces the in-process dicts with Manager dict proxies (as the service used to)
+            if backend_manager is not None:
+                TaskDataStore._runner_state = backend_manager.dict()
+                TaskDataStore._task_state = backend_manager.dict()
+            else:
+                TaskDataStore._runner_state = {}
+                TaskDataStore._task_state = {}
+            for name, count, seconds in run_operations(TaskDataStore, args.tasks, args.keys):
+                rows.setdefault(name, {})[backend] = count / seconds if seconds else float('inf')
+        TaskDataStore._runner_state = {}
+        TaskDataStore._task_state = {}
+    finally:
+        manager.shutdown()
+
+    print("{:<20} {:>16} {:>16} {:>10}".format('operation', 'local ops/s', 'proxy ops/s', 'speedup'))
+    for name, values in rows.items():
+        local = values.get('local')
+        proxy = values.get('manager proxy')
+        print("{:<20} {:>16.1f} {:>16.1f} {:>9.1f}x".format(name, local, proxy, local / proxy))
+
+
+if __name__ == '__main__':
+    main()
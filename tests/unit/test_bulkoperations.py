@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_bulkoperations.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import os
+import sqlite3
+import tempfile
+
+import pytest
+
+from unmanic.libs.unmodels import TaskMetadata, Tasks, TaskStatusCounts
+from unmanic.libs.unmodels.taskstatuscounts import TASK_STATUS_COUNT_TRIGGERS
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Test the pending tasks bulk operations
+
+    """
+
+    db_connection = None
+
+    def setup_class(self):
+        """
+        Setup the class state for pytest
+
+        :return:
+        """
+        config_path = tempfile.mkdtemp(prefix='unmanic_tests_')
+
+        # Create connection to a test DB.
+        # The DB writer runs in its own thread, so this needs to be a file rather than ':memory:'
+        database_settings = {
+            "TYPE": "SQLITE",
+            "FILE": os.path.join(config_path, 'unmanic.db'),
+        }
+        from unmanic.libs.unmodels.lib import Database
+        self.db_connection = Database.select_database(database_settings)
+        self.db_connection.create_tables([Tasks, TaskMetadata, TaskStatusCounts])
+        for statement in TASK_STATUS_COUNT_TRIGGERS:
+            self.db_connection.execute_sql(statement)
+
+        from unmanic import config
+        self.settings = config.Config(config_path=config_path)
+
+    def setup_method(self):
+        Tasks.delete().execute()
+        Tasks.insert_many([{
+            'abspath':    '/library/{}/file-{}.mkv'.format('movies' if i % 2 else 'tv', i),
+            'library_id': 1 if i % 2 else 2,
+            'priority':   i,
+            'type':       'local',
+            'status':     'in_progress' if i < 10 else 'pending',
+        } for i in range(1210)]).execute()
+
+    @staticmethod
+    def disable_returning(monkeypatch):
+        # Run as on a SQLite library older than 3.35, which does not support RETURNING
+        monkeypatch.setattr(sqlite3, 'sqlite_version_info', (3, 31, 1))
+
+    @staticmethod
+    def run_operation(action, chunk_size=100, **kwargs):
+        from unmanic.libs.bulkoperations import PendingTasksBulkOperation, PendingTasksBulkOperations
+        PendingTasksBulkOperation.chunk_size = chunk_size
+        bulk_operations = PendingTasksBulkOperations()
+        progress = bulk_operations.start(action, **kwargs)
+        bulk_operations.wait(progress['id'], timeout=30)
+        return bulk_operations.get_progress(progress['id'])
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize('returning', [True, False])
+    def test_delete_matching_pending_tasks_in_chunks(self, monkeypatch, returning):
+        if not returning:
+            self.disable_returning(monkeypatch)
+        excluded_task = Tasks.get(abspath='/library/movies/file-11.mkv')
+        progress = self.run_operation('delete', library_ids=[1], exclude_ids=[excluded_task.id])
+        assert progress['state'] == 'complete'
+        assert progress['processed'] == 599
+        assert progress['total'] == 599
+        # Only the excluded pending task and in progress tasks remain in the library
+        remaining = Tasks.select().where(Tasks.library_id == 1)
+        assert sorted(row.abspath for row in remaining if row.status == 'pending') == ['/library/movies/file-11.mkv']
+        assert remaining.count() == 6
+        assert Tasks.select().where(Tasks.library_id == 2).count() == 605
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize('returning', [True, False])
+    def test_reorder_matching_pending_tasks(self, monkeypatch, returning):
+        if not returning:
+            self.disable_returning(monkeypatch)
+        progress = self.run_operation('reorder', search_value='/tv/', position='top')
+        assert progress['state'] == 'complete'
+        assert progress['processed'] == 600
+        top_tasks = Tasks.select().order_by(Tasks.priority.desc()).limit(600)
+        assert all('/tv/' in row.abspath and row.status == 'pending' for row in top_tasks)
+
+    @pytest.mark.unittest
+    def test_total_only_leaves_out_excluded_tasks_that_match(self):
+        from unmanic.libs.bulkoperations import PendingTasksBulkOperation
+        excluded_ids = [
+            Tasks.get(abspath='/library/movies/file-11.mkv').id,
+            # In another library, and in progress
+            Tasks.get(abspath='/library/tv/file-12.mkv').id,
+            Tasks.get(abspath='/library/movies/file-1.mkv').id,
+        ]
+        operation = PendingTasksBulkOperation('delete', library_ids=[1], exclude_ids=excluded_ids)
+        operation.cancel()
+        operation.run()
+        assert operation.get_progress()['total'] == 599
+
+    @pytest.mark.unittest
+    def test_operation_can_be_cancelled(self):
+        from unmanic.libs.bulkoperations import PendingTasksBulkOperation
+        operation = PendingTasksBulkOperation('delete')
+        operation.chunk_size = 100
+        operation.cancel()
+        operation.run()
+        assert operation.get_progress()['state'] == 'cancelled'
+        assert Tasks.select().count() == 1210
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_child_process.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import pytest
+
+from unmanic.libs.unplugins.child_process import PluginChildProcess
+
+
+def report_work(messages, log_queue=None, prog_queue=None):
+    for i in range(messages):
+        log_queue.put("line {}".format(i))
+        prog_queue.put((i + 1) * 100 / messages)
+
+
+def fail_work(log_queue=None, prog_queue=None):
+    log_queue.put("about to fail")
+    raise Exception("Child failed")
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Test running plugin functions in a PluginChildProcess
+
+    """
+
+    def setup_method(self):
+        self.progress_updates = []
+        self.unset_calls = 0
+        self.data = {
+            'worker_log':              [],
+            'command_progress_parser': self.parser,
+            'current_command':         [],
+        }
+
+    def parser(self, line_text, pid=None, proc_start_time=None, unset=False):
+        if unset:
+            self.unset_calls += 1
+        elif line_text is not None:
+            self.progress_updates.append(line_text)
+
+    @pytest.mark.unittest
+    def test_all_logs_and_the_final_progress_are_received(self):
+        assert PluginChildProcess('test_plugin', self.data).run(report_work, 2000)
+        assert self.data['worker_log'] == ["line {}\n".format(i) for i in range(2000)]
+        # Progress updates are coalesced, but the last one is always delivered
+        assert 1 <= len(self.progress_updates) < 2000
+        assert self.progress_updates[-1] == '100.0'
+        assert self.unset_calls == 1
+        assert self.data['current_command'] == []
+
+    @pytest.mark.unittest
+    def test_a_failed_child_returns_false(self):
+        assert not PluginChildProcess('test_plugin', self.data).run(fail_work)
+        assert self.data['worker_log'] == ["about to fail\n"]
+        assert self.unset_calls == 1
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_configversion.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import os
+import tempfile
+
+import pytest
+
+from unmanic.libs.configversion import ConfigVersion
+from unmanic.libs.unmodels import EnabledPlugins, Libraries, LibraryPluginFlow, LibraryTags, Plugins, Tags
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Test the configuration version and the data cached against it
+
+    """
+
+    db_connection = None
+
+    def setup_class(self):
+        """
+        Setup the class state for pytest
+
+        :return:
+        """
+        config_path = tempfile.mkdtemp(prefix='unmanic_tests_')
+
+        # Create connection to a test DB.
+        database_settings = {
+            "TYPE": "SQLITE",
+            "FILE": os.path.join(config_path, 'unmanic.db'),
+        }
+        from unmanic.libs.unmodels.lib import Database
+        self.db_connection = Database.select_database(database_settings)
+        self.db_connection.create_tables([Libraries, LibraryPluginFlow, Plugins, EnabledPlugins, LibraryTags, Tags])
+        Libraries.insert(id=1, name='Local library', path='/local').on_conflict_ignore().execute()
+
+        from unmanic import config
+        config.Config(config_path=config_path)
+
+    def setup_method(self):
+        self.monkeypatch = pytest.MonkeyPatch()
+
+    def teardown_method(self):
+        self.monkeypatch.undo()
+
+    @pytest.mark.unittest
+    def test_bump_increments_version_and_notifies_listeners(self):
+        seen_versions = []
+        config_version = ConfigVersion()
+        config_version.add_listener(seen_versions.append)
+        try:
+            version = config_version.get()
+            assert config_version.bump('test') == version + 1
+            assert config_version.get() == version + 1
+            assert seen_versions == [version + 1]
+        finally:
+            config_version.remove_listener(seen_versions.append)
+        config_version.bump('test')
+        assert len(seen_versions) == 1
+
+    @pytest.mark.unittest
+    def test_library_configuration_hash_is_only_recomputed_after_a_change(self):
+        from unmanic.libs.library import Library
+        reads = []
+
+        def get_plugin_flow(library_self):
+            reads.append(library_self.get_id())
+            return {}
+
+        self.monkeypatch.setattr(Library, 'get_plugin_flow', get_plugin_flow)
+
+        library = Library(1)
+        first_hash = library.get_configuration_hash()
+        assert Library(1).get_configuration_hash() == first_hash
+        assert len(reads) == 1
+
+        # Saving the library bumps the version, so the next call reads the configuration again
+        library.set_path('/local/changed')
+        library.save()
+        changed_hash = Library(1).get_configuration_hash()
+        assert changed_hash != first_hash
+        assert len(reads) == 2
+
+    @pytest.mark.unittest
+    def test_library_configuration_hash_changes_with_the_installed_plugin_version(self):
+        from unmanic.libs.library import Library
+        from unmanic.libs.plugins import PluginsHandler
+        plugin_info = {'version': '1.0.0', 'prefilters': {}}
+
+        def get_enabled_plugins(library_self, include_settings=False):
+            return [{'plugin_id': 'test_plugin', 'settings': {'option': True}}]
+
+        def get_plugin_info(handler_self, plugin_id):
+            return dict(plugin_info)
+
+        self.monkeypatch.setattr(Library, 'get_plugin_flow', lambda library_self: {})
+        self.monkeypatch.setattr(Library, 'get_enabled_plugins', get_enabled_plugins)
+        self.monkeypatch.setattr(PluginsHandler, 'get_plugin_info', get_plugin_info)
+
+        ConfigVersion().bump('test')
+        first_hash = Library(1).get_configuration_hash()
+
+        # Updating a plugin bumps the version without changing its ID or settings
+        plugin_info['version'] = '1.0.1'
+        ConfigVersion().bump('test')
+        assert Library(1).get_configuration_hash() != first_hash
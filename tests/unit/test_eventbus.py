@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_eventbus.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import tempfile
+import threading
+import time
+
+import pytest
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Test delivering events to event plugins through the EventPluginBus
+
+    """
+
+    def setup_class(self):
+        """
+        Setup the class state for pytest
+
+        :return:
+        """
+        from unmanic import config
+        self.settings = config.Config(config_path=tempfile.mkdtemp(prefix='unmanic_tests_'))
+
+    def setup_method(self):
+        from unmanic.libs.eventbus import EventPluginBus
+        from unmanic.libs.plugins import PluginsHandler
+        self.monkeypatch = pytest.MonkeyPatch()
+        self.monkeypatch.setattr(self.settings, 'event_plugin_workers', 1)
+        self.monkeypatch.setattr(self.settings, 'event_plugin_queue_size', 2)
+        self.plugin_modules = []
+        self.monkeypatch.setattr(PluginsHandler, 'get_enabled_plugin_modules_by_type',
+                                 lambda handler, plugin_type, library_id=None: list(self.plugin_modules))
+
+        def exec_plugin_runner(handler, data, plugin_id, plugin_type):
+            runner = [p.get('runner') for p in self.plugin_modules if p.get('plugin_id') == plugin_id][0]
+            runner(data)
+            return True
+
+        self.monkeypatch.setattr(PluginsHandler, 'exec_plugin_runner', exec_plugin_runner)
+        self.bus = EventPluginBus()
+        self.bus.stop()
+
+    def teardown_method(self):
+        self.bus.stop()
+        self.monkeypatch.undo()
+
+    def add_plugin(self, plugin_id, runner):
+        self.plugin_modules.append({'plugin_id': plugin_id, 'runner': runner})
+
+    def start_blocked_plugin(self, policy):
+        """
+        Add a plugin that blocks on its first event, then publish that event and wait for delivery to start
+
+        :param policy:
+        :return:
+        """
+        self.monkeypatch.setattr(self.settings, 'event_plugin_overflow_policy', policy)
+        started = threading.Event()
+        release = threading.Event()
+        delivered = []
+
+        def runner(data):
+            started.set()
+            release.wait(10)
+            delivered.append((data['task_id'], data['value']))
+
+        self.add_plugin('test_{}'.format(policy), runner)
+        self.bus.publish('events.task_queued', {'task_id': 0, 'value': 'first'})
+        assert started.wait(5)
+        return release, delivered
+
+    @pytest.mark.unittest
+    def test_slow_plugins_do_not_block_the_publisher(self):
+        release, delivered = self.start_blocked_plugin('block')
+        sync_calls = []
+
+        def runner_with_helpers(data, task_data_store=None):
+            sync_calls.append(data['task_id'])
+
+        self.add_plugin('test_synchronous', runner_with_helpers)
+
+        start = time.monotonic()
+        self.bus.publish('events.task_queued', {'task_id': 1, 'value': 'second'})
+        assert time.monotonic() - start < 1
+        # Runners that accept the task data store are still run before publish() returns
+        assert sync_calls == [1]
+
+        release.set()
+        assert self.bus.wait_until_idle(5)
+        assert delivered == [(0, 'first'), (1, 'second')]
+        assert self.bus.get_stats()['test_block']['delivered'] == 2
+
+    @pytest.mark.unittest
+    def test_drop_oldest_discards_the_oldest_pending_event(self):
+        release, delivered = self.start_blocked_plugin('drop_oldest')
+        for task_id in range(1, 5):
+            self.bus.publish('events.task_queued', {'task_id': task_id, 'value': 'queued'})
+        release.set()
+        assert self.bus.wait_until_idle(5)
+        assert [task_id for task_id, _ in delivered] == [0, 3, 4]
+        assert self.bus.get_stats()['test_drop_oldest']['dropped'] == 2
+
+    @pytest.mark.unittest
+    def test_coalesce_replaces_pending_events_for_the_same_task(self):
+        release, delivered = self.start_blocked_plugin('coalesce')
+        self.bus.publish('events.task_queued', {'task_id': 1, 'value': 'queued'})
+        self.bus.publish('events.task_queued', {'task_id': 2, 'value': 'queued'})
+        self.bus.publish('events.task_queued', {'task_id': 1, 'value': 'updated'})
+        release.set()
+        assert self.bus.wait_until_idle(5)
+        assert delivered == [(0, 'first'), (1, 'updated'), (2, 'queued')]
+        assert self.bus.get_stats()['test_coalesce']['coalesced'] == 1
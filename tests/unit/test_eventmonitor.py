@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_eventmonitor.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import os
+import tempfile
+import threading
+import time
+
+import pytest
+
+from unmanic.libs.eventmonitor import EventBuffer
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Test the file monitor EventBuffer object
+
+    """
+
+    def setup_method(self):
+        self.library_path = tempfile.mkdtemp(prefix='unmanic_tests_library_')
+
+    def write_file(self, name, data='x', age=0):
+        path = os.path.join(self.library_path, name)
+        with open(path, 'a') as f:
+            f.write(data)
+        if age:
+            mtime = time.time() - age
+            os.utime(path, (mtime, mtime))
+        return path
+
+    @pytest.mark.unittest
+    def test_events_are_coalesced_per_path(self):
+        event_buffer = EventBuffer(stable_seconds=5)
+        paths = [self.write_file('file-{}.mkv'.format(i), age=60) for i in range(50)]
+        for path in paths:
+            for _ in range(3):
+                event_buffer.add(path, 1)
+        assert len(event_buffer) == 50
+        assert event_buffer.events_coalesced_count == 100
+
+        # Files that have not been modified within the window are released straight away
+        released = event_buffer.drain(20)
+        released += event_buffer.drain(100)
+        assert released == [(path, 1) for path in paths]
+        assert len(event_buffer) == 0
+
+    @pytest.mark.unittest
+    def test_paths_are_held_until_stable(self):
+        event_buffer = EventBuffer(stable_seconds=.3)
+        path = self.write_file('copying.mkv')
+        event_buffer.add(path, 1)
+        assert event_buffer.drain(10) == []
+
+        # The file is still being written
+        time.sleep(.35)
+        self.write_file('copying.mkv', data='more')
+        assert event_buffer.drain(10) == []
+
+        time.sleep(.35)
+        assert event_buffer.drain(10) == [(path, 1)]
+
+    @pytest.mark.unittest
+    def test_removed_files_are_dropped(self):
+        event_buffer = EventBuffer(stable_seconds=.1)
+        path = self.write_file('deleted.mkv')
+        event_buffer.add(path, 1)
+        os.remove(path)
+        assert event_buffer.drain(10) == []
+        assert len(event_buffer) == 0
+
+    @pytest.mark.unittest
+    def test_tester_pool_tests_each_queued_path_once(self):
+        from unmanic.libs.eventmonitor import EventFileTesterPool
+        tested = []
+        release = threading.Event()
+
+        def test_function(path, library_id, file_test):
+            release.wait(2)
+            tested.append((path, library_id, file_test))
+
+        class TesterPool(EventFileTesterPool):
+            def build_file_test(self):
+                return 'file_test'
+
+        tester_pool = TesterPool(1, 'hash', test_function)
+        tester_pool.start()
+        try:
+            assert tester_pool.submit('/library/a.mkv')
+            assert not tester_pool.submit('/library/a.mkv')
+            assert tester_pool.submit('/library/b.mkv')
+            assert tester_pool.queue_depth() == 2
+            release.set()
+            deadline = time.time() + 2
+            while tester_pool.queue_depth() and time.time() < deadline:
+                time.sleep(.01)
+        finally:
+            tester_pool.stop()
+        assert sorted(tested) == [('/library/a.mkv', 1, 'file_test'), ('/library/b.mkv', 1, 'file_test')]
+        metrics = tester_pool.collect_metrics()
+        assert metrics['files_tested_count'] == 2
+        assert metrics['queue_depth'] == 0
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_filetestcache.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import os
+import tempfile
+
+import pytest
+
+from unmanic.libs.unmodels import FileTestDecisions, Libraries
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Test the FileTestDecisionCache object
+
+    """
+
+    db_connection = None
+
+    def setup_class(self):
+        """
+        Setup the class state for pytest
+
+        :return:
+        """
+        config_path = tempfile.mkdtemp(prefix='unmanic_tests_')
+
+        # Create connection to a test DB.
+        # The DB writer runs in its own thread, so this needs to be a file rather than ':memory:'
+        database_settings = {
+            "TYPE": "SQLITE",
+            "FILE": os.path.join(config_path, 'unmanic.db'),
+        }
+        from unmanic.libs.unmodels.lib import Database
+        self.db_connection = Database.select_database(database_settings)
+        self.db_connection.create_tables([FileTestDecisions, Libraries])
+        Libraries.insert(id=1, name='Test library', path='/library').on_conflict_ignore().execute()
+
+        from unmanic import config
+        self.settings = config.Config(config_path=config_path)
+
+    def setup_method(self):
+        from unmanic.libs.filetestcache import FileTestDecisionCache
+        FileTestDecisionCache.clear(1)
+        self.library_path = tempfile.mkdtemp(prefix='unmanic_tests_library_')
+        self.file_path = os.path.join(self.library_path, 'file.mkv')
+        with open(self.file_path, 'w') as f:
+            f.write('x')
+
+    @pytest.mark.unittest
+    def test_cached_result_is_returned_until_file_changes(self):
+        from unmanic.libs.filetestcache import FileTestDecisionCache
+        result = (False, [{'id': 'plugin_issue', 'message': 'Already transcoded'}], 100,
+                  {'plugin_id': 'test', 'plugin_name': 'Test'})
+        decision_cache = FileTestDecisionCache(1, 'hash-a', buffered=True)
+        file_stat = decision_cache.stat_file(self.file_path)
+        assert decision_cache.lookup(self.file_path, file_stat) is None
+        decision_cache.store(self.file_path, file_stat, result)
+        decision_cache.flush()
+        assert decision_cache.lookup(self.file_path, file_stat) == result
+        assert (decision_cache.hit_count, decision_cache.miss_count) == (1, 1)
+
+        # Modifying the file invalidates the result
+        os.utime(self.file_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1000000000))
+        assert decision_cache.lookup(self.file_path, decision_cache.stat_file(self.file_path)) is None
+
+    @pytest.mark.unittest
+    def test_configuration_change_and_clear_invalidate_results(self):
+        from unmanic.libs.filetestcache import FileTestDecisionCache
+        decision_cache = FileTestDecisionCache(1, 'hash-a')
+        file_stat = decision_cache.stat_file(self.file_path)
+        decision_cache.store(self.file_path, file_stat, (False, [], 0, None))
+        assert decision_cache.lookup(self.file_path, file_stat) == (False, [], 0, None)
+        assert FileTestDecisionCache(1, 'hash-b').lookup(self.file_path, file_stat) is None
+        FileTestDecisionCache.clear(1)
+        assert decision_cache.lookup(self.file_path, file_stat) is None
+
+    @pytest.mark.unittest
+    def test_forget_paths_removes_results(self):
+        from unmanic.libs.filetestcache import FileTestDecisionCache
+        decision_cache = FileTestDecisionCache(1, 'hash-a')
+        file_stat = decision_cache.stat_file(self.file_path)
+        decision_cache.store(self.file_path, file_stat, (False, [], 0, None))
+        assert FileTestDecisionCache.forget_paths([self.file_path, None]) == 1
+        assert decision_cache.lookup(self.file_path, file_stat) is None
+
+    @pytest.mark.unittest
+    def test_processed_file_is_not_queued_again_from_a_cached_result(self, monkeypatch):
+        from unmanic.libs.filetest import FileTest
+        from unmanic.libs.filetestcache import FileTestDecisionCache
+        # The plugin only adds files that have not been processed yet, as recorded outside the file
+        # (for example in the task history or file metadata)
+        processed_paths = set()
+
+        def run_plugin_tests(path, file_issues):
+            return path not in processed_paths, file_issues, 0, None
+
+        file_test = FileTest(1, plugin_modules=[], decision_cache=FileTestDecisionCache(1, 'hash-a'))
+        monkeypatch.setattr(file_test, 'run_pre_checks', lambda path: (None, []))
+        monkeypatch.setattr(file_test, 'run_plugin_tests', run_plugin_tests)
+        assert file_test.should_file_be_added_to_task_list(self.file_path)[0] is True
+
+        # The task for the file completes without changing its size or mtime
+        processed_paths.add(self.file_path)
+        assert file_test.should_file_be_added_to_task_list(self.file_path)[0] is False
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_history.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import os
+import tempfile
+
+import pytest
+
+from unmanic.libs.unmodels import CompletedTasks, CompletedTasksCommandLogs
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Test the failed historic task paths index
+
+    """
+
+    db_connection = None
+
+    def setup_class(self):
+        """
+        Setup the class state for pytest
+
+        :return:
+        """
+        config_path = tempfile.mkdtemp(prefix='unmanic_tests_')
+
+        # Create connection to a test DB.
+        # The DB writer runs in its own thread, so this needs to be a file rather than ':memory:'
+        database_settings = {
+            "TYPE": "SQLITE",
+            "FILE": os.path.join(config_path, 'unmanic.db'),
+        }
+        from unmanic.libs.unmodels.lib import Database
+        self.db_connection = Database.select_database(database_settings)
+        self.db_connection.create_tables([CompletedTasks, CompletedTasksCommandLogs])
+
+        from unmanic import config
+        self.settings = config.Config(config_path=config_path)
+
+    def setup_method(self):
+        CompletedTasksCommandLogs.delete().execute()
+        CompletedTasks.delete().execute()
+        from unmanic.libs.history import FailedPathsIndex
+        FailedPathsIndex().reset()
+
+    @staticmethod
+    def save_task(abspath, task_success):
+        from unmanic.libs.history import History
+        return History().save_task_history({
+            'task_label':          os.path.basename(abspath),
+            'abspath':             abspath,
+            'task_success':        task_success,
+            'start_time':          1700000000,
+            'finish_time':         1700000010,
+            'processed_by_worker': 'W0',
+            'log':                 '',
+        })
+
+    @pytest.mark.unittest
+    def test_index_loads_existing_failures(self):
+        from unmanic.libs.history import FailedPathsIndex
+        self.save_task('/library/failed.mkv', False)
+        self.save_task('/library/success.mkv', True)
+        FailedPathsIndex().reset()
+        assert FailedPathsIndex().contains('/library/failed.mkv')
+        assert not FailedPathsIndex().contains('/library/success.mkv')
+
+    @pytest.mark.unittest
+    def test_index_tracks_new_and_deleted_failures(self):
+        from unmanic.libs.history import FailedPathsIndex, History
+        assert not FailedPathsIndex().contains('/library/failed.mkv')
+        self.save_task('/library/failed.mkv', False)
+        self.save_task('/library/failed.mkv', False)
+        assert FailedPathsIndex().contains('/library/failed.mkv')
+
+        # The path remains failed until every failed task for it is deleted
+        task_ids = [t.id for t in CompletedTasks.select().order_by(CompletedTasks.id)]
+        History().delete_historic_tasks_recursively(id_list=task_ids[:1])
+        assert FailedPathsIndex().contains('/library/failed.mkv')
+        History().delete_historic_tasks_recursively(id_list=task_ids[1:])
+        assert not FailedPathsIndex().contains('/library/failed.mkv')
+
+
+if __name__ == '__main__':
+    pytest.main(['-s', '--log-cli-level=DEBUG', __file__])
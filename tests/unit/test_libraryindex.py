@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_libraryindex.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import os
+import tempfile
+
+import pytest
+
+from unmanic.libs.unmodels import LibraryFileIndex
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Test the LibraryScanIndex object
+
+    """
+
+    db_connection = None
+
+    def setup_class(self):
+        """
+        Setup the class state for pytest
+
+        :return:
+        """
+        config_path = tempfile.mkdtemp(prefix='unmanic_tests_')
+
+        # Create connection to a test DB.
+        # The DB writer runs in its own thread, so this needs to be a file rather than ':memory:'
+        database_settings = {
+            "TYPE": "SQLITE",
+            "FILE": os.path.join(config_path, 'unmanic.db'),
+        }
+        from unmanic.libs.unmodels.lib import Database
+        self.db_connection = Database.select_database(database_settings)
+        self.db_connection.create_tables([LibraryFileIndex])
+
+        from unmanic import config
+        self.settings = config.Config(config_path=config_path)
+
+    def setup_method(self):
+        self.library_path = tempfile.mkdtemp(prefix='unmanic_tests_library_')
+        for sub_dir in ['a', os.path.join('a', 'b'), 'c']:
+            os.makedirs(os.path.join(self.library_path, sub_dir), exist_ok=True)
+            for i in range(3):
+                with open(os.path.join(self.library_path, sub_dir, 'file-{}.mkv'.format(i)), 'w') as f:
+                    f.write('x')
+        from unmanic.libs.libraryindex import LibraryScanIndex
+        LibraryScanIndex.clear(1)
+
+    def scan(self, config_hash='hash', settled=True):
+        from unmanic.libs.libraryindex import LibraryScanIndex
+        from unmanic.libs.librarywalker import LibraryWalker
+        scan_index = LibraryScanIndex(1, config_hash)
+        # The test files were only just written. Keep them out of the racy window
+        scan_index.RACY_WINDOW_NS = -60 * 1000 * 1000 * 1000
+        scan_index.load()
+        tested = []
+        for path in LibraryWalker(self.library_path, scan_index=scan_index, max_workers=2):
+            tested.append(path)
+            scan_index.record_file_result(path, settled)
+        scan_index.finish(complete=True)
+        return tested, scan_index
+
+    @pytest.mark.unittest
+    def test_unchanged_library_is_not_tested_again(self):
+        tested, _ = self.scan()
+        assert len(tested) == 9
+        tested, scan_index = self.scan()
+        assert tested == []
+        assert scan_index.directories_unchanged_count == 4
+
+    @pytest.mark.unittest
+    def test_only_new_files_are_tested(self):
+        self.scan()
+        new_file = os.path.join(self.library_path, 'a', 'b', 'new.mkv')
+        with open(new_file, 'w') as f:
+            f.write('x')
+        tested, scan_index = self.scan()
+        assert tested == [new_file]
+        assert scan_index.files_unchanged_count == 3
+
+    @pytest.mark.unittest
+    def test_files_added_to_the_task_list_are_tested_again(self):
+        self.scan(settled=False)
+        tested, _ = self.scan()
+        assert len(tested) == 9
+
+    @pytest.mark.unittest
+    def test_config_change_discards_the_index(self):
+        self.scan()
+        tested, _ = self.scan(config_hash='changed')
+        assert len(tested) == 9
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_librarywalker.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import os
+import tempfile
+
+import pytest
+
+from unmanic.libs.librarywalker import LibraryWalker
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Test the LibraryWalker object
+
+    """
+
+    def setup_method(self):
+        self.library_path = tempfile.mkdtemp(prefix='unmanic_tests_library_')
+        for sub_dir in ['a', os.path.join('a', 'b'), os.path.join('a', 'b', 'c'), 'd']:
+            os.makedirs(os.path.join(self.library_path, sub_dir), exist_ok=True)
+            for i in range(5):
+                with open(os.path.join(self.library_path, sub_dir, 'file-{}.mkv'.format(i)), 'w') as f:
+                    f.write('x')
+        self.linked_path = tempfile.mkdtemp(prefix='unmanic_tests_linked_')
+        with open(os.path.join(self.linked_path, 'linked.mkv'), 'w') as f:
+            f.write('x')
+        os.symlink(self.linked_path, os.path.join(self.library_path, 'd', 'link'))
+
+    def os_walk_files(self, follow_symlinks):
+        files = []
+        for root, sub_folders, file_names in os.walk(self.library_path, followlinks=follow_symlinks):
+            files += [os.path.join(root, f) for f in file_names]
+        return sorted(files)
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize("follow_symlinks", [True, False])
+    def test_walk_matches_os_walk(self, follow_symlinks):
+        walker = LibraryWalker(self.library_path, follow_symlinks=follow_symlinks, max_workers=4)
+        assert sorted(walker) == self.os_walk_files(follow_symlinks)
+
+    @pytest.mark.unittest
+    def test_symlink_loops_are_not_descended(self):
+        os.symlink(self.library_path, os.path.join(self.library_path, 'a', 'b', 'loop'))
+        walker = LibraryWalker(self.library_path, follow_symlinks=True, max_workers=4)
+        files = list(walker)
+        assert len(files) == 21
+        assert walker.symlink_loops_count == 1
+
+    @pytest.mark.unittest
+    def test_ignored_directories_are_pruned(self):
+        with open(os.path.join(self.library_path, '.unmanicignore'), 'w') as f:
+            f.write("b/\n")
+        walker = LibraryWalker(self.library_path, follow_symlinks=False, max_workers=4)
+        files = [f for f in walker if not f.endswith('.unmanicignore')]
+        assert len(files) == 10
+        assert walker.directories_ignored_count == 1
+        # Only the library root, 'a' and 'd' are listed
+        assert walker.directories_listed_count == 3
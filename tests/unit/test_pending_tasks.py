@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_pending_tasks.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import os
+import tempfile
+
+import pytest
+
+from unmanic.libs.unmodels import Libraries, LibraryTags, Tags, Tasks, TaskStatusCounts
+from unmanic.libs.unmodels.taskstatuscounts import TASK_STATUS_COUNT_TRIGGERS
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Test the pending tasks list helpers
+
+    """
+
+    db_connection = None
+
+    def setup_class(self):
+        """
+        Setup the class state for pytest
+
+        :return:
+        """
+        config_path = tempfile.mkdtemp(prefix='unmanic_tests_')
+
+        # Create connection to a test DB.
+        # The DB writer runs in its own thread, so this needs to be a file rather than ':memory:'
+        database_settings = {
+            "TYPE": "SQLITE",
+            "FILE": os.path.join(config_path, 'unmanic.db'),
+        }
+        from unmanic.libs.unmodels.lib import Database
+        self.db_connection = Database.select_database(database_settings)
+        self.db_connection.create_tables([Libraries, LibraryTags, Tags, Tasks, TaskStatusCounts])
+        for statement in TASK_STATUS_COUNT_TRIGGERS:
+            self.db_connection.execute_sql(statement)
+        Libraries.insert(id=1, name='Movies', path='/movies').on_conflict_ignore().execute()
+        Libraries.insert(id=2, name='TV', path='/tv').on_conflict_ignore().execute()
+
+        from unmanic import config
+        self.settings = config.Config(config_path=config_path)
+
+    def setup_method(self):
+        Tasks.delete().execute()
+        # Tasks with a shared priority, to check that the ID breaks ties between pages
+        Tasks.insert_many([{
+            'abspath':    '/library/file-{}.mkv'.format(i),
+            'library_id': 1 if i % 2 else 2,
+            'priority':   i // 3,
+            'type':       'local',
+            'status':     'pending',
+        } for i in range(25)]).execute()
+
+    @pytest.mark.unittest
+    def test_status_counts_follow_task_changes(self):
+        from unmanic.libs.task import Task
+        assert Task.get_task_status_count() == 25
+        assert Task.get_task_status_count(status='pending', library_ids=[1]) == 12
+        Task.set_tasks_status([row.id for row in Tasks.select().where(Tasks.library_id == 1)], 'in_progress')
+        assert Task.get_task_status_count(status='pending') == 13
+        assert Task.get_task_status_count(status='in_progress') == 12
+        Tasks.delete().where(Tasks.library_id == 2).execute()
+        assert Task.get_task_status_count() == 12
+        assert Task.get_task_status_count(status='pending') == 0
+
+    @pytest.mark.unittest
+    def test_pages_are_fetched_by_cursor(self):
+        from unmanic.webserver.helpers.pending_tasks import prepare_filtered_pending_tasks
+        expected = [row.id for row in Tasks.select().order_by(Tasks.priority.desc(), Tasks.id.desc())]
+        seen = []
+        params = {'start': 0, 'length': 10, 'order': {'column': 'priority', 'dir': 'desc'}}
+        while True:
+            task_list = prepare_filtered_pending_tasks(params, include_library=True)
+            assert task_list['recordsTotal'] == 25
+            assert task_list['recordsFiltered'] == 25
+            seen += [result['id'] for result in task_list['results']]
+            if not task_list['next_cursor']:
+                break
+            params['cursor'] = task_list['next_cursor']
+        assert seen == expected
+        assert task_list['results'][0]['library_name'] in ['Movies', 'TV']
+
+    @pytest.mark.unittest
+    def test_filtered_counts(self):
+        from unmanic.webserver.helpers.pending_tasks import prepare_filtered_pending_tasks
+        params = {'start': 0, 'length': 10, 'library_ids': [1], 'order': {'column': 'priority', 'dir': 'desc'}}
+        assert prepare_filtered_pending_tasks(params)['recordsFiltered'] == 12
+        params = {'start': 0, 'length': 10, 'search_value': 'file-2', 'order': {'column': 'priority', 'dir': 'desc'}}
+        task_list = prepare_filtered_pending_tasks(params)
+        # Matches file-2 and file-20 to file-24
+        assert task_list['recordsFiltered'] == 6
+        assert task_list['next_cursor'] is None
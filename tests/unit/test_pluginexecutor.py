@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_pluginexecutor.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import os
+import tempfile
+
+import pytest
+
+from unmanic.libs.task import TaskDataStore
+from unmanic.libs.unplugins import PluginExecutor
+
+PLUGIN_SOURCE = '''
+def on_library_management_file_test(data, task_data_store=None):
+    data['runner_version'] = {version}
+    data['task_data_store'] = task_data_store
+'''
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Test calling plugin runners through the PluginExecutor
+
+    """
+
+    def setup_class(self):
+        """
+        Setup the class state for pytest
+
+        :return:
+        """
+        self.plugins_directory = tempfile.mkdtemp(prefix='unmanic_tests_')
+        self.plugin_id = 'test_executor_runner'
+        self.plugin_path = os.path.join(self.plugins_directory, self.plugin_id)
+        os.makedirs(self.plugin_path)
+        with open(os.path.join(self.plugin_path, '__init__.py'), 'w'):
+            pass
+        self.write_plugin(self, 1)
+
+    def teardown_class(self):
+        PluginExecutor.unload_plugin_module(self.plugin_id)
+
+    def write_plugin(self, version):
+        with open(os.path.join(self.plugin_path, 'plugin.py'), 'w') as f:
+            f.write(PLUGIN_SOURCE.format(version=version))
+
+    @pytest.mark.unittest
+    def test_runner_adapter_passes_the_helpers_the_runner_accepts(self):
+        calls = []
+
+        def keyword_runner(data, task_data_store=None, file_metadata=None):
+            calls.append((task_data_store, file_metadata))
+
+        def legacy_runner(data, task_data_store):
+            calls.append((task_data_store,))
+
+        def data_only_runner(data):
+            calls.append(())
+
+        for runner, expected_legacy in ((keyword_runner, False), (legacy_runner, True), (data_only_runner, True)):
+            call_runner, uses_legacy_args = PluginExecutor.build_runner_adapter(runner)
+            call_runner({})
+            assert uses_legacy_args == expected_legacy
+
+        from unmanic.libs.metadata import UnmanicFileMetadata
+        assert calls == [(TaskDataStore, UnmanicFileMetadata), (TaskDataStore,), ()]
+
+    @pytest.mark.unittest
+    def test_reloaded_runner_is_called(self):
+        plugin_executor = PluginExecutor(plugins_directory=self.plugins_directory)
+        data = {'task_id': None}
+        assert plugin_executor.execute_plugin_runner(data, self.plugin_id, 'library_management.file_test')
+        assert data['runner_version'] == 1
+        assert data['task_data_store'] is TaskDataStore
+
+        # The call adapter is rebuilt for the new runner function after the module is reloaded
+        # Write a different file size so the cached bytecode is not reused
+        self.write_plugin(22)
+        plugin_executor.reload_plugin_module(self.plugin_id)
+        assert plugin_executor.execute_plugin_runner(data, self.plugin_id, 'library_management.file_test')
+        assert data['runner_version'] == 22
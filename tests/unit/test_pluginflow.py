@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_pluginflow.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import os
+import tempfile
+
+import pytest
+
+from unmanic.libs.configversion import ConfigVersion
+from unmanic.libs.unmodels import EnabledPlugins, Libraries, LibraryPluginFlow, Plugins
+
+PLUGIN_SOURCE = '''
+def on_worker_process(data):
+    return data
+'''
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Test the compiled plugin flow snapshots
+
+    """
+
+    db_connection = None
+
+    def setup_class(self):
+        """
+        Setup the class state for pytest
+
+        :return:
+        """
+        self.home_directory = tempfile.mkdtemp(prefix='unmanic_tests_')
+
+        # Create connection to a test DB.
+        database_settings = {
+            "TYPE": "SQLITE",
+            "FILE": os.path.join(self.home_directory, 'unmanic.db'),
+        }
+        from unmanic.libs.unmodels.lib import Database
+        self.db_connection = Database.select_database(database_settings)
+        self.db_connection.create_tables([EnabledPlugins, Libraries, LibraryPluginFlow, Plugins])
+        Libraries.insert(id=1, name='Local library', path='/local').on_conflict_ignore().execute()
+
+        for plugin_id in ['test_flow_first', 'test_flow_second']:
+            plugin_path = os.path.join(self.home_directory, '.unmanic', 'plugins', plugin_id)
+            os.makedirs(plugin_path)
+            with open(os.path.join(plugin_path, '__init__.py'), 'w'):
+                pass
+            with open(os.path.join(plugin_path, 'plugin.py'), 'w') as f:
+                f.write(PLUGIN_SOURCE)
+            plugin = Plugins.create(plugin_id=plugin_id, name=plugin_id, author='', version='1.0.0', tags='',
+                                    description='', icon='', local_path=plugin_path)
+            EnabledPlugins.create(library_id=1, plugin_id=plugin, plugin_name=plugin_id)
+
+        from unmanic import config
+        config.Config(config_path=self.home_directory)
+
+    def setup_method(self):
+        self.monkeypatch = pytest.MonkeyPatch()
+        self.monkeypatch.setenv('HOME_DIR', self.home_directory)
+        LibraryPluginFlow.delete().execute()
+        ConfigVersion().bump('test')
+
+    def teardown_method(self):
+        self.monkeypatch.undo()
+
+    def set_flow(self, plugin_ids):
+        for position, plugin_id in enumerate(plugin_ids):
+            plugin = Plugins.get(plugin_id=plugin_id)
+            LibraryPluginFlow.create(plugin_id=plugin, library_id=1, plugin_name=plugin_id,
+                                     plugin_type='worker.process', position=position)
+
+    @pytest.mark.unittest
+    def test_plugin_flow_is_only_compiled_after_a_change(self):
+        from unmanic.libs.plugins import PluginsHandler
+        from unmanic.libs.session import Session
+        self.set_flow(['test_flow_second', 'test_flow_first'])
+
+        def fail(*args, **kwargs):
+            raise AssertionError("The plugin flow hot path must not refresh the session")
+
+        self.monkeypatch.setattr(Session, 'register_unmanic', fail)
+        plugin_handler = PluginsHandler()
+        plugin_modules = plugin_handler.get_enabled_plugin_modules_by_type('worker.process', library_id=1)
+        assert [p.get('plugin_id') for p in plugin_modules] == ['test_flow_second', 'test_flow_first']
+        assert plugin_modules[0].get('runner') is plugin_modules[0].get('plugin_module').on_worker_process
+
+        # Without a configuration change the DB is not read again
+        compiled = []
+        compile_plugin_flow = PluginsHandler.compile_plugin_flow
+
+        def counting_compile_plugin_flow(handler, *args):
+            compiled.append(args)
+            return compile_plugin_flow(handler, *args)
+
+        self.monkeypatch.setattr(PluginsHandler, 'compile_plugin_flow', counting_compile_plugin_flow)
+        LibraryPluginFlow.delete().execute()
+        self.set_flow(['test_flow_first', 'test_flow_second'])
+        plugin_modules = plugin_handler.get_enabled_plugin_modules_by_type('worker.process', library_id=1)
+        assert [p.get('plugin_id') for p in plugin_modules] == ['test_flow_second', 'test_flow_first']
+        assert compiled == []
+
+        # Returned plugin data can be modified without changing the snapshot
+        plugin_modules[0]['plugin_id'] = 'modified'
+        plugin_modules = plugin_handler.get_enabled_plugin_modules_by_type('worker.process', library_id=1)
+        assert plugin_modules[0].get('plugin_id') == 'test_flow_second'
+
+        ConfigVersion().bump('test')
+        plugin_modules = plugin_handler.get_enabled_plugin_modules_by_type('worker.process', library_id=1)
+        assert [p.get('plugin_id') for p in plugin_modules] == ['test_flow_first', 'test_flow_second']
+        assert len(compiled) == 1
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_pluginsettings.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import json
+import multiprocessing
+import os
+import tempfile
+
+import pytest
+
+from unmanic.libs.unplugins.settings import PluginSettings
+
+
+class Settings(PluginSettings):
+    settings = {
+        'name':  'default',
+        'items': ['a', 'b'],
+    }
+
+
+def write_setting_in_child(key, value):
+    Settings(library_id=1).set_setting(key, value)
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Test the plugin settings cache
+
+    """
+
+    def setup_method(self):
+        self.userdata_path = tempfile.mkdtemp(prefix='unmanic_tests_')
+        self.monkeypatch = pytest.MonkeyPatch()
+        from unmanic import config
+        self.monkeypatch.setattr(config.Config, 'get_userdata_path', lambda _self: self.userdata_path)
+        self.profile_directory = Settings().get_profile_directory()
+
+    def teardown_method(self):
+        self.monkeypatch.undo()
+
+    @pytest.mark.unittest
+    def test_changes_to_the_settings_file_are_read(self):
+        settings = Settings(library_id=1)
+        assert settings.get_setting('name') == 'default'
+        assert settings.set_setting('name', 'configured')
+        assert Settings(library_id=1).get_setting('name') == 'configured'
+
+        # Write the file outside the settings API
+        with open(os.path.join(self.profile_directory, 'settings.1.json'), 'w') as f:
+            json.dump({'name': 'changed on disk'}, f)
+        assert settings.get_setting('name') == 'changed on disk'
+
+        # Write the file from a child process
+        child = multiprocessing.Process(target=write_setting_in_child, args=('name', 'changed in child'))
+        child.start()
+        child.join(10)
+        assert child.exitcode == 0
+        assert settings.get_setting('name') == 'changed in child'
+        # The library settings file does not replace the default settings file
+        assert Settings().get_setting('name') == 'default'
+
+    @pytest.mark.unittest
+    def test_returned_settings_are_not_shared(self):
+        first = Settings(library_id=1).get_setting()
+        first['items'].append('c')
+        first['name'] = 'modified'
+        second = Settings(library_id=1).get_setting()
+        assert second == {'name': 'default', 'items': ['a', 'b']}
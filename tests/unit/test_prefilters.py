@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_prefilters.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import pytest
+
+from unmanic.libs.prefilters import FilePrefilter, LibraryPrefilters
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Test the library and plugin file prefilters
+
+    """
+
+    @staticmethod
+    def size_of(size):
+        return lambda: size
+
+    @pytest.mark.unittest
+    def test_library_prefilter_rules(self):
+        prefilters = LibraryPrefilters(FilePrefilter('library', {
+            'extensions':    ['.MKV', 'mp4'],
+            'min_size':      100,
+            'max_size':      1000,
+            'exclude_paths': ['*/Extras/*'],
+        }), [])
+        assert prefilters.check('/library/Movie.mkv', self.size_of(500)) is None
+        assert prefilters.check('/library/Movie.MP4', self.size_of(500)) is None
+        assert prefilters.check('/library/Movie.nfo', self.size_of(500)) == 'library.extensions'
+        assert prefilters.check('/library/Movie.mkv', self.size_of(10)) == 'library.min_size'
+        assert prefilters.check('/library/Movie.mkv', self.size_of(10000)) == 'library.max_size'
+        assert prefilters.check('/library/Extras/Movie.mkv', self.size_of(500)) == 'library.exclude_paths'
+        assert prefilters.rejected_counts == {
+            'library.extensions':    1,
+            'library.min_size':      1,
+            'library.max_size':      1,
+            'library.exclude_paths': 1,
+        }
+
+    @pytest.mark.unittest
+    def test_size_is_only_read_when_required(self):
+        def get_size():
+            raise AssertionError("Size should not be read")
+
+        prefilters = LibraryPrefilters(FilePrefilter('library', {'exclude_extensions': ['srt']}), [])
+        assert prefilters.check('/library/Movie.srt', get_size) == 'library.exclude_extensions'
+        assert prefilters.check('/library/Movie.mkv', get_size) is None
+
+    @pytest.mark.unittest
+    def test_plugin_prefilters_reject_files_no_plugin_accepts(self):
+        prefilters = LibraryPrefilters(FilePrefilter('library'), [
+            FilePrefilter('video_plugin', {'extensions': ['mkv']}),
+            FilePrefilter('audio_plugin', {'extensions': ['flac']}),
+        ])
+        assert prefilters.check('/library/Movie.mkv', self.size_of(1)) is None
+        assert prefilters.check('/library/Album.flac', self.size_of(1)) is None
+        assert prefilters.check('/library/Movie.jpg', self.size_of(1)) == 'plugins'
+
+    @pytest.mark.unittest
+    def test_plugins_without_prefilters_accept_all_files(self):
+        prefilters = LibraryPrefilters(FilePrefilter('library'), [
+            FilePrefilter('video_plugin', {'extensions': ['mkv']}),
+            FilePrefilter('other_plugin'),
+        ])
+        assert prefilters.is_empty()
+        assert prefilters.check('/library/Movie.jpg', self.size_of(1)) is None
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_searchindexes.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import os
+import tempfile
+
+import pytest
+
+from unmanic.libs.unmodels import CompletedTasks
+from unmanic.libs.unmodels.searchindexes import SEARCHABLE_COLUMNS, create_search_index_statements
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Test searching with the path search indexes
+
+    """
+
+    db_connection = None
+
+    def setup_class(self):
+        """
+        Setup the class state for pytest
+
+        :return:
+        """
+        config_path = tempfile.mkdtemp(prefix='unmanic_tests_')
+
+        # Create connection to a test DB.
+        # The DB writer runs in its own thread, so this needs to be a file rather than ':memory:'
+        database_settings = {
+            "TYPE": "SQLITE",
+            "FILE": os.path.join(config_path, 'unmanic.db'),
+        }
+        from unmanic.libs.unmodels.lib import Database
+        self.db_connection = Database.select_database(database_settings)
+        self.db_connection.create_tables([CompletedTasks])
+        for table_name, column_name in SEARCHABLE_COLUMNS:
+            if table_name == 'completedtasks':
+                for statement in create_search_index_statements(table_name, column_name):
+                    self.db_connection.execute_sql(statement)
+
+        from unmanic import config
+        self.settings = config.Config(config_path=config_path)
+
+    def setup_method(self):
+        CompletedTasks.delete().execute()
+        labels = ['The Big Movie (2020).mkv', 'the big movie extras.mkv', 'Another Film.mp4', 'Über Show S01E01.mkv']
+        for label in labels:
+            CompletedTasks.create(task_label=label, abspath='/library/' + label, task_success=True,
+                                  processed_by_worker='worker-1')
+
+    @staticmethod
+    def search(search_value):
+        from unmanic.libs.history import History
+        results = History().get_historic_task_list_filtered_and_sorted(search_value=search_value)
+        return sorted(row['task_label'] for row in results)
+
+    @pytest.mark.unittest
+    def test_search_matches_substrings_case_insensitively(self):
+        from unmanic.libs.unmodels.searchindexes import search_index_available
+        assert search_index_available('completedtasks')
+        assert self.search('BIG MOVIE') == ['The Big Movie (2020).mkv', 'the big movie extras.mkv']
+        assert self.search('(2020)') == ['The Big Movie (2020).mkv']
+        assert self.search('"quoted"') == []
+        # Short search values fall back to LIKE
+        assert self.search('mp') == ['Another Film.mp4']
+
+    @pytest.mark.unittest
+    def test_index_follows_updates_and_deletes(self):
+        CompletedTasks.update(task_label='Renamed Film.mkv').where(CompletedTasks.task_label == 'Another Film.mp4').execute()
+        assert self.search('another') == []
+        assert self.search('renamed') == ['Renamed Film.mkv']
+        CompletedTasks.delete().where(CompletedTasks.task_label == 'Renamed Film.mkv').execute()
+        assert self.search('film') == []
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_taskdatastore.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import pytest
+
+from unmanic.libs.task import TaskDataStore
+from unmanic.libs.unplugins.child_process import PluginChildProcess
+
+
+def update_task_data(task_id, log_queue=None, prog_queue=None):
+    TaskDataStore.bind_runner_context(task_id, 'test_plugin', 'on_worker_process')
+    TaskDataStore.set_runner_value('probe', {'streams': 2})
+    # Runner values are write-once, so the parent keeps its own value for this key
+    TaskDataStore.set_runner_value('existing', 'from child')
+    TaskDataStore.set_task_state('status', 'done')
+    TaskDataStore.delete_task_state('remove_me')
+    TaskDataStore.clear_context()
+    prog_queue.put(100)
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Test the process-local TaskDataStore
+
+    """
+
+    def setup_method(self):
+        TaskDataStore.clear_tasks()
+        self.data = {
+            'worker_log':              [],
+            'command_progress_parser': None,
+            'current_command':         [],
+        }
+
+    def teardown_method(self):
+        TaskDataStore.clear_tasks()
+
+    @pytest.mark.unittest
+    def test_bulk_export_and_clear(self):
+        for task_id in (1, 2, 3):
+            TaskDataStore.set_task_state('value', task_id * 10, task_id=task_id)
+        assert TaskDataStore.export_task_states([1, 3, 4]) == {1: {'value': 10}, 3: {'value': 30}}
+        exported = TaskDataStore.export_task_states()
+        assert exported == {1: {'value': 10}, 2: {'value': 20}, 3: {'value': 30}}
+        # Exports are copies
+        exported[1]['value'] = 0
+        assert TaskDataStore.get_task_state('value', task_id=1) == 10
+
+        TaskDataStore.clear_tasks([1, 2])
+        assert TaskDataStore.export_task_states() == {3: {'value': 30}}
+        TaskDataStore.clear_tasks()
+        assert TaskDataStore.export_task_states() == {}
+
+    @pytest.mark.unittest
+    def test_changes_made_in_a_child_process_are_applied_in_the_parent(self):
+        task_id = 42
+        TaskDataStore.bind_runner_context(task_id, 'test_plugin', 'on_worker_process')
+        TaskDataStore.set_runner_value('existing', 'from parent')
+        TaskDataStore.clear_context()
+        TaskDataStore.import_task_state(task_id, {'remove_me': True, 'keep_me': True})
+
+        assert PluginChildProcess('test_plugin', self.data).run(update_task_data, task_id)
+
+        TaskDataStore.bind_runner_context(task_id, 'test_plugin', 'on_worker_process')
+        try:
+            assert TaskDataStore.get_runner_value('probe') == {'streams': 2}
+            assert TaskDataStore.get_runner_value('existing') == 'from parent'
+        finally:
+            TaskDataStore.clear_context()
+        assert TaskDataStore.export_task_state(task_id) == {'status': 'done', 'keep_me': True}
+        # The parent does not record changes of its own
+        assert TaskDataStore.pop_journal() == []
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_taskhandler.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import os
+import queue
+import sqlite3
+import tempfile
+import threading
+
+import pytest
+
+from unmanic.libs.unmodels import FileTestDecisions, Libraries, Tasks, TaskStatusCounts
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Test the TaskHandler bulk task creation
+
+    """
+
+    db_connection = None
+
+    def setup_class(self):
+        """
+        Setup the class state for pytest
+
+        :return:
+        """
+        config_path = tempfile.mkdtemp(prefix='unmanic_tests_')
+
+        # Create connection to a test DB.
+        # The DB writer runs in its own thread, so this needs to be a file rather than ':memory:'
+        database_settings = {
+            "TYPE": "SQLITE",
+            "FILE": os.path.join(config_path, 'unmanic.db'),
+        }
+        from unmanic.libs.unmodels.lib import Database
+        self.db_connection = Database.select_database(database_settings)
+        self.db_connection.create_tables([Libraries, Tasks, TaskStatusCounts, FileTestDecisions])
+        Libraries.insert(id=1, name='Test library', path='/library', priority_score=1000).on_conflict_ignore().execute()
+
+        from unmanic import config
+        self.settings = config.Config(config_path=config_path)
+
+    def setup_method(self):
+        Tasks.delete().execute()
+        # Record the events.task_queued runners rather than loading installed plugins
+        self.queued_events = []
+        from unmanic.libs.plugins import PluginsHandler
+        self.plugin_handler_patch = pytest.MonkeyPatch()
+        self.plugin_handler_patch.setattr(PluginsHandler, 'get_enabled_plugin_modules_by_type',
+                                          lambda handler, plugin_type, library_id=None: [{'plugin_id': 'test_plugin'}])
+        self.plugin_handler_patch.setattr(PluginsHandler, 'exec_plugin_runner',
+                                          lambda handler, data, plugin_id, plugin_type: self.queued_events.append(data))
+        from unmanic.libs.taskhandler import TaskHandler
+        data_queues = {
+            "inotifytasks":   queue.Queue(),
+            "scheduledtasks": queue.Queue(),
+        }
+        self.task_handler = TaskHandler(data_queues, None, threading.Event())
+
+    def teardown_method(self):
+        self.plugin_handler_patch.undo()
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize('returning', [True, False])
+    def test_paths_are_created_as_pending_tasks_once(self, monkeypatch, returning):
+        if not returning:
+            # Create tasks as on a SQLite library older than 3.35, which does not support RETURNING
+            monkeypatch.setattr(sqlite3, 'sqlite_version_info', (3, 31, 1))
+        items = [{'pathname': '/library/file-{}.mkv'.format(i), 'library_id': 1} for i in range(250)]
+        # Duplicate paths within the batch are only added once
+        items.append({'pathname': '/library/file-0.mkv', 'library_id': 1})
+        added_paths = self.task_handler.add_paths_to_task_queue(items)
+        assert len(added_paths) == 250
+        assert Tasks.select().where(Tasks.status == 'pending').count() == 250
+        # Each task has its own cache path and the priority includes the task ID and library priority score
+        cache_paths = set()
+        for row in Tasks.select():
+            cache_paths.add(row.cache_path)
+            assert row.priority == row.id + 1000
+            assert row.type == 'local'
+        assert len(cache_paths) == 250
+        # The task queued event is run once for each new task
+        assert len(self.queued_events) == 250
+        assert self.queued_events[0]['source_data']['basename'].startswith('file-')
+
+        # Paths that already have a task are skipped
+        added_paths = self.task_handler.add_paths_to_task_queue(items[:10] + [
+            {'pathname': '/library/new.mkv', 'library_id': 1, 'priority_score': 5},
+        ])
+        assert added_paths == {'/library/new.mkv'}
+        new_task = Tasks.get(abspath='/library/new.mkv')
+        assert new_task.priority == new_task.id + 1005
+
+    @pytest.mark.unittest
+    def test_paths_for_a_deleted_library_do_not_drop_the_batch(self):
+        items = [
+            {'pathname': '/library/file-0.mkv', 'library_id': 1},
+            {'pathname': '/deleted/file-1.mkv', 'library_id': 99},
+            {'pathname': '/library/file-2.mkv', 'library_id': 1},
+        ]
+        added_paths = self.task_handler.add_paths_to_task_queue(items)
+        assert added_paths == {'/library/file-0.mkv', '/library/file-2.mkv'}
+        assert Tasks.select().where(Tasks.library_id == 99).count() == 0
+
+    @pytest.mark.unittest
+    def test_scheduled_tasks_queue_is_drained_in_chunks(self):
+        self.task_handler.task_insert_chunk_size = 7
+        for i in range(20):
+            self.task_handler.scheduledtasks.put({'pathname': '/library/file-{}.mkv'.format(i), 'library_id': 1})
+        self.task_handler.process_scheduledtasks_queue()
+        assert self.task_handler.scheduledtasks.empty()
+        assert Tasks.select().where(Tasks.status == 'pending').count() == 20
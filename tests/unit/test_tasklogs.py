@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_tasklogs.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import os
+import tempfile
+
+import pytest
+
+from unmanic.libs.unmodels import CompletedTasks, CompletedTasksCommandLogs
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Test the TaskLogStore object
+
+    """
+
+    db_connection = None
+
+    def setup_class(self):
+        """
+        Setup the class state for pytest
+
+        :return:
+        """
+        config_path = tempfile.mkdtemp(prefix='unmanic_tests_')
+
+        # Create connection to a test DB.
+        # The DB writer runs in its own thread, so this needs to be a file rather than ':memory:'
+        database_settings = {
+            "TYPE": "SQLITE",
+            "FILE": os.path.join(config_path, 'unmanic.db'),
+        }
+        from unmanic.libs.unmodels.lib import Database
+        self.db_connection = Database.select_database(database_settings)
+        self.db_connection.create_tables([CompletedTasks, CompletedTasksCommandLogs])
+
+        from unmanic import config
+        self.settings = config.Config(config_path=config_path)
+
+    def setup_method(self):
+        from unmanic.libs.tasklogs import TaskLogStore
+        TaskLogStore.clear_task(1)
+
+    @pytest.mark.unittest
+    def test_log_lines_are_appended(self):
+        from unmanic.libs.tasklogs import TaskLogStore
+        assert TaskLogStore.read(1) == ''
+        assert TaskLogStore.tail(1) == []
+        TaskLogStore.append(1, ['\nRUNNER: ', 'Test runner'])
+        TaskLogStore.append(1, ['\nCOMMAND:', '\nffmpeg -i file.mkv'])
+        assert TaskLogStore.read(1) == '\nRUNNER: Test runner\nCOMMAND:\nffmpeg -i file.mkv'
+        assert TaskLogStore.tail(1, line_count=2) == ['COMMAND:', 'ffmpeg -i file.mkv']
+        TaskLogStore.clear_task(1)
+        assert not os.path.exists(TaskLogStore.get_log_path(1))
+
+    @pytest.mark.unittest
+    def test_log_is_streamed_into_history(self):
+        from unmanic.libs.history import History
+        from unmanic.libs.tasklogs import TaskLogStore
+        log_lines = ['\nline {}'.format(i) for i in range(1000)]
+        TaskLogStore.append(1, log_lines)
+        chunks = list(TaskLogStore.iter_chunks(1, chunk_size=1024))
+        assert len(chunks) > 1
+        assert History().save_task_history({
+            'task_label':          'file.mkv',
+            'abspath':             '/library/file.mkv',
+            'task_success':        True,
+            'start_time':          1700000000,
+            'finish_time':         1700000001,
+            'processed_by_worker': 'worker-1',
+            'log_chunks':          iter(chunks),
+        })
+        command_log = CompletedTasksCommandLogs.select().order_by(CompletedTasksCommandLogs.id.desc()).get()
+        assert command_log.dump == ''.join(log_lines)
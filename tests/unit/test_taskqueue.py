@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_taskqueue.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import os
+import sqlite3
+import tempfile
+import threading
+
+import pytest
+
+from unmanic.libs.unmodels import Libraries, LibraryTags, Tags, Tasks
+from unmanic.libs.unmodels.taskstatuscounts import TASK_STATUS_COUNT_TRIGGERS, TaskStatusCounts
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Test claiming tasks from the TaskQueue
+
+    """
+
+    db_connection = None
+
+    def setup_class(self):
+        """
+        Setup the class state for pytest
+
+        :return:
+        """
+        config_path = tempfile.mkdtemp(prefix='unmanic_tests_')
+
+        # Create connection to a test DB.
+        # The DB writer runs in its own thread, so this needs to be a file rather than ':memory:'
+        database_settings = {
+            "TYPE": "SQLITE",
+            "FILE": os.path.join(config_path, 'unmanic.db'),
+        }
+        from unmanic.libs.unmodels.lib import Database
+        self.db_connection = Database.select_database(database_settings)
+        self.db_connection.create_tables([Libraries, LibraryTags, Tags, Tasks, TaskStatusCounts])
+        for statement in TASK_STATUS_COUNT_TRIGGERS:
+            self.db_connection.execute_sql(statement).fetchall()
+        Libraries.insert(id=1, name='Local library', path='/local').on_conflict_ignore().execute()
+        Libraries.insert(id=2, name='Remote library', path='/remote').on_conflict_ignore().execute()
+
+    def setup_method(self):
+        Tasks.delete().execute()
+        from unmanic.libs.task import TaskStatusCounters
+        from unmanic.libs.taskqueue import TaskQueue
+        TaskStatusCounters().reset()
+        self.task_queue = TaskQueue({})
+
+    @staticmethod
+    def disable_returning(monkeypatch):
+        # Claim tasks as on a SQLite library older than 3.35, which does not support RETURNING
+        monkeypatch.setattr(sqlite3, 'sqlite_version_info', (3, 31, 1))
+
+    @staticmethod
+    def create_pending_tasks(count, library_id=1, task_type='local'):
+        Tasks.insert_many([{
+            'abspath':    '/library/{}/file-{}.mkv'.format(library_id, i),
+            'library_id': library_id,
+            'priority':   i,
+            'type':       task_type,
+            'status':     'pending',
+        } for i in range(count)]).execute()
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize('returning', [True, False])
+    def test_next_pending_task_is_claimed_in_priority_order(self, monkeypatch, returning):
+        if not returning:
+            self.disable_returning(monkeypatch)
+        self.create_pending_tasks(3)
+        next_task = self.task_queue.get_next_pending_tasks()
+        assert next_task.get_source_abspath() == '/library/1/file-2.mkv'
+        assert next_task.task.status == 'in_progress'
+        assert Tasks.get(abspath='/library/1/file-2.mkv').status == 'in_progress'
+        assert self.task_queue.get_next_pending_tasks().get_source_abspath() == '/library/1/file-1.mkv'
+
+    @pytest.mark.unittest
+    def test_claim_is_filtered_by_library_and_type(self):
+        self.create_pending_tasks(2, library_id=2, task_type='remote')
+        assert not self.task_queue.get_next_pending_tasks(local_only=True)
+        assert not self.task_queue.get_next_pending_tasks(library_names=['Local library'])
+        next_task = self.task_queue.get_next_pending_tasks(library_names=['Remote library'])
+        assert next_task.get_task_library_id() == 2
+
+    @pytest.mark.unittest
+    @pytest.mark.parametrize('returning', [True, False])
+    def test_concurrent_claims_never_return_the_same_task(self, monkeypatch, returning):
+        if not returning:
+            self.disable_returning(monkeypatch)
+        task_count = 200
+        self.create_pending_tasks(task_count)
+        claimed = []
+        lock = threading.Lock()
+
+        def claim_tasks():
+            while True:
+                next_task = self.task_queue.get_next_pending_tasks()
+                if not next_task:
+                    return
+                with lock:
+                    claimed.append(next_task.get_task_id())
+
+        threads = [threading.Thread(target=claim_tasks) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(claimed) == task_count
+        assert len(set(claimed)) == task_count
+        assert Tasks.select().where(Tasks.status == 'pending').count() == 0
+
+    @pytest.mark.unittest
+    def test_task_list_counters_follow_status_transitions(self):
+        from unmanic.libs.task import TaskStatusCounters
+        self.create_pending_tasks(3)
+        self.create_pending_tasks(2, library_id=2, task_type='remote')
+        counters = TaskStatusCounters()
+        assert counters.count(status='pending') == 5
+        assert counters.count(status='pending', library_ids=[2]) == 2
+        assert self.task_queue.task_list_processed_is_empty()
+
+        next_task = self.task_queue.get_next_pending_tasks(local_only=True)
+        assert counters.count(status='pending', library_ids=[1]) == 2
+        assert not self.task_queue.task_list_in_progress_is_empty()
+
+        self.task_queue.mark_item_as_processed(next_task)
+        assert self.task_queue.task_list_in_progress_is_empty()
+        assert self.task_queue.task_list_processed_count() == 1
+
+        next_task.delete()
+        assert self.task_queue.task_list_processed_is_empty()
+        # The in-memory counters match the trigger maintained counts in the database
+        for row in TaskStatusCounts.select():
+            assert counters.count(status=row.status, library_ids=[row.library_id]) == row.count
+
+    @pytest.mark.unittest
+    def test_waiting_for_processed_tasks_wakes_on_transition(self):
+        self.create_pending_tasks(1)
+        next_task = self.task_queue.get_next_pending_tasks()
+        assert not self.task_queue.wait_for_processed_tasks(timeout=0.01)
+
+        woken = []
+
+        def wait_for_processed():
+            woken.append(self.task_queue.wait_for_processed_tasks(timeout=10))
+
+        waiter = threading.Thread(target=wait_for_processed)
+        waiter.start()
+        self.task_queue.mark_item_as_processed(next_task)
+        waiter.join(timeout=5)
+        assert woken == [True]
+
+    @pytest.mark.unittest
+    def test_transition_after_a_reload_does_not_count_the_write_twice(self):
+        from unmanic.libs.task import TaskStatusCounters
+        self.create_pending_tasks(2)
+        counters = TaskStatusCounters()
+        assert counters.count(status='pending') == 2
+
+        generation = counters.get_generation()
+        query = Tasks.update(status='in_progress')
+        query = query.where(Tasks.id == Tasks.select(Tasks.id).order_by(Tasks.id).limit(1))
+        query.execute()
+        # Another thread reloads the counts after the write but before its transition
+        counters.reload()
+        counters.transition(1, 'pending', 'in_progress', generation=generation)
+        assert counters.count(status='pending') == 1
+        assert counters.count(status='in_progress') == 1
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_unmanicignore.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import os
+import tempfile
+
+import pytest
+
+from unmanic.libs.unmanicignore import UnmanicIgnoreFiles
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Test the '.unmanicignore' rules
+
+    """
+
+    def setup_method(self):
+        self.library_path = tempfile.mkdtemp(prefix='unmanic_tests_library_')
+        os.makedirs(os.path.join(self.library_path, 'Show', 'Season 1', 'Extras'))
+        self.ignore_files = UnmanicIgnoreFiles()
+        self.ignore_files.clear()
+
+    def teardown_method(self):
+        self.ignore_files.VALIDATE_INTERVAL = UnmanicIgnoreFiles.VALIDATE_INTERVAL
+
+    def write_ignore_file(self, directory, lines):
+        with open(os.path.join(self.library_path, directory, '.unmanicignore'), 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+
+    def is_ignored(self, relative_path, is_dir=False):
+        path = os.path.join(self.library_path, relative_path)
+        return self.ignore_files.is_ignored(path, self.library_path, is_dir=is_dir)
+
+    @pytest.mark.unittest
+    def test_gitignore_style_patterns(self):
+        self.write_ignore_file('', [
+            '# Comments are skipped',
+            'Extras/',
+            '*.srt',
+            '!keep.srt',
+            '/Show/Season 1/episode-2.mkv',
+        ])
+        assert self.is_ignored(os.path.join('Show', 'Season 1', 'Extras'), is_dir=True)
+        assert self.is_ignored(os.path.join('Show', 'Season 1', 'Extras', 'episode-1.mkv'))
+        assert self.is_ignored(os.path.join('Show', 'Season 1', 'episode-1.srt'))
+        assert not self.is_ignored(os.path.join('Show', 'Season 1', 'keep.srt'))
+        assert self.is_ignored(os.path.join('Show', 'Season 1', 'episode-2.mkv'))
+        assert not self.is_ignored(os.path.join('Show', 'Season 1', 'episode-1.mkv'))
+        assert not self.is_ignored(os.path.join('Show', 'Extras.mkv'))
+
+    @pytest.mark.unittest
+    def test_file_names_are_matched_in_the_same_directory(self):
+        self.write_ignore_file(os.path.join('Show', 'Season 1'), ['Movie [1080p].mkv'])
+        assert self.is_ignored(os.path.join('Show', 'Season 1', 'Movie [1080p].mkv'))
+        assert not self.is_ignored(os.path.join('Show', 'Movie [1080p].mkv'))
+
+    @pytest.mark.unittest
+    def test_rules_are_reloaded_when_the_ignore_file_changes(self):
+        self.ignore_files.VALIDATE_INTERVAL = 0
+        self.write_ignore_file('', ['*.mkv'])
+        assert self.is_ignored('episode-1.mkv')
+        self.write_ignore_file('', ['*.avi'])
+        ignore_file = os.path.join(self.library_path, '.unmanicignore')
+        os.utime(ignore_file, ns=(os.stat(ignore_file).st_atime_ns, os.stat(ignore_file).st_mtime_ns + 1000000000))
+        assert not self.is_ignored('episode-1.mkv')
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.test_workers.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import os
+import queue
+import tempfile
+import threading
+import time
+
+import pytest
+
+from unmanic.libs.unmodels import Libraries, Tasks, TaskStatusCounts
+
+
+class TestClass(object):
+    """
+    TestClass
+
+    Test handing tasks to a Worker
+
+    """
+
+    db_connection = None
+
+    def setup_class(self):
+        """
+        Setup the class state for pytest
+
+        :return:
+        """
+        config_path = tempfile.mkdtemp(prefix='unmanic_tests_')
+
+        # Create connection to a test DB.
+        # The DB writer runs in its own thread, so this needs to be a file rather than ':memory:'
+        database_settings = {
+            "TYPE": "SQLITE",
+            "FILE": os.path.join(config_path, 'unmanic.db'),
+        }
+        from unmanic.libs.unmodels.lib import Database
+        self.db_connection = Database.select_database(database_settings)
+        self.db_connection.create_tables([Libraries, Tasks, TaskStatusCounts])
+        Libraries.insert(id=1, name='Local library', path='/local').on_conflict_ignore().execute()
+
+        from unmanic import config
+        config.Config(config_path=config_path)
+
+    def setup_method(self):
+        Tasks.delete().execute()
+        from unmanic.libs.task import TaskStatusCounters
+        TaskStatusCounters().reset()
+        self.monkeypatch = pytest.MonkeyPatch()
+        self.worker = None
+
+    def teardown_method(self):
+        if self.worker:
+            self.worker.redundant_flag.set()
+            self.worker.wake()
+            self.worker.join(timeout=5)
+        self.monkeypatch.undo()
+
+    def start_worker(self, idle_callback):
+        from unmanic.libs.workers import Worker
+        # Fake runners that complete immediately
+        self.monkeypatch.setattr(Worker, '_Worker__exec_worker_runners_on_set_task', lambda worker: True)
+        self.complete_queue = queue.Queue()
+        self.worker = Worker('test-0', 'Test-Worker-1', 1, queue.Queue(maxsize=1), self.complete_queue, threading.Event(),
+                             idle_callback=idle_callback)
+        self.worker.daemon = True
+        self.worker.start()
+
+    @pytest.mark.unittest
+    def test_worker_announces_idle_and_picks_up_a_set_task_without_polling(self):
+        idle_event = threading.Event()
+        self.start_worker(idle_event.set)
+        assert idle_event.wait(timeout=5)
+        idle_event.clear()
+
+        from unmanic.libs.taskqueue import TaskQueue
+        Tasks.insert(abspath='/local/file.mkv', library_id=1, priority=1, type='local', status='pending').execute()
+        next_task = TaskQueue({}).get_next_pending_tasks()
+        start = time.perf_counter()
+        self.worker.set_task(next_task)
+        completed_task = self.complete_queue.get(timeout=5)
+        # The worker sleeps for up to 5 seconds between checks. Setting a task must wake it immediately
+        assert time.perf_counter() - start < 1
+        assert completed_task.get_task_id() == next_task.get_task_id()
+        assert completed_task.task.success
+        # Once the task is done, the worker announces that it is idle again
+        assert idle_event.wait(timeout=5)
+        assert self.worker.idle
+
+    @pytest.mark.unittest
+    def test_paused_worker_does_not_announce_idle_until_resumed(self):
+        idle_event = threading.Event()
+        self.start_worker(idle_event.set)
+        assert idle_event.wait(timeout=5)
+        idle_event.clear()
+
+        self.worker.paused_flag.set()
+        self.worker.wake()
+        time.sleep(0.1)
+        assert self.worker.paused
+        assert not idle_event.is_set()
+
+        self.worker.paused_flag.clear()
+        self.worker.wake()
+        assert idle_event.wait(timeout=1)
+        assert not self.worker.paused
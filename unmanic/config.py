@@ -35,6 +35,7 @@ import json
 
 from unmanic import metadata
 from unmanic.libs import common
+from unmanic.libs.configversion import ConfigVersion
 from unmanic.libs.logs import UnmanicLogging
 from unmanic.libs.singleton import SingletonType
 
@@ -85,6 +86,8 @@ class Config(object, metaclass=SingletonType):
         self.schedule_full_scan_minutes = 1440
         self.follow_symlinks = True
         self.concurrent_file_testers = 2
+        self.enable_file_test_processes = False
+        self.event_monitor_stable_seconds = 3
         self.run_full_scan_on_start = False
         self.clear_pending_tasks_on_restart = True
         self.auto_manage_completed_tasks = False
@@ -95,6 +98,11 @@ class Config(object, metaclass=SingletonType):
         # Worker settings
         self.cache_path = common.get_default_cache_path()
 
+        # Event plugin settings
+        self.event_plugin_workers = 2
+        self.event_plugin_queue_size = 100
+        self.event_plugin_overflow_policy = 'block'
+
         # Link settings
         self.installation_name = ''
         self.installation_public_address = ''
@@ -254,6 +262,7 @@ class Config(object, metaclass=SingletonType):
         else:
             # Assign value directly to class attribute
             setattr(self, key, value)
+        ConfigVersion().bump('settings.{}'.format(field_id))
 
         # Save settings (if requested)
         if save_settings:
@@ -531,6 +540,72 @@ class Config(object, metaclass=SingletonType):
         """
         return self.concurrent_file_testers
 
+    def get_enable_file_test_processes(self):
+        """
+        Get setting - enable_file_test_processes
+
+        When enabled, each file tester runs the file test plugin flow in its own child process.
+        Plugins do not have access to file metadata from these child processes.
+
+        :return:
+        """
+        # Convert string to boolean if necessary (for environment variables)
+        if isinstance(self.enable_file_test_processes, str):
+            return self.enable_file_test_processes.lower() in ('true', '1', 'yes', 'on')
+        return bool(self.enable_file_test_processes)
+
+    def get_event_monitor_stable_seconds(self):
+        """
+        Get setting - event_monitor_stable_seconds
+
+        The number of seconds that a file's size and mtime must remain unchanged after a
+        file monitor event before it is tested.
+
+        :return:
+        """
+        try:
+            return max(0.0, float(self.event_monitor_stable_seconds))
+        except (TypeError, ValueError):
+            return 3.0
+
+    def get_event_plugin_workers(self):
+        """
+        Get setting - event_plugin_workers
+
+        The number of threads that deliver events to event plugins in the background.
+
+        :return:
+        """
+        try:
+            return max(1, int(self.event_plugin_workers))
+        except (TypeError, ValueError):
+            return 2
+
+    def get_event_plugin_queue_size(self):
+        """
+        Get setting - event_plugin_queue_size
+
+        The number of events that may be waiting for delivery to a single event plugin.
+
+        :return:
+        """
+        try:
+            return max(1, int(self.event_plugin_queue_size))
+        except (TypeError, ValueError):
+            return 100
+
+    def get_event_plugin_overflow_policy(self):
+        """
+        Get setting - event_plugin_overflow_policy
+
+        What to do when an event plugin's queue is full. One of 'block', 'drop_oldest' or 'coalesce'.
+
+        :return:
+        """
+        if self.event_plugin_overflow_policy in ('block', 'drop_oldest', 'coalesce'):
+            return self.event_plugin_overflow_policy
+        return 'block'
+
     def get_plugins_path(self):
         """
         Get setting - config_path
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.bulkoperations.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import os
+import shutil
+import threading
+import time
+import uuid
+
+from unmanic.libs.frontend_push_messages import FrontendPushMessages
+from unmanic.libs.logs import UnmanicLogging
+from unmanic.libs.singleton import SingletonType
+from unmanic.libs.task import Task, TaskDataStore, TaskStatusCounters
+from unmanic.libs.tasklogs import TaskLogStore
+from unmanic.libs.unmodels.lib import supports_returning
+from unmanic.libs.unmodels.searchindexes import contains_search_value
+from unmanic.libs.unmodels.tasks import Tasks
+
+
+class PendingTasksBulkOperation(threading.Thread):
+    """
+    PendingTasksBulkOperation
+
+    Deletes or reorders all pending tasks that match a filter.
+
+    Tasks are processed in chunks of chunk_size. Each chunk is a single DELETE or UPDATE statement
+    that selects its own rows from the filter, so no list of task IDs is ever held in memory and the
+    DB writer is free to run other queries between chunks. The operation can be cancelled between chunks.
+    """
+
+    chunk_size = 500
+
+    def __init__(self, action, search_value='', library_ids=None, exclude_ids=None, position='top'):
+        super(PendingTasksBulkOperation, self).__init__(daemon=True)
+        self.operation_id = uuid.uuid4().hex
+        self.name = 'PendingTasksBulkOperation-{}'.format(self.operation_id[:8])
+        self.logger = UnmanicLogging.get_logger(name=__class__.__name__)
+        if action not in ['delete', 'reorder']:
+            raise ValueError("Unknown pending tasks bulk operation '{}'".format(action))
+        self.action = action
+        self.search_value = search_value or ''
+        self.library_ids = library_ids or []
+        self.exclude_ids = exclude_ids or []
+        self.position = position
+        self.cancel_flag = threading.Event()
+
+        self.state = 'pending'
+        self.processed = 0
+        self.total = 0
+        self.started_at = None
+        self.finished_at = None
+        self.error = None
+
+    def cancel(self):
+        self.cancel_flag.set()
+
+    def get_progress(self):
+        return {
+            'id':          self.operation_id,
+            'action':      self.action,
+            'state':       self.state,
+            'processed':   self.processed,
+            'total':       self.total,
+            'started_at':  self.started_at,
+            'finished_at': self.finished_at,
+            'error':       self.error,
+        }
+
+    def __build_chunk_query(self, last_id):
+        """
+        Return a query selecting the IDs of the next chunk of matching pending tasks after last_id
+
+        :param last_id:
+        :return:
+        """
+        query = Tasks.select(Tasks.id)
+        query = query.where(Tasks.status == 'pending')
+        query = query.where(Tasks.id > last_id)
+        if self.search_value:
+            query = query.where(contains_search_value(Tasks.abspath, self.search_value))
+        if self.library_ids:
+            query = query.where(Tasks.library_id.in_(self.library_ids))
+        if self.exclude_ids:
+            query = query.where(Tasks.id.not_in(self.exclude_ids))
+        return query.order_by(Tasks.id.asc()).limit(self.chunk_size)
+
+    def __count_matching_tasks(self):
+        if self.search_value or self.exclude_ids:
+            query = Tasks.select(Tasks.id)
+            query = query.where(Tasks.status == 'pending')
+            if self.search_value:
+                query = query.where(contains_search_value(Tasks.abspath, self.search_value))
+            if self.library_ids:
+                query = query.where(Tasks.library_id.in_(self.library_ids))
+            if self.exclude_ids:
+                query = query.where(Tasks.id.not_in(self.exclude_ids))
+            return query.count()
+        return Task.get_task_status_count(status='pending', library_ids=self.library_ids)
+
+    def __delete_chunk(self, last_id):
+        if supports_returning():
+            query = Tasks.delete()
+            query = query.where(Tasks.id.in_(self.__build_chunk_query(last_id)))
+            query = query.returning(Tasks.id, Tasks.type, Tasks.abspath)
+            deleted_tasks = list(query.execute())
+        else:
+            deleted_tasks = []
+            while not deleted_tasks:
+                # Select the chunk first, then delete those tasks if they are still pending
+                chunk_tasks = list(self.__build_chunk_query(last_id).select(Tasks.id, Tasks.type, Tasks.abspath))
+                if not chunk_tasks:
+                    break
+                chunk_ids = [chunk_task.id for chunk_task in chunk_tasks]
+                query = Tasks.delete()
+                query = query.where(Tasks.id.in_(chunk_ids))
+                query = query.where(Tasks.status == 'pending')
+                query.execute()
+                # Leave out any task that was picked up by a worker before it could be deleted
+                remaining_ids = set(task_id for (task_id,) in Tasks.select(Tasks.id).where(Tasks.id.in_(chunk_ids)).tuples())
+                deleted_tasks = [chunk_task for chunk_task in chunk_tasks if chunk_task.id not in remaining_ids]
+        if deleted_tasks:
+            TaskStatusCounters().reload()
+        for deleted_task in deleted_tasks:
+            # Remote tasks need to be cleaned up from the cache partition also
+            if deleted_task.type == 'remote':
+                remote_task_dirname = deleted_task.abspath
+                if os.path.exists(deleted_task.abspath) and "unmanic_remote_pending_library" in remote_task_dirname:
+                    self.logger.info("Removing remote pending library task '%s'.", remote_task_dirname)
+                    shutil.rmtree(os.path.dirname(remote_task_dirname))
+            TaskLogStore.clear_task(deleted_task.id)
+        deleted_task_ids = [deleted_task.id for deleted_task in deleted_tasks]
+        TaskDataStore.clear_tasks(deleted_task_ids)
+        return deleted_task_ids
+
+    def __reorder_chunk(self, last_id, new_priority_offset):
+        if self.position == 'top':
+            query = Tasks.update(priority=Tasks.priority + new_priority_offset)
+        else:
+            query = Tasks.update(priority=0)
+        if supports_returning():
+            query = query.where(Tasks.id.in_(self.__build_chunk_query(last_id)))
+            query = query.returning(Tasks.id)
+            return [updated_task.id for updated_task in query.execute()]
+        # Select the chunk first, then update those tasks
+        chunk_ids = [task_id for (task_id,) in self.__build_chunk_query(last_id).tuples()]
+        if chunk_ids:
+            query = query.where(Tasks.id.in_(chunk_ids))
+            query.execute()
+        return chunk_ids
+
+    def __push_progress(self, frontend_messages):
+        message = "{} pending tasks - {} of {}".format(
+            'Removing' if self.action == 'delete' else 'Reordering', self.processed, self.total)
+        frontend_messages.update(
+            {
+                'id':      'pendingTasksBulkOperation-{}'.format(self.operation_id),
+                'type':    'status',
+                'code':    'pendingTasksBulkOperation',
+                'message': message,
+                'timeout': 0
+            }
+        )
+
+    def run(self):
+        self.state = 'running'
+        self.started_at = time.time()
+        frontend_messages = FrontendPushMessages()
+        try:
+            self.total = self.__count_matching_tasks()
+            new_priority_offset = 0
+            if self.action == 'reorder' and self.position == 'top':
+                # Offset all matching tasks above the current highest priority task
+                top_task = Tasks.select(Tasks.priority).order_by(Tasks.priority.desc()).limit(1).first()
+                new_priority_offset = int(top_task.priority if top_task and top_task.priority else 1) + 500
+            self.logger.info("Starting pending tasks bulk %s of %s tasks", self.action, self.total)
+            last_id = 0
+            while not self.cancel_flag.is_set():
+                if self.action == 'delete':
+                    chunk_ids = self.__delete_chunk(last_id)
+                else:
+                    chunk_ids = self.__reorder_chunk(last_id, new_priority_offset)
+                if not chunk_ids:
+                    break
+                last_id = max(chunk_ids)
+                self.processed += len(chunk_ids)
+                self.total = max(self.total, self.processed)
+                self.__push_progress(frontend_messages)
+            self.state = 'cancelled' if self.cancel_flag.is_set() else 'complete'
+        except Exception as e:
+            self.logger.exception("Pending tasks bulk %s failed - %s", self.action, e)
+            self.state = 'failed'
+            self.error = str(e)
+        finally:
+            self.finished_at = time.time()
+            frontend_messages.remove_item('pendingTasksBulkOperation-{}'.format(self.operation_id))
+        self.logger.info("Pending tasks bulk %s %s after %s tasks", self.action, self.state, self.processed)
+
+
+class PendingTasksBulkOperations(object, metaclass=SingletonType):
+    """
+    PendingTasksBulkOperations
+
+    Tracks the running and recently finished pending task bulk operations.
+    """
+
+    # The number of finished operations to keep for progress requests
+    max_finished_operations = 20
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._operations = {}
+
+    def start(self, action, search_value='', library_ids=None, exclude_ids=None, position='top'):
+        """
+        Start a bulk operation in the background and return its progress
+
+        :param action:
+        :param search_value:
+        :param library_ids:
+        :param exclude_ids:
+        :param position:
+        :return:
+        """
+        operation = PendingTasksBulkOperation(action, search_value=search_value, library_ids=library_ids,
+                                              exclude_ids=exclude_ids, position=position)
+        with self._lock:
+            self.__prune_finished_operations()
+            self._operations[operation.operation_id] = operation
+        operation.start()
+        return operation.get_progress()
+
+    def __prune_finished_operations(self):
+        finished = [op for op in self._operations.values() if op.finished_at is not None]
+        finished.sort(key=lambda op: op.finished_at)
+        for op in finished[:max(0, len(finished) - self.max_finished_operations)]:
+            del self._operations[op.operation_id]
+
+    def get_progress(self, operation_id=None):
+        """
+        Return the progress of an operation, or of all tracked operations if no ID is given
+
+        :param operation_id:
+        :return:
+        """
+        with self._lock:
+            if operation_id is not None:
+                operation = self._operations.get(operation_id)
+                return operation.get_progress() if operation else None
+            return [op.get_progress() for op in self._operations.values()]
+
+    def cancel(self, operation_id):
+        """
+        Cancel a running operation. Returns False if no operation matches the ID.
+
+        :param operation_id:
+        :return:
+        """
+        with self._lock:
+            operation = self._operations.get(operation_id)
+        if operation is None:
+            return False
+        operation.cancel()
+        return True
+
+    def wait(self, operation_id, timeout=None):
+        with self._lock:
+            operation = self._operations.get(operation_id)
+        if operation is not None:
+            operation.join(timeout)
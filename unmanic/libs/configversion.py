@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.configversion.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import threading
+
+from unmanic.libs.logs import UnmanicLogging
+from unmanic.libs.singleton import SingletonType
+
+
+class ConfigVersion(object, metaclass=SingletonType):
+    """
+    ConfigVersion
+
+    Process-wide version number of the Unmanic configuration.
+    Every write to the settings, libraries, plugin settings or installed plugins bumps the version.
+    Consumers that derive data from the configuration can compare the version they last saw with
+    get() rather than reading and hashing the configuration again, or register a listener to be told
+    when it changes.
+    """
+
+    def __init__(self):
+        self.logger = UnmanicLogging.get_logger(name=__class__.__name__)
+        self._lock = threading.Lock()
+        self._version = 0
+        self._listeners = []
+
+    def get(self):
+        """
+        Returns the current configuration version
+
+        :return:
+        """
+        return self._version
+
+    def bump(self, source=''):
+        """
+        Record a change to the configuration and notify all listeners.
+        Returns the new configuration version.
+
+        :param source: A short description of what changed. Used for logging only.
+        :return:
+        """
+        with self._lock:
+            self._version += 1
+            version = self._version
+            listeners = list(self._listeners)
+        self.logger.debug("Configuration version %s (%s)", version, source)
+        for listener in listeners:
+            try:
+                listener(version)
+            except Exception as e:
+                self.logger.exception("Exception in configuration version listener %s", e)
+        return version
+
+    def add_listener(self, listener):
+        """
+        Register a callable that is passed the new version each time the configuration changes.
+        Listeners are called from the thread that made the change, so they must return quickly.
+
+        :param listener:
+        :return:
+        """
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """
+        Remove a listener registered with add_listener()
+
+        :param listener:
+        :return:
+        """
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.eventbus.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import collections
+import copy
+import inspect
+import os
+import threading
+import time
+
+from unmanic import config
+from unmanic.libs.logs import UnmanicLogging
+from unmanic.libs.singleton import SingletonType
+
+
+class EventPluginBus(object, metaclass=SingletonType):
+    """
+    EventPluginBus
+
+    Delivers 'events.*' plugin runners on a bounded pool of threads so that a slow plugin
+    (eg. one that posts a webhook) does not stall the scanner, worker or post-processor that emitted the event.
+
+    Each plugin has its own bounded queue and receives its events in the order they were published.
+    When a plugin's queue is full, the configured overflow policy is applied:
+        block       - The publisher waits for space in the queue.
+        drop_oldest - The oldest pending event for that plugin is discarded.
+        coalesce    - A pending event of the same type for the same task, library and file is replaced.
+                      If there is none, the oldest pending event is discarded.
+
+    Runners that accept the task_data_store or file_metadata helpers (or the legacy positional helpers)
+    may depend on task state that only exists while the task is being processed.
+    These are still run synchronously in the publishing thread.
+    """
+
+    def __init__(self):
+        self.logger = UnmanicLogging.get_logger(name=__class__.__name__)
+        self._condition = threading.Condition()
+        self._reset()
+
+    def _reset(self):
+        # Pending events keyed by plugin ID. Each event is a tuple of (plugin_type, data, coalesce_key, published_at)
+        self._queues = {}
+        # Plugin IDs with pending events that are not currently being delivered
+        self._ready = collections.deque()
+        # Plugin IDs currently being delivered by a pool thread
+        self._active = set()
+        self._threads = []
+        self._stopping = False
+        self._pid = os.getpid()
+        # Delivery counters keyed by plugin ID
+        self._stats = {}
+        # Cache of whether a runner function can be run asynchronously, keyed by the runner function
+        self._async_runners = {}
+
+    @staticmethod
+    def __coalesce_key(plugin_type, data):
+        return plugin_type, data.get('task_id'), data.get('library_id'), data.get('file_path')
+
+    def __plugin_stats(self, plugin_id):
+        stats = self._stats.get(plugin_id)
+        if stats is None:
+            stats = self._stats[plugin_id] = {
+                'published':      0,
+                'delivered':      0,
+                'failed':         0,
+                'dropped':        0,
+                'coalesced':      0,
+                'max_latency_ms': 0,
+            }
+        return stats
+
+    def runner_can_run_async(self, runner):
+        """
+        Returns True if the runner only accepts the event data
+
+        :param runner:
+        :return:
+        """
+        can_run_async = self._async_runners.get(runner)
+        if can_run_async is None:
+            try:
+                params = list(inspect.signature(runner).parameters.values())
+            except (TypeError, ValueError):
+                params = None
+            can_run_async = bool(params) and len(params) == 1 and params[0].kind in (
+                inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+            self._async_runners[runner] = can_run_async
+        return can_run_async
+
+    def publish(self, plugin_type, data, synchronous=False):
+        """
+        Deliver an event to all plugins with a runner for the given event plugin type.
+        Runners that can run asynchronously are given a copy of the data and queued. All others are run before returning.
+
+        :param plugin_type:
+        :param data:
+        :param synchronous: Run all runners in this thread before returning
+        :return:
+        """
+        from unmanic.libs.plugins import PluginsHandler
+        plugin_handler = PluginsHandler()
+        plugin_modules = plugin_handler.get_enabled_plugin_modules_by_type(plugin_type)
+        if not plugin_modules:
+            return
+
+        async_data = None
+        for plugin_module in plugin_modules:
+            plugin_id = plugin_module.get('plugin_id')
+            if not synchronous and self.runner_can_run_async(plugin_module.get('runner')):
+                if async_data is None:
+                    try:
+                        # The publisher may go on to modify the data it passed in
+                        async_data = copy.deepcopy(data)
+                    except Exception:
+                        self.logger.debug("Unable to copy '%s' event data. Running plugins synchronously", plugin_type)
+                        synchronous = True
+                if not synchronous:
+                    self.__enqueue(plugin_id, plugin_type, async_data)
+                    continue
+            plugin_handler.exec_plugin_runner(data, plugin_id, plugin_type)
+
+    def __enqueue(self, plugin_id, plugin_type, data):
+        settings = config.Config()
+        queue_size = settings.get_event_plugin_queue_size()
+        overflow_policy = settings.get_event_plugin_overflow_policy()
+        event = (plugin_type, data, self.__coalesce_key(plugin_type, data), time.monotonic())
+        dropped_event = None
+        with self._condition:
+            self.__ensure_started(settings)
+            queue = self._queues.setdefault(plugin_id, collections.deque())
+            stats = self.__plugin_stats(plugin_id)
+            stats['published'] += 1
+            if overflow_policy == 'block':
+                while len(queue) >= queue_size and not self._stopping:
+                    self._condition.wait(1)
+            elif len(queue) >= queue_size:
+                if overflow_policy == 'coalesce':
+                    for index, pending_event in enumerate(queue):
+                        if pending_event[2] == event[2]:
+                            # Replace the pending event, but keep its place in the queue and its publish time
+                            queue[index] = (plugin_type, data, event[2], pending_event[3])
+                            stats['coalesced'] += 1
+                            return
+                dropped_event = queue.popleft()
+                stats['dropped'] += 1
+            queue.append(event)
+            if plugin_id not in self._active and plugin_id not in self._ready:
+                self._ready.append(plugin_id)
+            self._condition.notify_all()
+        if dropped_event:
+            self.logger.warning("Event queue for plugin '%s' is full. Dropped a pending '%s' event",
+                                plugin_id, dropped_event[0])
+            UnmanicLogging.metric('event_plugin_dropped', plugin_id=plugin_id, plugin_type=dropped_event[0],
+                                  overflow_policy=overflow_policy)
+
+    def __ensure_started(self, settings):
+        # Must be called with the condition held
+        if self._pid != os.getpid():
+            # This is a forked child. None of the parent's pool threads exist here
+            self._reset()
+        self._stopping = False
+        self._threads = [thread for thread in self._threads if thread.is_alive()]
+        pool_size = settings.get_event_plugin_workers()
+        while len(self._threads) < pool_size:
+            thread = threading.Thread(target=self.__deliver_events, name='EventPluginBus-{}'.format(len(self._threads)),
+                                      daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def __deliver_events(self):
+        from unmanic.libs.plugins import PluginsHandler
+        plugin_handler = PluginsHandler()
+        while True:
+            with self._condition:
+                while not self._ready and not self._stopping:
+                    self._condition.wait()
+                if not self._ready:
+                    # Stopping and all pending events have been delivered
+                    return
+                plugin_id = self._ready.popleft()
+                plugin_type, data, coalesce_key, published_at = self._queues[plugin_id].popleft()
+                self._active.add(plugin_id)
+                # Wake any publishers blocked on this queue
+                self._condition.notify_all()
+
+            started_at = time.monotonic()
+            success = plugin_handler.exec_plugin_runner(data, plugin_id, plugin_type)
+            finished_at = time.monotonic()
+            latency_ms = round((finished_at - published_at) * 1000, 3)
+
+            with self._condition:
+                self._active.discard(plugin_id)
+                if self._queues[plugin_id]:
+                    self._ready.append(plugin_id)
+                stats = self.__plugin_stats(plugin_id)
+                stats['delivered' if success else 'failed'] += 1
+                stats['max_latency_ms'] = max(stats['max_latency_ms'], latency_ms)
+                self._condition.notify_all()
+            UnmanicLogging.metric('event_plugin_delivered', plugin_id=plugin_id, plugin_type=plugin_type,
+                                  success=success, delivery_latency_ms=latency_ms,
+                                  queue_ms=round((started_at - published_at) * 1000, 3),
+                                  run_ms=round((finished_at - started_at) * 1000, 3))
+
+    def wait_until_idle(self, timeout=None):
+        """
+        Wait for all pending events to be delivered.
+        Returns True if the queues are empty.
+
+        :param timeout:
+        :return:
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._ready or self._active:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def get_stats(self):
+        """
+        Returns a copy of the delivery counters for each plugin along with the number of events still pending
+
+        :return:
+        """
+        with self._condition:
+            stats = {}
+            for plugin_id, plugin_stats in self._stats.items():
+                stats[plugin_id] = dict(plugin_stats, pending=len(self._queues.get(plugin_id, ())))
+            return stats
+
+    def stop(self, timeout=10):
+        """
+        Deliver any pending events and stop the pool threads
+
+        :param timeout:
+        :return:
+        """
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+            threads = list(self._threads)
+        deadline = time.monotonic() + timeout
+        for thread in threads:
+            thread.join(max(0, deadline - time.monotonic()))
+        with self._condition:
+            self._threads = [thread for thread in self._threads if thread.is_alive()]
+            if self._threads:
+                self.logger.warning("Stopped with %s event plugin threads still running", len(self._threads))
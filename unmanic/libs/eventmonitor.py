@@ -58,6 +58,246 @@ except ImportError:
 from unmanic.libs.filetest import FileTest
 
 
+class EventBuffer(object):
+    """
+    EventBuffer
+
+    Coalesces file monitor events by path.
+
+    A copy into a monitored directory produces a burst of events for the same path. Each path is
+    held in the buffer until its size and mtime have not changed for 'stable_seconds' since the
+    last event, then it is released exactly once. Any later events for the path add it again.
+
+    """
+
+    def __init__(self, stable_seconds=3.0):
+        self.stable_seconds = stable_seconds
+        self._condition = threading.Condition()
+        # Map of path to [library_id, size, mtime_ns, stable_since, next_check]
+        self._pending = {}
+
+        self.events_received_count = 0
+        self.events_coalesced_count = 0
+
+    def __len__(self):
+        with self._condition:
+            return len(self._pending)
+
+    def add(self, path, library_id):
+        """
+        Add an event for a path. Events for a path that is already pending are merged into it.
+
+        :param path:
+        :param library_id:
+        :return:
+        """
+        now = time.monotonic()
+        with self._condition:
+            self.events_received_count += 1
+            entry = self._pending.get(path)
+            if entry is not None:
+                self.events_coalesced_count += 1
+                entry[0] = library_id
+                entry[3] = now
+                entry[4] = now
+            else:
+                self._pending[path] = [library_id, None, None, now, now]
+            self._condition.notify_all()
+
+    def wait(self, timeout):
+        """
+        Wait for up to 'timeout' seconds, or until the next pending path is due to be checked
+
+        :param timeout:
+        :return:
+        """
+        with self._condition:
+            if self._pending:
+                next_check = min(entry[4] for entry in self._pending.values())
+                timeout = min(timeout, max(0.0, next_check - time.monotonic()))
+            if timeout > 0:
+                self._condition.wait(timeout)
+
+    def drain(self, max_items):
+        """
+        Release up to 'max_items' paths that have been stable for long enough.
+        Returns a list of (path, library_id) tuples in the order the paths were first seen.
+
+        :param max_items:
+        :return:
+        """
+        now = time.monotonic()
+        with self._condition:
+            due = [(path, list(entry)) for path, entry in self._pending.items() if entry[4] <= now]
+
+        released = []
+        updates = {}
+        for path, (library_id, size, mtime_ns, stable_since, next_check) in due:
+            if len(released) >= max_items:
+                break
+            try:
+                file_stat = os.stat(path)
+            except OSError:
+                # The file was removed (or moved away) before it settled
+                updates[path] = None
+                continue
+            if (file_stat.st_size, file_stat.st_mtime_ns) != (size, mtime_ns):
+                if size is None and (time.time() - (file_stat.st_mtime_ns / 1e9)) >= self.stable_seconds:
+                    # First check, and the file has not been modified within the window
+                    released.append((path, library_id))
+                    updates[path] = None
+                    continue
+                # Still being written. Check again once the window has passed
+                updates[path] = (file_stat.st_size, file_stat.st_mtime_ns, now, now + self.stable_seconds)
+                continue
+            if now - stable_since >= self.stable_seconds:
+                released.append((path, library_id))
+                updates[path] = None
+                continue
+            updates[path] = (size, mtime_ns, stable_since, stable_since + self.stable_seconds)
+
+        with self._condition:
+            for path, update in updates.items():
+                entry = self._pending.get(path)
+                if entry is None:
+                    continue
+                if entry[4] > now:
+                    # A new event arrived for this path while it was being checked
+                    continue
+                if update is None:
+                    del self._pending[path]
+                    continue
+                entry[1], entry[2], entry[3], entry[4] = update
+        return released
+
+
+class EventFileTesterPool(object):
+    """
+    EventFileTesterPool
+
+    A small pool of long-lived file tester threads for one monitored library.
+
+    Each thread builds a FileTest once (loading the plugin modules and library config) and reuses it
+    for every path. The pool is replaced when the library configuration hash changes.
+    A path is never queued while it is already waiting or being tested.
+
+    """
+
+    # Number of tester threads per library
+    worker_count = 2
+
+    def __init__(self, library_id, config_hash, test_function):
+        self.logger = UnmanicLogging.get_logger(name=__class__.__name__)
+        self.library_id = library_id
+        self.config_hash = config_hash
+        self.test_function = test_function
+        self.abort_flag = threading.Event()
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._queued_paths = set()
+        self._threads = []
+        self.__reset_metrics()
+
+    def __reset_metrics(self):
+        self._tested_count = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+        self._total_test_duration = 0.0
+
+    def start(self):
+        for i in range(self.worker_count):
+            thread = threading.Thread(target=self.__worker,
+                                      name="EventFileTester-{}-{}".format(self.library_id, i), daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        """
+        Stop the tester threads.
+        Returns the list of paths that were queued but not yet tested.
+
+        :return:
+        """
+        self.abort_flag.set()
+        for thread in self._threads:
+            thread.join(2)
+        self._threads = []
+        untested_paths = []
+        while True:
+            try:
+                path, queued_at = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            untested_paths.append(path)
+        with self._lock:
+            self._queued_paths.clear()
+        return untested_paths
+
+    def build_file_test(self):
+        return FileTest(self.library_id)
+
+    def submit(self, path):
+        """
+        Queue a path to be tested. Returns False if the path is already queued.
+
+        :param path:
+        :return:
+        """
+        with self._lock:
+            if path in self._queued_paths:
+                return False
+            self._queued_paths.add(path)
+        self._queue.put((path, time.monotonic()))
+        return True
+
+    def queue_depth(self):
+        with self._lock:
+            return len(self._queued_paths)
+
+    def collect_metrics(self):
+        """
+        Return the metrics recorded since the last call
+
+        :return:
+        """
+        with self._lock:
+            tested_count = self._tested_count
+            metrics = {
+                'library_id':               self.library_id,
+                'queue_depth':              len(self._queued_paths),
+                'files_tested_count':       tested_count,
+                'latency_average_ms':       (self._total_latency / tested_count * 1000) if tested_count else 0,
+                'latency_max_ms':           self._max_latency * 1000,
+                'test_duration_average_ms': (self._total_test_duration / tested_count * 1000) if tested_count else 0,
+            }
+            self.__reset_metrics()
+        return metrics
+
+    def __worker(self):
+        file_test = None
+        while not self.abort_flag.is_set():
+            try:
+                path, queued_at = self._queue.get(timeout=.5)
+            except queue.Empty:
+                continue
+            test_start = time.monotonic()
+            try:
+                if file_test is None:
+                    file_test = self.build_file_test()
+                self.test_function(path, self.library_id, file_test)
+            except Exception as e:
+                self.logger.exception("Exception testing monitored file path '%s'", path)
+            finally:
+                test_end = time.monotonic()
+                with self._lock:
+                    self._queued_paths.discard(path)
+                    latency = test_end - queued_at
+                    self._tested_count += 1
+                    self._total_latency += latency
+                    self._max_latency = max(self._max_latency, latency)
+                    self._total_test_duration += test_end - test_start
+
+
 class EventHandler(FileSystemEventHandler):
     """
     Handle any library file modification events
@@ -75,12 +315,13 @@ class EventHandler(FileSystemEventHandler):
         - Hardlink = ["created", "modified"]                    :
 
     From this, the only event we really need to monitor is the "created" and "closed" events.
+    These are added to an EventBuffer which coalesces all events for a path until the file is stable.
     """
 
-    def __init__(self, files_to_test, library_id):
+    def __init__(self, event_buffer, library_id):
         self.name = __class__.__name__
         self.logger = UnmanicLogging.get_logger(name=__class__.__name__)
-        self.files_to_test = files_to_test
+        self.event_buffer = event_buffer
         self.library_id = library_id
         self.abort_flag = threading.Event()
         self.abort_flag.clear()
@@ -91,11 +332,8 @@ class EventHandler(FileSystemEventHandler):
             if event.is_directory:
                 self.logger.debug("Detected event is for a directory. Ignoring...")
             else:
-                self.logger.info("Detected '%s' event on file path '%s'", event.event_type, event.src_path)
-                self.files_to_test.put({
-                    'src_path':   event.src_path,
-                    'library_id': self.library_id,
-                })
+                self.logger.debug("Detected '%s' event on file path '%s'", event.event_type, event.src_path)
+                self.event_buffer.add(event.src_path, self.library_id)
 
 
 class EventMonitorManager(threading.Thread):
@@ -106,8 +344,16 @@ class EventMonitorManager(threading.Thread):
     If the settings for enabling the EventProcessor changes, this manager
     class will stop or start the EventProcessor thread accordingly.
 
+    Paths released by the event buffer are handed in batches of up to 'event_batch_size' to a pool of
+    file testers for their library (see EventFileTesterPool).
+
     """
 
+    # Max number of stable paths taken from the event buffer at once
+    event_batch_size = 200
+    # Seconds between event path metrics
+    metrics_interval = 10
+
     def __init__(self, data_queues, event):
         super(EventMonitorManager, self).__init__(name='EventMonitorManager')
         self.name = __class__.__name__
@@ -116,8 +362,8 @@ class EventMonitorManager(threading.Thread):
         self.settings = config.Config()
         self.event = event
 
-        # Create an event queue
-        self.files_to_test = queue.Queue()
+        # Create an event buffer
+        self.event_buffer = EventBuffer(stable_seconds=self.settings.get_event_monitor_stable_seconds())
 
         self.abort_flag = threading.Event()
         self.abort_flag.clear()
@@ -125,40 +371,61 @@ class EventMonitorManager(threading.Thread):
         self.event_observer_thread = None
         self.event_observer_threads = []
 
+        # File tester pools by library ID
+        self.tester_pools = {}
+
     def stop(self):
         self.abort_flag.set()
 
     def run(self):
         self.logger.info("Starting EventMonitorManager loop")
+        next_library_check = 0
+        next_metrics = time.monotonic() + self.metrics_interval
+        configuration_is_valid = False
         while not self.abort_flag.is_set():
-            self.event.wait(.5)
+            if time.monotonic() >= next_metrics:
+                next_metrics = time.monotonic() + self.metrics_interval
+                self.emit_tester_pool_metrics()
+
+            # Hand any paths that are ready to the library tester pools in batches
+            queue_depth = sum(p.queue_depth() for p in self.tester_pools.values())
+            if configuration_is_valid and queue_depth < self.event_batch_size:
+                self.event_buffer.stable_seconds = self.settings.get_event_monitor_stable_seconds()
+                ready = self.event_buffer.drain(self.event_batch_size - queue_depth)
+                for pathname, library_id in ready:
+                    tester_pool = self.tester_pools.get(library_id)
+                    if tester_pool is None:
+                        self.logger.debug("Library ID %s is no longer monitored. Ignoring '%s'", library_id, pathname)
+                        continue
+                    tester_pool.submit(pathname)
+                if ready:
+                    self.logger.info("Queued %s monitored file paths for testing. %s paths waiting to settle", len(ready),
+                                     len(self.event_buffer))
+                    continue
 
-            if not self.system_configuration_is_valid():
-                self.event.wait(2)
+            if time.monotonic() < next_library_check:
+                # Wait for new events, or for a pending path to be due
+                self.event_buffer.wait(.5)
                 continue
 
-            if not self.files_to_test.empty():
-                item = self.files_to_test.get()
-                pathname = item.get('src_path')
-                library_id = item.get('library_id')
-                self.manage_event_queue(pathname, library_id)
+            configuration_is_valid = self.system_configuration_is_valid()
+            if not configuration_is_valid:
+                next_library_check = time.monotonic() + 2
                 continue
 
             # Check if monitor is enabled for at least one library
             enable_inotify = False
+            monitored_library_ids = []
             for lib_info in Library.get_all_libraries():
-                try:
-                    library = Library(lib_info['id'])
-                except Exception as e:
-                    self.logger.exception("Unable to fetch library config for ID %s", lib_info['id'])
-                    continue
                 # Check if the library is configured for remote files only
-                if library.get_enable_remote_only():
+                if lib_info.get('enable_remote_only'):
                     # This library is configured to receive remote files only... Never enable the file monitor
                     continue
                 # Check if file monitor is enabled on any library
-                if library.get_enable_inotify():
+                if lib_info.get('enable_inotify'):
                     enable_inotify = True
+                    monitored_library_ids.append(lib_info['id'])
+            self.update_tester_pools(monitored_library_ids)
 
             # If at least library has the monitor enabled, then start it. Otherwise stop the monitor process
             if enable_inotify:
@@ -169,12 +436,50 @@ class EventMonitorManager(threading.Thread):
                 # If not enabled, ensure the EventProcessor is not running and stop it if it is
                 if self.event_observer_thread:
                     self.stop_event_processor()
-            # Add delay (longer when no libraries are being monitored)
-            self.event.wait(2 if enable_inotify else 20)
+            # Re-check the library configuration later (less often when no libraries are being monitored)
+            next_library_check = time.monotonic() + (2 if enable_inotify else 20)
 
         self.stop_event_processor()
+        self.update_tester_pools([])
         self.logger.info("Leaving EventMonitorManager loop...")
 
+    def update_tester_pools(self, library_ids):
+        """
+        Ensure that each monitored library has a file tester pool built for its current configuration.
+        Pools for libraries that are no longer monitored are stopped.
+
+        :param library_ids:
+        :return:
+        """
+        for library_id in list(self.tester_pools):
+            if library_id not in library_ids:
+                self.logger.info("Stopping file testers for library ID %s", library_id)
+                self.tester_pools.pop(library_id).stop()
+        for library_id in library_ids:
+            try:
+                config_hash = Library(library_id).get_configuration_hash()
+            except Exception as e:
+                self.logger.exception("Unable to fetch library config for ID %s", library_id)
+                continue
+            untested_paths = []
+            tester_pool = self.tester_pools.get(library_id)
+            if tester_pool is not None:
+                if tester_pool.config_hash == config_hash:
+                    continue
+                self.logger.info("Library ID %s configuration changed. Restarting its file testers", library_id)
+                untested_paths = tester_pool.stop()
+            tester_pool = EventFileTesterPool(library_id, config_hash, self.manage_event_queue)
+            tester_pool.start()
+            for path in untested_paths:
+                tester_pool.submit(path)
+            self.tester_pools[library_id] = tester_pool
+
+    def emit_tester_pool_metrics(self):
+        for tester_pool in list(self.tester_pools.values()):
+            metrics = tester_pool.collect_metrics()
+            if metrics.get('files_tested_count') or metrics.get('queue_depth'):
+                UnmanicLogging.metric("event_monitor_file_tests", **metrics)
+
     def system_configuration_is_valid(self):
         """
         Check and ensure the system configuration is correct for running
@@ -215,7 +520,7 @@ class EventMonitorManager(threading.Thread):
                     if not os.path.exists(library_path):
                         continue
                     self.logger.info("Adding library path to monitor '%s'", library_path)
-                    event_handler = EventHandler(self.files_to_test, library.get_id())
+                    event_handler = EventHandler(self.event_buffer, library.get_id())
                     self.event_observer_thread.schedule(event_handler, library_path, recursive=True)
                     monitoring_path = True
             # Only start observer if a path was added to be monitored
@@ -245,20 +550,22 @@ class EventMonitorManager(threading.Thread):
 
         self.event_observer_thread = None
 
-    def manage_event_queue(self, pathname, library_id):
+    def manage_event_queue(self, pathname, library_id, file_test=None):
         """
         Manage all monitored events
 
-        Unlike the library scanner, all events are processed sequentially one at a time.
-        This avoids a file being added twice on 2 events.
+        The event buffer coalesces events by path and the library tester pools never test the same path
+        concurrently. This avoids a file being added twice on 2 events.
 
         :param pathname:
         :param library_id:
+        :param file_test: Optional FileTest object for the library to reuse
         :return:
         """
         # Test file to be added to task list. Add it if required
         try:
-            file_test = FileTest(library_id)
+            if file_test is None:
+                file_test = FileTest(library_id)
             result, issues, priority_score, _ = file_test.should_file_be_added_to_task_list(pathname)
             # Log any error messages
             for issue in issues:
@@ -37,8 +37,12 @@ from copy import deepcopy
 
 from unmanic import config
 from unmanic.libs import history, common
+from unmanic.libs.filetestcache import FileTestDecisionCache
 from unmanic.libs.logs import UnmanicLogging
+from unmanic.libs.library import Library
 from unmanic.libs.plugins import PluginsHandler
+from unmanic.libs.prefilters import LibraryPrefilters
+from unmanic.libs.unmanicignore import UnmanicIgnoreFiles
 
 
 class FileTest(object):
@@ -50,18 +54,31 @@ class FileTest(object):
 
     """
 
-    def __init__(self, library_id: int):
+    def __init__(self, library_id: int, plugin_modules=None, decision_cache=None):
         self.settings = config.Config()
         self.logger = UnmanicLogging.get_logger(name=__class__.__name__)
 
         # Init plugins
+        # The plugin modules may be provided where the DB is not available (eg. in a file test child process)
         self.library_id = library_id
         self.plugin_handler = PluginsHandler()
-        self.plugin_modules = self.plugin_handler.get_enabled_plugin_modules_by_type('library_management.file_test',
-                                                                                     library_id=library_id)
+        if plugin_modules is None:
+            plugin_modules = self.plugin_handler.get_enabled_plugin_modules_by_type('library_management.file_test',
+                                                                                    library_id=library_id)
+        self.plugin_modules = plugin_modules
 
-        # List of filed tasks
-        self.failed_paths = []
+        # Plugins are skipped for files rejected by the prefilters declared in their info.json
+        self.plugin_prefilters = {}
+        for plugin_module in self.plugin_modules:
+            plugin_prefilter = LibraryPrefilters.read_plugin_prefilter(plugin_module.get('plugin_id'))
+            if not plugin_prefilter.is_empty():
+                self.plugin_prefilters[plugin_module.get('plugin_id')] = plugin_prefilter
+
+        # The library path is the root directory for '.unmanicignore' rules
+        self.library_path = None
+
+        # Cache of plugin flow results. Created on first use if not provided
+        self.decision_cache = decision_cache
 
     def set_file(self):
         pass
@@ -72,46 +89,32 @@ class FileTest(object):
 
         :return:
         """
-        # Fetch historical tasks
-        history_logging = history.History()
-        if not self.failed_paths:
-            failed_tasks = history_logging.get_historic_tasks_list_with_source_probe(task_success=False)
-            for task in failed_tasks:
-                self.failed_paths.append(task.get('abspath'))
-        if path in self.failed_paths:
-            # That pathname was found in the results of failed historic tasks
-            return True
-        # No results were found matching that pathname
-        return False
+        # Check the process-wide index of failed historic task paths
+        return history.FailedPathsIndex().contains(path)
 
     def file_in_unmanic_ignore_lockfile(self, path):
         """
-        Check if folder contains a '.unmanicignore' lockfile
+        Check if the file is excluded by a '.unmanicignore' file in its directory or any parent directory within the library
 
         :return:
         """
-        # Get file parent directory
-        dirname = os.path.dirname(path)
-        # Check if lockfile (.unmanicignore) exists
-        unmanic_ignore_file = os.path.join(dirname, '.unmanicignore')
-        if os.path.exists(unmanic_ignore_file):
-            # Get file basename
-            basename = os.path.basename(path)
-            # Read the file and check for any entry with this file name
-            with open(unmanic_ignore_file) as f:
-                for line in f:
-                    if basename in line:
-                        return True
-        return False
+        if self.library_path is None:
+            try:
+                self.library_path = Library(self.library_id).get_path()
+            except Exception as e:
+                self.logger.warning("Unable to read path of library ID %s - %s", self.library_id, e)
+                self.library_path = ''
+        return UnmanicIgnoreFiles().is_ignored(path, self.library_path)
 
-    def should_file_be_added_to_task_list(self, path):
+    def run_pre_checks(self, path):
         """
-        Test if this file needs to be added to the task list
+        Run the core tests that do not require plugins.
+        Returns False if the file should not be added, otherwise None.
 
+        :param path:
         :return:
         """
         return_value = None
-        decision_plugin = None
         file_issues = []
 
         # TODO: Remove this
@@ -130,47 +133,129 @@ class FileTest(object):
             })
             return_value = False
 
-        # Only run checks with plugins if other tests were not conclusive
-        priority_score_modification = 0
-        if return_value is None:
-            # Set the initial data with just the priority score.
-            data = {
-                'priority_score': 0,
-                'shared_info':    {},
-            }
-            # Run tests against plugins
-            for plugin_module in self.plugin_modules:
-                data['library_id'] = self.library_id
-                data['path'] = path
-                data['issues'] = deepcopy(file_issues)
-                data['add_file_to_pending_tasks'] = None
-
-                # Run plugin to update data
-                if not self.plugin_handler.exec_plugin_runner(data, plugin_module.get('plugin_id'),
-                                                              'library_management.file_test'):
-                    continue
+        return return_value, file_issues
 
-                # Append any file issues found during previous tests
-                file_issues = data.get('issues')
-
-                # Set the return_value based on the plugin results
-                # If the add_file_to_pending_tasks returned an answer (True/False) then break the loop.
-                # No need to continue.
-                if data.get('add_file_to_pending_tasks') is not None:
-                    return_value = data.get('add_file_to_pending_tasks')
-                    decision_plugin = {
-                        'plugin_id':   plugin_module.get('plugin_id'),
-                        'plugin_name': plugin_module.get('name'),
-                    }
-                    break
-            # Set the priority score modification
-            priority_score_modification = data.get('priority_score', 0)
+    def run_plugin_tests(self, path, file_issues):
+        """
+        Run the file through the 'library_management.file_test' plugin flow
+
+        :param path:
+        :param file_issues:
+        :return:
+        """
+        return_value = None
+        decision_plugin = None
+
+        # Set the initial data with just the priority score.
+        data = {
+            'priority_score': 0,
+            'shared_info':    {},
+        }
+
+        def get_size():
+            try:
+                return os.path.getsize(path)
+            except OSError:
+                return None
+
+        # Run tests against plugins
+        for plugin_module in self.plugin_modules:
+            plugin_prefilter = self.plugin_prefilters.get(plugin_module.get('plugin_id'))
+            if plugin_prefilter is not None and plugin_prefilter.check(path, get_size) is not None:
+                continue
+
+            data['library_id'] = self.library_id
+            data['path'] = path
+            data['issues'] = deepcopy(file_issues)
+            data['add_file_to_pending_tasks'] = None
+
+            # Run plugin to update data
+            if not self.plugin_handler.exec_plugin_runner(data, plugin_module.get('plugin_id'),
+                                                          'library_management.file_test'):
+                continue
+
+            # Append any file issues found during previous tests
+            file_issues = data.get('issues')
+
+            # Set the return_value based on the plugin results
+            # If the add_file_to_pending_tasks returned an answer (True/False) then break the loop.
+            # No need to continue.
+            if data.get('add_file_to_pending_tasks') is not None:
+                return_value = data.get('add_file_to_pending_tasks')
+                decision_plugin = {
+                    'plugin_id':   plugin_module.get('plugin_id'),
+                    'plugin_name': plugin_module.get('name'),
+                }
+                break
+
+        # Set the priority score modification
+        priority_score_modification = data.get('priority_score', 0)
 
         return return_value, file_issues, priority_score_modification, decision_plugin
 
+    def should_file_be_added_to_task_list(self, path):
+        """
+        Test if this file needs to be added to the task list
+
+        :return:
+        """
+        return_value, file_issues = self.run_pre_checks(path)
+
+        # Only run checks with plugins if other tests were not conclusive
+        if return_value is not None:
+            return return_value, file_issues, 0, None
+
+        # Reuse the last plugin flow result if neither the file nor the library configuration has changed
+        file_stat, cached_result = self.lookup_decision(path)
+        if cached_result is not None:
+            return cached_result
+        result = self.run_plugin_tests(path, file_issues)
+        self.store_decision(path, file_stat, result)
+        return result
+
+    def get_decision_cache(self):
+        if self.decision_cache is None:
+            self.decision_cache = FileTestDecisionCache(self.library_id, Library(self.library_id).get_configuration_hash())
+        return self.decision_cache
+
+    def lookup_decision(self, path):
+        """
+        Stat a file and look up the cached result of its plugin tests.
+        Returns the stat result and the cached result (None on a cache miss).
+
+        :param path:
+        :return:
+        """
+        decision_cache = self.get_decision_cache()
+        file_stat = decision_cache.stat_file(path)
+        return file_stat, decision_cache.lookup(path, file_stat)
+
+    def store_decision(self, path, file_stat, result):
+        """
+        Cache the result of a file's plugin tests against the stat result taken before the tests were run
+
+        :param path:
+        :param file_stat:
+        :param result:
+        :return:
+        """
+        self.get_decision_cache().store(path, file_stat, result)
+
 
 class FileTesterThread(threading.Thread):
-    def __init__(self, name, files_to_test, files_to_process, status_updates, library_id, event, pause_flag=None):
+    """
+    FileTesterThread
+
+    Tests paths taken from the 'files_to_test' queue until an 'end_of_queue' sentinel is received.
+    Files that should be added to the task list are placed on the 'files_to_process' queue.
+
+    """
+
+    # Sentinel placed on the 'files_to_test' queue (once per thread) when no more files will be queued
+    end_of_queue = None
+
+    def __init__(self, name, files_to_test, files_to_process, progress, library_id, event, pause_flag=None,
+                 scan_index=None, use_processes=False, decision_cache=None):
         super(FileTesterThread, self).__init__(name=name)
         self.settings = config.Config()
         self.logger = UnmanicLogging.get_logger(name=__class__.__name__)
@@ -178,13 +263,19 @@ class FileTesterThread(threading.Thread):
         self.files_to_test = files_to_test
         self.files_to_process = files_to_process
         self.library_id = library_id
-        self.status_updates = status_updates
+        self.progress = progress
         self.abort_flag = threading.Event()
         self.abort_flag.clear()
         self.pause_flag = pause_flag
+        self.scan_index = scan_index
+        self.use_processes = use_processes
+        self.decision_cache = decision_cache
         self._testing_lock = threading.Lock()
         self._currently_testing = False
 
+    # Max number of files sent to a file test process at once
+    process_batch_size = 20
+
     def stop(self):
         self.abort_flag.set()
 
@@ -196,60 +287,169 @@ class FileTesterThread(threading.Thread):
         with self._testing_lock:
             return self._currently_testing
 
-    def run(self):
-        self.logger.info("Starting %s", self.name)
-        file_test = FileTest(self.library_id)
-        plugin_handler = PluginsHandler()
-        while not self.abort_flag.is_set():
-            if self.pause_flag is not None and self.pause_flag.is_set():
-                self._set_testing_state(False)
-                self.event.wait(.2)
-                continue
+    def __fetch_batch(self, batch_size):
+        """
+        Block until the first file is available, then take up to batch_size files that are already queued.
+        Returns the batch and a flag set when the end of queue sentinel was received.
+
+        :param batch_size:
+        :return:
+        """
+        batch = []
+        try:
+            # Block until a file is available. The timeout only allows the abort and pause flags to be checked
+            next_file = self.files_to_test.get(timeout=.5)
+        except queue.Empty:
+            return batch, False
+        if next_file is self.end_of_queue:
+            return batch, True
+        batch.append(next_file)
+        while len(batch) < batch_size:
             try:
-                # Pending task queue has an item available. Fetch it.
                 next_file = self.files_to_test.get_nowait()
-                self._set_testing_state(True)
-                self.status_updates.put(next_file)
             except queue.Empty:
-                self._set_testing_state(False)
-                self.event.wait(2)
-                continue
-            except Exception as e:
-                self.logger.exception("Exception in fetching library scan result for path %s:", self.name)
-                self._set_testing_state(False)
-                continue
+                break
+            if next_file is self.end_of_queue:
+                return batch, True
+            batch.append(next_file)
+        return batch, False
 
-            # Test file to be added to task list. Add it if required
-            try:
-                result, issues, priority_score, _ = file_test.should_file_be_added_to_task_list(next_file)
-                # Log any error messages
-                for issue in issues:
-                    if type(issue) is dict:
-                        self.logger.info(issue.get('message'))
+    def run(self):
+        self.logger.info("Starting %s", self.name)
+        file_test = FileTest(self.library_id, decision_cache=self.decision_cache)
+        plugin_handler = PluginsHandler()
+        file_test_process = None
+        batch_size = 1
+        if self.use_processes:
+            from unmanic.libs.filetestprocess import FileTestProcess
+            file_test_process = FileTestProcess(self.library_id, file_test.plugin_modules, abort_flag=self.abort_flag)
+            file_test_process.start()
+            batch_size = self.process_batch_size
+        try:
+            while not self.abort_flag.is_set():
+                if self.pause_flag is not None and self.pause_flag.is_set():
+                    self._set_testing_state(False)
+                    self.abort_flag.wait(.2)
+                    continue
+                try:
+                    batch, end_of_queue = self.__fetch_batch(batch_size)
+                except Exception as e:
+                    self.logger.exception("Exception in fetching library scan result for path %s:", self.name)
+                    continue
+                if batch:
+                    self._set_testing_state(True)
+                    if file_test_process is not None:
+                        self.__test_batch_in_process(batch, file_test, file_test_process, plugin_handler)
                     else:
-                        self.logger.info(issue)
-                # If file needs to be added, then add it
-                if result:
-                    self.add_path_to_queue({
-                        'path':           next_file,
-                        'priority_score': priority_score,
-                    })
-                    # Execute event plugin runners (only when added to queue)
-                    plugin_handler.run_event_plugins_for_plugin_type('events.file_queued', {
-                        'library_id':     self.library_id,
-                        'file_path':      next_file,
-                        'priority_score': priority_score,
-                        'issues':         issues,
-                    })
-
-            except UnicodeEncodeError:
-                self.logger.warning("File contains Unicode characters that cannot be processed. Ignoring.")
+                        for next_file in batch:
+                            self.__test_file(next_file, file_test.should_file_be_added_to_task_list, plugin_handler)
+                    self._set_testing_state(False)
+                if end_of_queue:
+                    break
+        finally:
+            if file_test_process is not None:
+                file_test_process.stop()
+
+        self.logger.info("Exiting %s", self.name)
+
+    def __test_batch_in_process(self, batch, file_test, file_test_process, plugin_handler):
+        """
+        Run the core checks in this thread and send the remaining files to the file test process for plugin tests.
+
+        :param batch:
+        :param file_test:
+        :param file_test_process:
+        :param plugin_handler:
+        :return:
+        """
+        results = {}
+        plugin_tests = []
+        file_stats = {}
+        for next_file in batch:
+            try:
+                return_value, file_issues = file_test.run_pre_checks(next_file)
+                if return_value is not None:
+                    results[next_file] = (return_value, file_issues, 0, None)
+                    continue
+                file_stat, cached_result = file_test.lookup_decision(next_file)
             except Exception as e:
                 self.logger.exception("Exception testing file path in %s. Ignoring.", self.name)
-            finally:
-                self._set_testing_state(False)
+                continue
+            if cached_result is not None:
+                results[next_file] = cached_result
+                continue
+            file_stats[next_file] = file_stat
+            plugin_tests.append((next_file, file_issues))
+        plugin_results = file_test_process.test_batch(plugin_tests)
+        if self.abort_flag.is_set():
+            return
+        for path, result in plugin_results.items():
+            file_test.store_decision(path, file_stats.get(path), result)
+        results.update(plugin_results)
+
+        def get_result(path):
+            if path not in results:
+                # The file test process failed or was aborted. Treat as not added so the file is tested next scan
+                raise RuntimeError("No file test result returned for path '{}'".format(path))
+            return results[path]
+
+        for next_file in batch:
+            self.__test_file(next_file, get_result, plugin_handler)
+
+    def __test_file(self, next_file, test_function, plugin_handler):
+        self.progress.start_file(next_file)
+
+        # Test file to be added to task list. Add it if required
+        result = False
+        settled = False
+        try:
+            result, issues, priority_score, _ = test_function(next_file)
+            settled = self.result_is_settled(result, issues)
+            # Log any error messages
+            for issue in issues:
+                if type(issue) is dict:
+                    self.logger.info(issue.get('message'))
+                else:
+                    self.logger.info(issue)
+            # If file needs to be added, then add it
+            if result:
+                self.add_path_to_queue({
+                    'path':           next_file,
+                    'priority_score': priority_score,
+                })
+                # Execute event plugin runners (only when added to queue)
+                plugin_handler.run_event_plugins_for_plugin_type('events.file_queued', {
+                    'library_id':     self.library_id,
+                    'file_path':      next_file,
+                    'priority_score': priority_score,
+                    'issues':         issues,
+                })
+
+        except UnicodeEncodeError:
+            self.logger.warning("File contains Unicode characters that cannot be processed. Ignoring.")
+        except Exception as e:
+            self.logger.exception("Exception testing file path in %s. Ignoring.", self.name)
+        finally:
+            if self.scan_index is not None:
+                self.scan_index.record_file_result(next_file, settled)
+            self.progress.finish_file(next_file, added=bool(result))
+
+    @staticmethod
+    def result_is_settled(result, issues):
+        """
+        Check if a file test result will hold for as long as the file itself does not change.
+        Files rejected by the ignore file or by a failure in history may be accepted later without being modified.
 
-        self.logger.info("Exiting %s", self.name)
+        :param result:
+        :param issues:
+        :return:
+        """
+        if result:
+            return False
+        for issue in issues:
+            if type(issue) is dict and issue.get('id') in ('unmanicignore', 'blacklisted'):
+                return False
+        return True
 
     def add_path_to_queue(self, item):
         self.files_to_process.put(item)
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.filetestcache.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import json
+import os
+import threading
+
+from unmanic.libs.logs import UnmanicLogging
+from unmanic.libs.unmodels import FileTestDecisions, Libraries
+
+
+class FileTestDecisionCache(object):
+    """
+    FileTestDecisionCache
+
+    Persistent cache of the results of a library's 'library_management.file_test' plugin flow.
+
+    Results are keyed on the file's path, size and mtime, and on the library configuration hash
+    (the enabled plugins, their versions and settings and the plugin flow). A file's plugins are only run again
+    when one of these changes, or when the path's results are removed with forget_paths().
+
+    File test plugins may also read state that is kept outside the file, such as its task history and file
+    metadata. Results for a path are removed when that state is written, and only results that do not add
+    the file to the task list are cached. Once a file has been processed, its plugins will be run again.
+
+    When buffered, new results are held in memory until flush() is called (or a chunk fills up).
+    """
+
+    # Number of rows written per insert statement
+    WRITE_CHUNK_SIZE = 100
+
+    def __init__(self, library_id: int, config_hash: str, buffered=False):
+        self.logger = UnmanicLogging.get_logger(name=__class__.__name__)
+        self.library_id = library_id
+        self.config_hash = config_hash
+        self.buffered = buffered
+        self._lock = threading.Lock()
+        self._pending_rows = []
+
+        self.hit_count = 0
+        self.miss_count = 0
+
+    @staticmethod
+    def clear(library_id: int):
+        """
+        Remove all cached file test results for a library
+
+        :param library_id:
+        :return:
+        """
+        return FileTestDecisions.delete().where(FileTestDecisions.library_id == library_id).execute()
+
+    @staticmethod
+    def forget_paths(paths):
+        """
+        Remove the cached file test results for the given paths in all libraries.
+        Called when a task is created or completed for a path, or when the metadata for a path is written.
+
+        :param paths:
+        :return:
+        """
+        paths = list(set(path for path in paths if path))
+        if not paths:
+            return 0
+        # Select by library ID as well so that the (library_id, path) index is used
+        library_ids = [library_id for (library_id,) in Libraries.select(Libraries.id).tuples()]
+        if not library_ids:
+            return 0
+        deleted = 0
+        for i in range(0, len(paths), FileTestDecisionCache.WRITE_CHUNK_SIZE):
+            query = FileTestDecisions.delete()
+            query = query.where(FileTestDecisions.library_id.in_(library_ids))
+            query = query.where(FileTestDecisions.path.in_(paths[i:i + FileTestDecisionCache.WRITE_CHUNK_SIZE]))
+            deleted += query.execute()
+        return deleted
+
+    @staticmethod
+    def stat_file(path):
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
+
+    def lookup(self, path, file_stat):
+        """
+        Return the cached (add_file_to_pending_tasks, issues, priority_score, decision_plugin) result
+        for a file, or None if there is no valid result
+
+        :param path:
+        :param file_stat:
+        :return:
+        """
+        if file_stat is None:
+            return None
+        query = FileTestDecisions.select(
+            FileTestDecisions.size,
+            FileTestDecisions.mtime_ns,
+            FileTestDecisions.config_hash,
+            FileTestDecisions.add_file_to_pending_tasks,
+            FileTestDecisions.issues,
+            FileTestDecisions.priority_score,
+            FileTestDecisions.decision_plugin,
+        )
+        query = query.where(FileTestDecisions.library_id == self.library_id)
+        query = query.where(FileTestDecisions.path == path)
+        row = query.tuples().first()
+        result = None
+        if row is not None:
+            size, mtime_ns, config_hash, add_file_to_pending_tasks, issues, priority_score, decision_plugin = row
+            if size == file_stat.st_size and mtime_ns == file_stat.st_mtime_ns and config_hash == self.config_hash:
+                try:
+                    result = (add_file_to_pending_tasks, json.loads(issues), priority_score, json.loads(decision_plugin))
+                except ValueError:
+                    result = None
+        with self._lock:
+            if result is None:
+                self.miss_count += 1
+            else:
+                self.hit_count += 1
+        return result
+
+    def store(self, path, file_stat, result):
+        """
+        Cache the (add_file_to_pending_tasks, issues, priority_score, decision_plugin) result for a file
+
+        :param path:
+        :param file_stat:
+        :param result:
+        :return:
+        """
+        if file_stat is None:
+            return
+        add_file_to_pending_tasks, issues, priority_score, decision_plugin = result
+        if add_file_to_pending_tasks:
+            # A file that is added to the task list will have a task history and may have metadata
+            # written for it that its plugins read the next time it is tested
+            return
+        try:
+            row = {
+                'library_id':                self.library_id,
+                'path':                      path,
+                'size':                      file_stat.st_size,
+                'mtime_ns':                  file_stat.st_mtime_ns,
+                'config_hash':               self.config_hash,
+                'add_file_to_pending_tasks': add_file_to_pending_tasks,
+                'issues':                    json.dumps(issues),
+                'priority_score':            int(priority_score or 0),
+                'decision_plugin':           json.dumps(decision_plugin),
+            }
+        except (TypeError, ValueError):
+            # Plugins may return issues that cannot be stored. Don't cache these results
+            return
+        with self._lock:
+            self._pending_rows.append(row)
+            if self.buffered and len(self._pending_rows) < self.WRITE_CHUNK_SIZE:
+                return
+        self.flush()
+
+    def flush(self):
+        """
+        Write all buffered results to the DB
+
+        :return:
+        """
+        with self._lock:
+            rows = self._pending_rows
+            self._pending_rows = []
+        for i in range(0, len(rows), self.WRITE_CHUNK_SIZE):
+            FileTestDecisions.insert_many(rows[i:i + self.WRITE_CHUNK_SIZE]).on_conflict_replace().execute()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.filetestprocess.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import multiprocessing
+
+from unmanic.libs.logs import UnmanicLogging
+
+
+def _file_test_child_entry(library_id, plugins_list, conn):
+    """
+    Runs inside the child process.
+    Loads the file test plugin modules once, then tests batches of paths received on the pipe until told to stop.
+
+    :param library_id:
+    :param plugins_list:
+    :param conn:
+    :return:
+    """
+    from unmanic.libs.filetest import FileTest
+    from unmanic.libs.unplugins import PluginExecutor
+
+    plugin_executor = PluginExecutor()
+    plugin_modules = plugin_executor.build_plugin_data_from_plugin_list_filtered_by_plugin_type(
+        plugins_list, 'library_management.file_test')
+    file_test = FileTest(library_id, plugin_modules=plugin_modules)
+
+    while True:
+        try:
+            batch = conn.recv()
+        except (EOFError, OSError):
+            break
+        if batch is None:
+            break
+        results = []
+        for path, file_issues in batch:
+            try:
+                results.append((path, file_test.run_plugin_tests(path, file_issues)))
+            except Exception as e:
+                # No result is returned for this path
+                file_test.logger.exception("Exception testing file path '%s' in file test process", path)
+        conn.send(results)
+    conn.close()
+
+
+class FileTestProcess(object):
+    """
+    FileTestProcess
+
+    A long-lived child process that runs the 'library_management.file_test' plugin flow for one library.
+    Allows CPU bound file test plugins to run in parallel without contending for the GIL.
+
+    Paths are sent in batches as (path, file_issues) tuples. For each path, the same
+    (add_file_to_pending_tasks, issues, priority_score, decision_plugin) result that
+    FileTest.run_plugin_tests() returns is sent back. Paths that raised an exception are left out.
+
+    """
+
+    def __init__(self, library_id, plugin_modules, abort_flag=None):
+        self.logger = UnmanicLogging.get_logger(name=__class__.__name__)
+        self.library_id = library_id
+        self.abort_flag = abort_flag
+        # Only pass plain plugin info to the child. It loads the plugin modules itself.
+        self.plugins_list = []
+        for plugin_module in plugin_modules:
+            self.plugins_list.append({
+                'plugin_id':   plugin_module.get('plugin_id'),
+                'name':        plugin_module.get('name'),
+                'author':      plugin_module.get('author'),
+                'version':     plugin_module.get('version'),
+                'icon':        plugin_module.get('icon'),
+                'description': plugin_module.get('description'),
+            })
+        self._proc = None
+        self._conn = None
+
+    def start(self):
+        parent_conn, child_conn = multiprocessing.Pipe()
+        self._proc = multiprocessing.Process(
+            target=_file_test_child_entry,
+            args=(self.library_id, self.plugins_list, child_conn),
+            daemon=True
+        )
+        self._proc.start()
+        child_conn.close()
+        self._conn = parent_conn
+        self.logger.debug("Started file test process PID %s for library ID %s", self._proc.pid, self.library_id)
+
+    def stop(self):
+        if self._conn is not None:
+            try:
+                self._conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        if self._proc is not None:
+            self._proc.join(2)
+            if self._proc.is_alive():
+                self._proc.terminate()
+                self._proc.join(2)
+        if self._conn is not None:
+            self._conn.close()
+        self._proc = None
+        self._conn = None
+
+    def is_alive(self):
+        return self._proc is not None and self._proc.is_alive()
+
+    def test_batch(self, batch):
+        """
+        Test a batch of (path, file_issues) tuples.
+        Returns a dictionary of results keyed by path.
+        If the child process dies or the abort flag is set, the batch results are empty and
+        the process is restarted for the next batch.
+
+        :param batch:
+        :return:
+        """
+        if not batch:
+            return {}
+        if not self.is_alive():
+            self.stop()
+            self.start()
+        try:
+            self._conn.send(batch)
+            # Wait for the results, watching for aborts and the child exiting
+            while not self._conn.poll(.2):
+                if self.abort_flag is not None and self.abort_flag.is_set():
+                    self.stop()
+                    return {}
+                if not self._proc.is_alive():
+                    raise EOFError("File test process exited with code {}".format(self._proc.exitcode))
+            return dict(self._conn.recv())
+        except (EOFError, OSError) as e:
+            self.logger.error("File test process for library ID %s failed: %s", self.library_id, e)
+            self.stop()
+            return {}
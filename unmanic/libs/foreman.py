@@ -37,10 +37,12 @@ import time
 from datetime import datetime, timedelta
 
 from unmanic.libs import common, installation_link
+from unmanic.libs.configversion import ConfigVersion
 from unmanic.libs.frontend_push_messages import FrontendPushMessages
 from unmanic.libs.library import Library
 from unmanic.libs.logs import UnmanicLogging
 from unmanic.libs.plugins import PluginsHandler
+from unmanic.libs.task import TaskStatusCounters
 from unmanic.libs.worker_group import WorkerGroup
 from unmanic.libs.workers import Worker
 
@@ -57,15 +59,27 @@ class Foreman(threading.Thread):
         self.remote_workers_pending_task_queue = queue.Queue(maxsize=1)
         self.complete_queue = queue.Queue()
         self.worker_threads = {}
+        self.total_worker_count = None
         self.paused_worker_threads = []
         self.remote_task_manager_threads = {}
         self.abort_flag = threading.Event()
         self.abort_flag.clear()
 
+        # Signals that wake the dispatch loop, with the time each was first received
+        self.dispatch_flag = threading.Event()
+        self.dispatch_lock = threading.Lock()
+        self.dispatch_signals = {}
+
+        # Flag to force checking for idle remote workers when set to False.
+        # This will prevent always looping on idle local workers when the local worker's
+        # tags prevent them from taking up tasks
+        self.allow_local_idle_worker_check = True
+
         # Set the current plugin config
         self.current_config = {
-            'settings':      {},
-            'settings_hash': ''
+            'settings':       {},
+            'settings_hash':  '',
+            'config_version': None,
         }
         self.configuration_changed()
 
@@ -76,6 +90,10 @@ class Foreman(threading.Thread):
         self.link_heartbeat_last_run = 0
         self.available_remote_managers = {}
 
+        # Wake when tasks are queued or leave the post-processor, and when the configuration changes
+        TaskStatusCounters().add_listener(self.task_status_changed)
+        ConfigVersion().add_listener(self.config_version_changed)
+
     def stop(self):
         self.paused_worker_threads = []
         self.abort_flag.set()
@@ -89,9 +107,13 @@ class Foreman(threading.Thread):
         thread_keys = [t for t in self.remote_task_manager_threads]
         for thread in thread_keys:
             self.mark_remote_task_manager_thread_as_redundant(thread)
+        self.signal_dispatch('stop')
 
     def get_total_worker_count(self):
         """Returns the worker count as an integer"""
+        # Use the count recorded by the last call to init_worker_threads()
+        if self.total_worker_count is not None:
+            return self.total_worker_count
         worker_count = 0
         for worker_group in WorkerGroup.get_all_worker_groups():
             worker_count += worker_group.get('number_of_workers', 0)
@@ -132,6 +154,11 @@ class Foreman(threading.Thread):
         return all_plugin_settings
 
     def configuration_changed(self):
+        # The library configuration only needs to be read and hashed again after the configuration version changes
+        config_version = ConfigVersion().get()
+        if config_version == self.current_config.get('config_version'):
+            return False
+        self.current_config['config_version'] = config_version
         current_settings = self.get_current_library_configuration()
         # Compare current settings with foreman recorded settings.
         json_encoded_settings = json.dumps(current_settings, sort_keys=True).encode()
@@ -258,8 +285,10 @@ class Foreman(threading.Thread):
         # Check that we have enough workers running. Spawn new ones as required.
         worker_group_ids = []
         worker_group_names = []
+        total_worker_count = 0
         for worker_group in WorkerGroup.get_all_worker_groups():
             worker_group_ids.append(worker_group.get('id'))
+            total_worker_count += worker_group.get('number_of_workers', 0)
 
             # Create threads as required
             for i in range(worker_group.get('number_of_workers')):
@@ -288,6 +317,8 @@ class Foreman(threading.Thread):
                 if self.worker_threads[thread].idle:
                     self.mark_worker_thread_as_redundant(thread)
 
+        self.total_worker_count = int(total_worker_count)
+
     def fetch_available_remote_installation(self, library_name=None):
         # Fetch the first matching remote worker from the list
         assigned_installation_id = None
@@ -417,7 +448,8 @@ class Foreman(threading.Thread):
 
     def start_worker_thread(self, worker_id, worker_name, worker_group):
         thread = Worker(worker_id, worker_name, worker_group, self.workers_pending_task_queue,
-                        self.complete_queue, self.event)
+                        self.complete_queue, self.event,
+                        idle_callback=lambda: self.signal_dispatch('worker_idle'))
         thread.daemon = True
         thread.start()
         self.worker_threads[worker_id] = thread
@@ -469,7 +501,7 @@ class Foreman(threading.Thread):
         # Include a count of all available and busy remote workers for the postprocessor queue limit
         limit += len(self.available_remote_managers)
         limit += len(self.remote_task_manager_threads)
-        current_count = len(self.task_queue.list_processed_tasks())
+        current_count = self.task_queue.task_list_processed_count()
         if current_count > limit:
             msg = "There are currently {} items in the post-processor queue. Halting feeding workers until it drops below {}."
             self.logger.warning(msg.format(current_count, limit))
@@ -503,6 +535,7 @@ class Foreman(threading.Thread):
         if not self.worker_threads[worker_id].paused_flag.is_set():
             self.logger.debug('Asked to pause Worker ID %s', worker_id)
             self.worker_threads[worker_id].paused_flag.set()
+            self.worker_threads[worker_id].wake()
             if record_paused and worker_id not in self.paused_worker_threads:
                 self.paused_worker_threads.append(worker_id)
         return True
@@ -539,6 +572,7 @@ class Foreman(threading.Thread):
             return False
 
         self.worker_threads[worker_id].paused_flag.clear()
+        self.worker_threads[worker_id].wake()
         if worker_id in self.paused_worker_threads:
             self.paused_worker_threads.remove(worker_id)
         return True
@@ -583,6 +617,7 @@ class Foreman(threading.Thread):
 
     def mark_worker_thread_as_redundant(self, worker_id):
         self.worker_threads[worker_id].redundant_flag.set()
+        self.worker_threads[worker_id].wake()
 
     def mark_remote_task_manager_thread_as_redundant(self, link_manager_id):
         self.remote_task_manager_threads[link_manager_id].redundant_flag.set()
@@ -641,31 +676,225 @@ class Foreman(threading.Thread):
         # Mark this as the last time run
         self.link_heartbeat_last_run = time_now
 
+    def signal_dispatch(self, reason):
+        """
+        Wake the Foreman dispatch loop.
+        The reason is one of 'worker_idle', 'task_queued', 'task_completed', 'config_changed' or 'stop'.
+        The time of the first signal since the loop last woke is recorded to measure the dispatch latency.
+
+        :param reason:
+        :return:
+        """
+        with self.dispatch_lock:
+            self.dispatch_signals.setdefault(reason, time.monotonic())
+        self.dispatch_flag.set()
+
+    def wait_for_dispatch_signal(self, timeout):
+        """
+        Block until signal_dispatch() is called or the timeout expires.
+        Returns a dictionary of the signals received along with the time each was first received.
+
+        :param timeout:
+        :return:
+        """
+        self.dispatch_flag.wait(timeout=timeout)
+        with self.dispatch_lock:
+            self.dispatch_flag.clear()
+            signals = self.dispatch_signals
+            self.dispatch_signals = {}
+        return signals
+
+    def task_status_changed(self, status):
+        """
+        Listener for the task status counters. Wakes the dispatch loop when there is new work,
+        or when a task leaves the post-processor queue.
+
+        :param status:
+        :return:
+        """
+        if status == 'pending':
+            self.signal_dispatch('task_queued')
+        elif status == 'complete':
+            self.signal_dispatch('task_completed')
+
+    def config_version_changed(self, config_version):
+        """
+        Listener for the configuration version. Wakes the dispatch loop to validate the new configuration.
+
+        :param config_version:
+        :return:
+        """
+        self.signal_dispatch('config_changed')
+
+    @staticmethod
+    def seconds_until_next_schedule_boundary():
+        """
+        Worker event schedules are set to the minute. Returns the number of seconds until the start of the next minute.
+
+        :return:
+        """
+        now = datetime.now()
+        return 60 - now.second - (now.microsecond / 1000000)
+
+    def collect_completed_tasks(self):
+        """
+        Fetch all completed tasks from workers and mark them as processed
+
+        :return:
+        """
+        while not self.abort_flag.is_set():
+            try:
+                task_item = self.complete_queue.get_nowait()
+                task_item.set_status('processed')
+            except queue.Empty:
+                return
+            except Exception as e:
+                self.logger.exception('Exception when fetching completed task report from worker %s', e)
+
+    def dispatch_next_pending_task(self, signals):
+        """
+        Hand the next pending task to an idle local worker or an available remote installation.
+        Returns True if a task was handed out.
+
+        :param signals:
+        :return:
+        """
+        # Check if we are able to start up a worker for another encoding job
+        # This queue holds only one task at a time and is used to hand tasks to the remote task manager threads
+        if self.remote_workers_pending_task_queue.full():
+            # In order to simplify the process and run the foreman management in a single thread, if this is
+            # full, it means the thread that is assigned to pick up the item has not done so.
+            # In order to prevent a second thread starting and taking the first thread's task, we should not
+            # process any more pending tasks until that first thread is ready and has taken its task out of the
+            # queue.
+            return False
+
+        # Check if there are any free workers
+        worker_ids = []
+        if self.allow_local_idle_worker_check and self.check_for_idle_workers():
+            # Local workers are available
+            process_local = True
+            # For local workers, process either local tasks or tasks provided from a remote installation
+            get_local_pending_tasks_only = False
+            # Specify the worker ID that will handle the next task
+            worker_ids = self.fetch_available_worker_ids()
+            # If not workers were available (possibly due to being recycled), wait for the next signal
+            if not worker_ids:
+                return False
+        elif self.check_for_idle_remote_workers():
+            self.allow_local_idle_worker_check = True
+            # Remote workers are available
+            process_local = False
+            # For remote workers, only process local tasks. Don't hand remote tasks to another remote installation
+            get_local_pending_tasks_only = True
+        else:
+            self.allow_local_idle_worker_check = True
+            # All workers are currently busy. Wait for one to go idle
+            return False
+
+        # Check if postprocessor task queue is full
+        if self.postprocessor_queue_full():
+            return False
+
+        # Fetch the next item in the queue
+        available_worker_id = None
+        next_item_to_process = None
+        if process_local:
+            # For local processing, ensure tags match the available library and worker
+            for worker_id in worker_ids:
+                try:
+                    library_tags = self.get_tags_configured_for_worker(worker_id)
+                except Exception as e:
+                    # This will happen if the worker group is deleted
+                    self.logger.debug('Error while fetching the tags for the configured worker: %s', str(e))
+                    # Break this fore loop. The main while loop wil clean up these workers on the next pass
+                    break
+                next_item_to_process = self.task_queue.get_next_pending_tasks(
+                    local_only=get_local_pending_tasks_only,
+                    library_tags=library_tags)
+                if next_item_to_process:
+                    available_worker_id = worker_id
+                    break
+            # If no local worker ID was assigned to the given item, then check the remote workers next
+            if not available_worker_id:
+                self.allow_local_idle_worker_check = False
+                return False
+        else:
+            # For remote items, run a search matching an available remote installation library
+            remote_library_names = self.get_available_remote_library_names()
+            next_item_to_process = self.task_queue.get_next_pending_tasks(local_only=get_local_pending_tasks_only,
+                                                                          library_names=remote_library_names)
+
+        if not next_item_to_process:
+            return False
+
+        try:
+            source_abspath = next_item_to_process.get_source_abspath()
+            task_library_name = next_item_to_process.get_task_library_name()
+        except Exception as e:
+            self.logger.exception('Exception in fetching task details %s', e)
+            return False
+
+        self.logger.info('Processing item - %s', str(source_abspath))
+        success = self.hand_task_to_workers(next_item_to_process, local=process_local,
+                                            library_name=task_library_name,
+                                            worker_id=available_worker_id)
+        if not success:
+            self.logger.warning("Re-queueing tasks. Unable to find worker capable of processing task '%s'",
+                                next_item_to_process.get_source_abspath())
+            # Re-queue item at the bottom
+            self.task_queue.requeue_tasks_at_bottom(next_item_to_process.get_task_id())
+            return False
+
+        # Record the time from the signal that woke the loop to the task being handed out
+        signalled_at = min(signals.values()) if signals else None
+        if signalled_at is not None:
+            UnmanicLogging.metric("foreman_task_dispatched",
+                                  task_id=next_item_to_process.get_task_id(),
+                                  worker_id=available_worker_id if process_local else 'remote',
+                                  signals=",".join(sorted(signals)),
+                                  dispatch_latency_ms=round((time.monotonic() - signalled_at) * 1000, 3),
+                                  )
+        return True
+
+    def dispatch_pending_tasks(self, signals):
+        """
+        Hand out pending tasks until there are no more pending tasks or no more available workers.
+
+        :param signals:
+        :return:
+        """
+        attempts_without_dispatch = 0
+        while not self.abort_flag.is_set() and not self.task_queue.task_list_pending_is_empty():
+            # Check the status of all link manager threads (close dead ones)
+            self.link_manager_tread_heartbeat()
+
+            if self.dispatch_next_pending_task(signals):
+                attempts_without_dispatch = 0
+                continue
+            # Allow a second attempt so that remote workers are checked when the
+            # tags of the idle local workers prevent them from taking up the pending tasks
+            attempts_without_dispatch += 1
+            if attempts_without_dispatch > 1:
+                return
+
     def run(self):
         self.logger.info('Starting Foreman Monitor loop')
 
-        # Flag to force checking for idle remote workers when set to False.
-        # This will prevent always looping on idle local workers when the local worker's
-        # tags prevent them from taking up tasks
-        allow_local_idle_worker_check = True
-
         last_metrics_time = 0
         metrics_interval = 2
+        wait_timeout = 0
 
         while not self.abort_flag.is_set():
-            self.event.wait(2)
+            # Sleep until a worker goes idle, a task is queued or configuration changes.
+            # Otherwise, wake for periodic checks and at each worker event schedule boundary.
+            signals = self.wait_for_dispatch_signal(wait_timeout)
+            if self.abort_flag.is_set():
+                break
 
             try:
                 # Fetch all completed tasks from workers
-                while not self.abort_flag.is_set() and not self.complete_queue.empty():
-                    self.event.wait(.5)
-                    try:
-                        task_item = self.complete_queue.get_nowait()
-                        task_item.set_status('processed')
-                    except queue.Empty:
-                        continue
-                    except Exception as e:
-                        self.logger.exception('Exception when fetching completed task report from worker %s', e)
+                self.collect_completed_tasks()
 
                 # Set up the correct number of workers
                 if not self.abort_flag.is_set():
@@ -676,6 +905,8 @@ class Foreman(threading.Thread):
                 if not valid_config:
                     # Pause all workers
                     self.pause_all_worker_threads(record_paused=True)
+                    # Check again shortly
+                    wait_timeout = 2
                     continue
                 elif self.paused_worker_threads:
                     # for thread in self.worker_threads:
@@ -707,101 +938,15 @@ class Foreman(threading.Thread):
                 # Manage worker event schedules
                 self.manage_event_schedules()
 
-                if not self.abort_flag.is_set() and not self.task_queue.task_list_pending_is_empty():
-
-                    # Check the status of all link manager threads (close dead ones)
-                    self.link_manager_tread_heartbeat()
-
-                    # Check if we are able to start up a worker for another encoding job
-                    # These queues holds only one task at a time and is used to hand tasks to the workers
-                    if self.workers_pending_task_queue.full() or self.remote_workers_pending_task_queue.full():
-                        # In order to simplify the process and run the foreman management in a single thread, if either of
-                        # these are full, it means the thread that is assigned to pick up the item has not done so.
-                        # In order to prevent a second thread starting and taking the first thread's task, we should not
-                        # process any more pending tasks until that first thread is ready and has taken its task out of the
-                        # queue.
-                        continue
-
-                    # Check if there are any free workers
-                    worker_ids = []
-                    if allow_local_idle_worker_check and self.check_for_idle_workers():
-                        # Local workers are available
-                        process_local = True
-                        # For local workers, process either local tasks or tasks provided from a remote installation
-                        get_local_pending_tasks_only = False
-                        # Specify the worker ID that will handle the next task
-                        worker_ids = self.fetch_available_worker_ids()
-                        # If not workers were available (possibly due to being recycled), just continue loop
-                        if not worker_ids:
-                            continue
-                    elif self.check_for_idle_remote_workers():
-                        allow_local_idle_worker_check = True
-                        # Remote workers are available
-                        process_local = False
-                        # For remote workers, only process local tasks. Don't hand remote tasks to another remote installation
-                        get_local_pending_tasks_only = True
-                    else:
-                        allow_local_idle_worker_check = True
-                        # All workers are currently busy
-                        self.event.wait(1)
-                        continue
-
-                    # Check if postprocessor task queue is full
-                    if self.postprocessor_queue_full():
-                        self.event.wait(5)
-                        continue
-
-                    # Fetch the next item in the queue
-                    available_worker_id = None
-                    next_item_to_process = None
-                    if process_local:
-                        # For local processing, ensure tags match the available library and worker
-                        for worker_id in worker_ids:
-                            try:
-                                library_tags = self.get_tags_configured_for_worker(worker_id)
-                            except Exception as e:
-                                # This will happen if the worker group is deleted
-                                self.logger.debug('Error while fetching the tags for the configured worker: %s', str(e))
-                                # Break this fore loop. The main while loop wil clean up these workers on the next pass
-                                break
-                            next_item_to_process = self.task_queue.get_next_pending_tasks(
-                                local_only=get_local_pending_tasks_only,
-                                library_tags=library_tags)
-                            if next_item_to_process:
-                                available_worker_id = worker_id
-                                break
-                        # If no local worker ID was assigned to the given item, then try again in 2 seconds
-                        if not available_worker_id:
-                            allow_local_idle_worker_check = False
-                            self.event.wait(1)
-                            continue
-                    else:
-                        # For remote items, run a search matching an available remote installation library
-                        remote_library_names = self.get_available_remote_library_names()
-                        next_item_to_process = self.task_queue.get_next_pending_tasks(local_only=get_local_pending_tasks_only,
-                                                                                      library_names=remote_library_names)
-
-                    if next_item_to_process:
-                        try:
-                            source_abspath = next_item_to_process.get_source_abspath()
-                            task_library_name = next_item_to_process.get_task_library_name()
-                        except Exception as e:
-                            self.logger.exception('Exception in fetching task details %s', e)
-                            self.event.wait(3)
-                            continue
-
-                        self.logger.info('Processing item - %s', str(source_abspath))
-                        success = self.hand_task_to_workers(next_item_to_process, local=process_local,
-                                                            library_name=task_library_name,
-                                                            worker_id=available_worker_id)
-                        if not success:
-                            self.logger.warning("Re-queueing tasks. Unable to find worker capable of processing task '%s'",
-                                                next_item_to_process.get_source_abspath())
-                            # Re-queue item at the bottom
-                            self.task_queue.requeue_tasks_at_bottom(next_item_to_process.get_task_id())
+                # Hand out as many pending tasks as possible
+                self.dispatch_pending_tasks(signals)
+
+                wait_timeout = min(metrics_interval, self.seconds_until_next_schedule_boundary())
             except Exception as e:
                 raise Exception(e)
 
+        TaskStatusCounters().remove_listener(self.task_status_changed)
+        ConfigVersion().remove_listener(self.config_version_changed)
         self.logger.info('Leaving Foreman Monitor loop...')
 
     def get_all_worker_status(self):
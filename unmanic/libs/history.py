@@ -32,12 +32,16 @@
 
 import os
 import json
+import threading
+from collections import Counter
 from operator import attrgetter
 
 from unmanic import config
 from unmanic.libs import common
 from unmanic.libs.logs import UnmanicLogging
+from unmanic.libs.singleton import SingletonType
 from unmanic.libs.unmodels import CompletedTasks, CompletedTasksCommandLogs
+from unmanic.libs.unmodels.searchindexes import contains_search_value
 
 try:
     from json.decoder import JSONDecodeError
@@ -45,6 +49,76 @@ except ImportError:
     JSONDecodeError = ValueError
 
 
+class FailedPathsIndex(object, metaclass=SingletonType):
+    """
+    FailedPathsIndex
+
+    Process-wide index of the source paths of failed historic tasks.
+    Loaded from the database on first use, then kept up to date as failed tasks are
+    recorded or deleted so that checking a path does not depend on the size of the history.
+    """
+
+    def __init__(self):
+        self.logger = UnmanicLogging.get_logger(name=__class__.__name__)
+        self._lock = threading.Lock()
+        # Count of failed historic tasks for each path
+        self._failed_paths = None
+
+    def __load(self):
+        failed_paths = Counter()
+        query = CompletedTasks.select(CompletedTasks.abspath)
+        query = query.where(CompletedTasks.task_success.in_([False]))
+        for (abspath,) in query.tuples():
+            failed_paths[abspath] += 1
+        self.logger.debug("Loaded %s failed historic task paths", len(failed_paths))
+        return failed_paths
+
+    def contains(self, path):
+        """
+        Check if a path has failed in history
+
+        :param path:
+        :return:
+        """
+        with self._lock:
+            if self._failed_paths is None:
+                self._failed_paths = self.__load()
+            return path in self._failed_paths
+
+    def add(self, path):
+        """
+        Record a new failed historic task for a path
+
+        :param path:
+        :return:
+        """
+        with self._lock:
+            if self._failed_paths is not None:
+                self._failed_paths[path] += 1
+
+    def remove(self, path):
+        """
+        Remove a deleted failed historic task for a path
+
+        :param path:
+        :return:
+        """
+        with self._lock:
+            if self._failed_paths is not None and path in self._failed_paths:
+                self._failed_paths[path] -= 1
+                if self._failed_paths[path] <= 0:
+                    del self._failed_paths[path]
+
+    def reset(self):
+        """
+        Discard the index. It will be reloaded from the database on next use.
+
+        :return:
+        """
+        with self._lock:
+            self._failed_paths = None
+
+
 class History(object):
     """
     History
@@ -89,7 +163,7 @@ class History(object):
                 query = query.where(CompletedTasks.id.in_(id_list))
 
             if search_value:
-                query = query.where(CompletedTasks.task_label.contains(search_value))
+                query = query.where(contains_search_value(CompletedTasks.task_label, search_value))
 
             if task_success is not None:
                 query = query.where(CompletedTasks.task_success.in_([task_success]))
@@ -169,7 +243,7 @@ class History(object):
             query = query.where(CompletedTasks.id.in_(id_list))
 
         if search_value:
-            query = query.where(CompletedTasks.task_label.contains(search_value))
+            query = query.where(contains_search_value(CompletedTasks.task_label, search_value))
 
         if task_success is not None:
             query = query.where(CompletedTasks.task_success.in_([task_success]))
@@ -214,6 +288,7 @@ class History(object):
             if id_list:
                 query = query.where(CompletedTasks.id.in_(id_list))
 
+            failed_paths_index = FailedPathsIndex()
             for historic_task_id in query:
                 try:
                     historic_task_id.delete_instance(recursive=True)
@@ -221,6 +296,8 @@ class History(object):
                     # Catch delete exceptions
                     self.logger.exception("An error occurred while deleting historic task ID: %s.", historic_task_id)
                     return False
+                if not historic_task_id.task_success:
+                    failed_paths_index.remove(historic_task_id.abspath)
 
             return True
 
@@ -259,26 +336,39 @@ class History(object):
         try:
             # Create the new historical task entry
             new_historic_task = self.create_historic_task_entry(task_data)
+            if not new_historic_task.task_success:
+                FailedPathsIndex().add(new_historic_task.abspath)
             # Create an entry of the data from the source ffprobe
-            self.create_historic_task_ffmpeg_log_entry(new_historic_task, task_data.get('log', ''))
+            self.create_historic_task_ffmpeg_log_entry(new_historic_task, task_data.get('log', ''),
+                                                       log_chunks=task_data.get('log_chunks'))
         except Exception as error:
             self.logger.exception("Failed to save historic task entry to database. %s", error)
             return False
         return True
 
     @staticmethod
-    def create_historic_task_ffmpeg_log_entry(historic_task, log):
+    def create_historic_task_ffmpeg_log_entry(historic_task, log, log_chunks=None):
         """
         Create an entry of the stdout log from the ffmpeg command
 
+        If an iterable of log_chunks is given, each chunk is appended to the entry in turn
+        so that a large log never needs to be held in memory as a single string.
+
         :param historic_task:
         :param log:
+        :param log_chunks:
         :return:
         """
-        CompletedTasksCommandLogs.create(
+        command_log = CompletedTasksCommandLogs.create(
             completedtask_id=historic_task,
             dump=log
         )
+        if log_chunks is None:
+            return
+        for chunk in log_chunks:
+            query = CompletedTasksCommandLogs.update(dump=CompletedTasksCommandLogs.dump.concat(chunk))
+            query = query.where(CompletedTasksCommandLogs.id == command_log.id)
+            query.execute()
 
     def create_historic_task_entry(self, task_data):
         """
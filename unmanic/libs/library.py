@@ -29,10 +29,13 @@
            OR OTHER DEALINGS IN THE SOFTWARE.
 
 """
+import hashlib
+import json
 import random
 
 from unmanic.config import Config
 from unmanic.libs import common
+from unmanic.libs.configversion import ConfigVersion
 from unmanic.libs.frontend_push_messages import FrontendPushMessages
 from unmanic.libs.unmodels import EnabledPlugins, Libraries, LibraryPluginFlow, Plugins, Tags, Tasks
 
@@ -74,6 +77,9 @@ class Library(object):
 
     """
 
+    # The configuration version and hash last calculated for each library ID
+    _configuration_hashes = {}
+
     def __init__(self, library_id: int):
         # Ensure library ID is not 0
         if library_id < 1:
@@ -190,6 +196,7 @@ class Library(object):
         if 'id' in data:
             del data['id']
         new_library = Libraries.create(**data)
+        ConfigVersion().bump('library.create')
         return Library(new_library.id)
 
     @staticmethod
@@ -229,6 +236,7 @@ class Library(object):
                 'enable_remote_only': library_config.get_enable_remote_only(),
                 'enable_scanner':     library_config.get_enable_scanner(),
                 'enable_inotify':     library_config.get_enable_inotify(),
+                'prefilters':         library_config.get_prefilters(),
                 'tags':               library_config.get_tags(),
             },
         }
@@ -268,6 +276,7 @@ class Library(object):
             task_module.TaskDataStore.clear_task(task_id)
 
         Tasks.delete().where(Tasks.library_id == self.model.id).execute()
+        task_module.TaskStatusCounters().reload()
 
     def get_id(self):
         return self.model.id
@@ -314,6 +323,18 @@ class Library(object):
     def set_priority_score(self, value):
         self.model.priority_score = value
 
+    def get_prefilters(self):
+        try:
+            prefilters = json.loads(self.model.prefilters or '{}')
+        except ValueError:
+            prefilters = {}
+        if not isinstance(prefilters, dict):
+            prefilters = {}
+        return prefilters
+
+    def set_prefilters(self, value):
+        self.model.prefilters = json.dumps(value or {})
+
     def get_tags(self):
         return_tags = []
         for tag in self.model.tags.order_by(Tags.name):
@@ -331,6 +352,7 @@ class Library(object):
         # Clear out the current linking table of tags linked to this library
         # Add new links for each tag that was fetched matching the provided names
         self.model.tags.add(tags_select_query, clear_existing=True)
+        ConfigVersion().bump('library.tags')
 
     def get_enabled_plugins(self, include_settings=False):
         """
@@ -402,6 +424,42 @@ class Library(object):
 
         return plugin_flow
 
+    def get_configuration_hash(self):
+        """
+        Return a hash of the library configuration that influences the results of file tests.
+        This includes the library path and prefilters, the enabled plugins with their versions, settings
+        and prefilters, and the plugin flow.
+        The hash is only calculated again after the configuration version changes.
+
+        :return:
+        """
+        config_version = ConfigVersion().get()
+        hashed_version, configuration_hash = Library._configuration_hashes.get(self.get_id(), (None, None))
+        if hashed_version == config_version:
+            return configuration_hash
+
+        from unmanic.libs.plugins import PluginsHandler
+        plugin_handler = PluginsHandler()
+        enabled_plugins = []
+        for enabled_plugin in self.get_enabled_plugins(include_settings=True):
+            plugin_info = plugin_handler.get_plugin_info(enabled_plugin.get('plugin_id'))
+            enabled_plugins.append({
+                'plugin_id':  enabled_plugin.get('plugin_id'),
+                'version':    plugin_info.get('version'),
+                'settings':   enabled_plugin.get('settings'),
+                'prefilters': plugin_info.get('prefilters'),
+            })
+        library_configuration = {
+            'path':            self.get_path(),
+            'prefilters':      self.get_prefilters(),
+            'enabled_plugins': enabled_plugins,
+            'plugin_flow':     self.get_plugin_flow(),
+        }
+        json_encoded_configuration = json.dumps(library_configuration, sort_keys=True, default=str).encode()
+        configuration_hash = hashlib.md5(json_encoded_configuration).hexdigest()
+        Library._configuration_hashes[self.get_id()] = (config_version, configuration_hash)
+        return configuration_hash
+
     def __set_default_plugin_flow_priority(self, plugin_list):
         from unmanic.libs.unplugins import PluginExecutor
         plugin_executor = PluginExecutor()
@@ -471,6 +529,7 @@ class Library(object):
 
         # Add default flow for newly added plugins
         self.__set_default_plugin_flow_priority(plugin_list)
+        ConfigVersion().bump('library.enabled_plugins')
 
     def save(self):
         """
@@ -480,6 +539,7 @@ class Library(object):
         """
         # Save changes made to model
         save_result = self.model.save()
+        ConfigVersion().bump('library.save')
 
         # If this is the default library path, save to config.library_path object also
         if self.get_id() == 1:
@@ -488,6 +548,18 @@ class Library(object):
 
         return save_result
 
+    def flush_file_test_cache(self):
+        """
+        Discard the cached file test results and the library scanner file index for this library.
+        Every file will be run through the file test plugins again on the next scan.
+
+        :return:
+        """
+        from unmanic.libs.filetestcache import FileTestDecisionCache
+        from unmanic.libs.libraryindex import LibraryScanIndex
+        FileTestDecisionCache.clear(self.get_id())
+        LibraryScanIndex.clear(self.get_id())
+
     def delete(self):
         """
         Delete the current library
@@ -511,5 +583,10 @@ class Library(object):
         # Delete all tasks with matching library_id
         self.__remove_associated_tasks()
 
+        # Remove the library scanner file index and cached file test results
+        self.flush_file_test_cache()
+
         # Remove the library entry
-        return self.model.delete_instance(recursive=True)
+        result = self.model.delete_instance(recursive=True)
+        ConfigVersion().bump('library.delete')
+        return result
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.libraryindex.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import json
+import os
+import threading
+import time
+
+from unmanic.libs.logs import UnmanicLogging
+from unmanic.libs.unmodels import LibraryFileIndex
+
+
+class LibraryScanIndex(object):
+    """
+    LibraryScanIndex
+
+    Persistent per-library record of the directories and files seen by the library scanner.
+
+    Files are keyed on (device, inode, size, mtime_ns). A file is "settled" once it has been run
+    through the file tests without being added to the task list. A directory is settled once every
+    file directly within it is settled. On a rescan, a settled directory with an unchanged stat key
+    is never listed again (only its known child directories are descended) and settled files with
+    an unchanged stat key are not tested again.
+
+    The index is discarded whenever the library configuration hash changes.
+
+    """
+
+    # Anything modified this close to the listing time may still change within the same mtime tick
+    RACY_WINDOW_NS = 2 * 1000 * 1000 * 1000
+    # Number of rows written per insert statement
+    WRITE_CHUNK_SIZE = 100
+
+    def __init__(self, library_id: int, config_hash: str):
+        self.logger = UnmanicLogging.get_logger(name=__class__.__name__)
+        self.library_id = library_id
+        self.config_hash = config_hash
+        self._lock = threading.RLock()
+
+        # Directory rows loaded from the DB
+        self._indexed_directories = {}
+        # Directories visited during this scan
+        self._seen_directories = set()
+        # Directories listed during this scan that are waiting on file test results
+        self._open_directories = {}
+        # Map of file paths waiting on a test result to their parent directory
+        self._pending_files = {}
+        # Directories with all file test results that are ready to be written
+        self._completed_directories = []
+
+        self.directories_unchanged_count = 0
+        self.files_unchanged_count = 0
+
+    @staticmethod
+    def clear(library_id: int):
+        """
+        Remove all index entries for a library
+
+        :param library_id:
+        :return:
+        """
+        return LibraryFileIndex.delete().where(LibraryFileIndex.library_id == library_id).execute()
+
+    @staticmethod
+    def stat_key(stat_result):
+        """
+        Return the index key for an os.stat_result
+
+        :param stat_result:
+        :return:
+        """
+        if stat_result is None:
+            return None
+        return stat_result.st_dev, stat_result.st_ino, stat_result.st_size, stat_result.st_mtime_ns
+
+    def load(self):
+        """
+        Load the directory index for this library.
+        If the library configuration has changed since the index was written, the index is discarded.
+
+        :return:
+        """
+        query = LibraryFileIndex.select(
+            LibraryFileIndex.path,
+            LibraryFileIndex.device,
+            LibraryFileIndex.inode,
+            LibraryFileIndex.size,
+            LibraryFileIndex.mtime_ns,
+            LibraryFileIndex.settled,
+            LibraryFileIndex.children,
+            LibraryFileIndex.config_hash,
+        )
+        query = query.where(LibraryFileIndex.library_id == self.library_id)
+        query = query.where(LibraryFileIndex.is_dir.in_([True]))
+
+        indexed_directories = {}
+        for path, device, inode, size, mtime_ns, settled, children, config_hash in query.tuples():
+            if config_hash != self.config_hash:
+                self.logger.info("Library configuration changed. Discarding file index for library ID %s",
+                                 self.library_id)
+                self.clear(self.library_id)
+                indexed_directories = {}
+                break
+            indexed_directories[path] = {
+                'key':      (device, inode, size, mtime_ns),
+                'settled':  settled,
+                'children': children,
+            }
+        with self._lock:
+            self._indexed_directories = indexed_directories
+
+    def directory_is_settled(self, path, dir_stat):
+        """
+        Check if a directory can be skipped without listing it.
+        Marks the directory as seen in this scan.
+
+        :param path:
+        :param dir_stat:
+        :return:
+        """
+        with self._lock:
+            self._seen_directories.add(path)
+            indexed = self._indexed_directories.get(path)
+            if not indexed or not indexed.get('settled'):
+                return False
+            if indexed.get('key') != self.stat_key(dir_stat):
+                return False
+            self.directories_unchanged_count += 1
+            return True
+
+    def get_child_directories(self, path):
+        """
+        Return the full paths of the indexed child directories of a directory
+
+        :param path:
+        :return:
+        """
+        with self._lock:
+            indexed = self._indexed_directories.get(path, {})
+        try:
+            children = json.loads(indexed.get('children', '[]'))
+        except Exception:
+            children = []
+        return [os.path.join(path, name) for name in children]
+
+    def get_indexed_files(self, path):
+        """
+        Return a dictionary of indexed files directly within a directory
+
+        :param path:
+        :return:
+        """
+        query = LibraryFileIndex.select(
+            LibraryFileIndex.path,
+            LibraryFileIndex.device,
+            LibraryFileIndex.inode,
+            LibraryFileIndex.size,
+            LibraryFileIndex.mtime_ns,
+            LibraryFileIndex.settled,
+        )
+        query = query.where(LibraryFileIndex.library_id == self.library_id)
+        query = query.where(LibraryFileIndex.parent == path)
+        query = query.where(LibraryFileIndex.is_dir.in_([False]))
+        indexed_files = {}
+        for file_path, device, inode, size, mtime_ns, settled in query.tuples():
+            indexed_files[file_path] = ((device, inode, size, mtime_ns), settled)
+        return indexed_files
+
+    def open_directory(self, path, dir_stat):
+        """
+        Start recording the listing of a directory
+
+        :param path:
+        :param dir_stat:
+        :return:
+        """
+        with self._lock:
+            self._seen_directories.add(path)
+            self._open_directories[path] = {
+                'key':         self.stat_key(dir_stat),
+                'children':    [],
+                'files':       {},
+                'outstanding': 0,
+                'listed':      False,
+                'listed_at':   time.time_ns(),
+                'settled':     True,
+            }
+
+    def add_file(self, directory, path, file_stat, indexed_files):
+        """
+        Add a file found while listing a directory.
+        Returns True if the file needs to be tested.
+
+        :param directory:
+        :param path:
+        :param file_stat:
+        :param indexed_files:
+        :return:
+        """
+        key = self.stat_key(file_stat)
+        with self._lock:
+            open_directory = self._open_directories[directory]
+            indexed_key, indexed_settled = indexed_files.get(path, (None, False))
+            if key is not None and indexed_settled and indexed_key == key:
+                open_directory['files'][path] = [key, True]
+                self.files_unchanged_count += 1
+                return False
+            open_directory['files'][path] = [key, False]
+            open_directory['outstanding'] += 1
+            self._pending_files[path] = directory
+            return True
+
+    def add_child_directory(self, directory, name):
+        with self._lock:
+            self._open_directories[directory]['children'].append(name)
+
+    def unsettle_directory(self, path):
+        """
+        Prevent a directory that is being listed from being marked as settled
+
+        :param path:
+        :return:
+        """
+        with self._lock:
+            self._open_directories[path]['settled'] = False
+
+    def close_directory(self, path):
+        """
+        Mark the listing of a directory as complete
+
+        :param path:
+        :return:
+        """
+        with self._lock:
+            open_directory = self._open_directories[path]
+            open_directory['listed'] = True
+            if open_directory['outstanding'] <= 0:
+                self._completed_directories.append(path)
+
+    def discard_directory(self, path):
+        """
+        Drop a directory that could not be listed
+
+        :param path:
+        :return:
+        """
+        with self._lock:
+            open_directory = self._open_directories.pop(path, None)
+            if open_directory:
+                for file_path in open_directory['files']:
+                    self._pending_files.pop(file_path, None)
+
+    def record_file_result(self, path, settled):
+        """
+        Record the result of testing a file
+
+        :param path:
+        :param settled:
+        :return:
+        """
+        with self._lock:
+            directory = self._pending_files.pop(path, None)
+            if directory is None:
+                return
+            open_directory = self._open_directories.get(directory)
+            if open_directory is None:
+                return
+            open_directory['files'][path][1] = bool(settled)
+            open_directory['outstanding'] -= 1
+            if open_directory['listed'] and open_directory['outstanding'] <= 0:
+                self._completed_directories.append(directory)
+
+    def __is_racy(self, key, listed_at):
+        return key is None or key[3] >= (listed_at - self.RACY_WINDOW_NS)
+
+    def flush(self):
+        """
+        Write all directories that have received every file test result to the DB
+
+        :return:
+        """
+        with self._lock:
+            completed = []
+            for path in self._completed_directories:
+                open_directory = self._open_directories.pop(path, None)
+                if open_directory:
+                    completed.append((path, open_directory))
+            self._completed_directories = []
+
+        for path, open_directory in completed:
+            listed_at = open_directory.get('listed_at')
+            directory_settled = open_directory.get('settled') and not self.__is_racy(open_directory.get('key'), listed_at)
+            file_rows = []
+            for file_path, (key, settled) in open_directory.get('files', {}).items():
+                if key is None:
+                    directory_settled = False
+                    continue
+                if settled and self.__is_racy(key, listed_at):
+                    settled = False
+                if not settled:
+                    directory_settled = False
+                file_rows.append({
+                    'library_id':  self.library_id,
+                    'path':        file_path,
+                    'parent':      path,
+                    'is_dir':      False,
+                    'device':      key[0],
+                    'inode':       key[1],
+                    'size':        key[2],
+                    'mtime_ns':    key[3],
+                    'settled':     settled,
+                    'config_hash': self.config_hash,
+                })
+
+            # Replace all file rows for this directory
+            query = LibraryFileIndex.delete()
+            query = query.where(LibraryFileIndex.library_id == self.library_id)
+            query = query.where(LibraryFileIndex.parent == path)
+            query = query.where(LibraryFileIndex.is_dir.in_([False]))
+            query.execute()
+            for i in range(0, len(file_rows), self.WRITE_CHUNK_SIZE):
+                LibraryFileIndex.insert_many(file_rows[i:i + self.WRITE_CHUNK_SIZE]).on_conflict_replace().execute()
+
+            dir_key = open_directory.get('key')
+            if dir_key is None:
+                continue
+            LibraryFileIndex.insert(
+                library_id=self.library_id,
+                path=path,
+                parent=os.path.dirname(path),
+                is_dir=True,
+                device=dir_key[0],
+                inode=dir_key[1],
+                size=dir_key[2],
+                mtime_ns=dir_key[3],
+                settled=directory_settled,
+                children=json.dumps(sorted(open_directory.get('children', []))),
+                config_hash=self.config_hash,
+            ).on_conflict_replace().execute()
+
+    def finish(self, complete=True):
+        """
+        Write any remaining results.
+        If the scan completed, also remove entries for directories that no longer exist.
+
+        :param complete:
+        :return:
+        """
+        self.flush()
+        if not complete:
+            return
+        with self._lock:
+            stale_directories = [p for p in self._indexed_directories if p not in self._seen_directories]
+        for i in range(0, len(stale_directories), self.WRITE_CHUNK_SIZE):
+            chunk = stale_directories[i:i + self.WRITE_CHUNK_SIZE]
+            query = LibraryFileIndex.delete()
+            query = query.where(LibraryFileIndex.library_id == self.library_id)
+            query = query.where(LibraryFileIndex.path.in_(chunk) | LibraryFileIndex.parent.in_(chunk))
+            query.execute()
@@ -30,7 +30,6 @@
 
 """
 import gc
-import json
 import os
 import queue
 import threading
@@ -40,13 +39,72 @@ import schedule
 
 from unmanic import config
 from unmanic.libs.filetest import FileTesterThread
+from unmanic.libs.filetestcache import FileTestDecisionCache
 from unmanic.libs.frontend_push_messages import FrontendPushMessages
 from unmanic.libs.library import Library
+from unmanic.libs.libraryindex import LibraryScanIndex
+from unmanic.libs.librarywalker import LibraryWalker
 from unmanic.libs.logs import UnmanicLogging
 from unmanic.libs.plugins import PluginsHandler
+from unmanic.libs.prefilters import LibraryPrefilters
+
+
+class LibraryScanProgress(object):
+    """
+    LibraryScanProgress
+
+    Thread-safe counters for a single library scan.
+    Updated by the file tester threads and read by the scanner to report progress.
+
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.files_discovered = 0
+        self.files_tested = 0
+        self.files_added = 0
+        self.current_file = ''
+
+    def file_discovered(self):
+        with self._lock:
+            self.files_discovered += 1
+
+    def start_file(self, path):
+        with self._lock:
+            self.current_file = path
+
+    def finish_file(self, path, added=False):
+        with self._lock:
+            self.files_tested += 1
+            if added:
+                self.files_added += 1
+
+    def get_status_message(self):
+        with self._lock:
+            if not self.files_discovered:
+                return ''
+            percent_completed = int((self.files_tested / self.files_discovered) * 100)
+            if not self.current_file:
+                return '{}%'.format(percent_completed)
+            return '{}% - Testing: {}'.format(percent_completed, self.current_file)
 
 
 class LibraryScannerManager(threading.Thread):
+    """
+    LibraryScannerManager
+
+    Runs scheduled and manually triggered library scans.
+
+    A scan is a bounded pipeline. The walker feeds discovered paths into the 'files_to_test' queue, the
+    FileTesterThread pool consumes them and places files that need processing onto 'files_to_process',
+    which the scanner forwards to the task handler. When the walk completes, one end-of-queue sentinel is
+    queued per tester and the scan is complete once every tester has exited and their results are drained.
+
+    """
+
+    # Maximum number of paths waiting to be tested. The walker blocks when this is full.
+    files_to_test_queue_size = 1000
+
     def __init__(self, data_queues, event):
         super(LibraryScannerManager, self).__init__(name='LibraryScannerManager')
         self.logger = UnmanicLogging.get_logger(name=__class__.__name__)
@@ -73,7 +131,7 @@ class LibraryScannerManager(threading.Thread):
         self.scheduler = schedule.Scheduler()
 
         self.file_test_managers = {}
-        self.files_to_test = queue.Queue()
+        self.files_to_test = queue.Queue(maxsize=self.files_to_test_queue_size)
         self.files_to_process = queue.Queue()
 
     def stop(self):
@@ -351,10 +409,12 @@ class LibraryScannerManager(threading.Thread):
             'priority_score': priority_score,
         })
 
-    def start_results_manager_thread(self, manager_id, status_updates, library_id):
+    def start_results_manager_thread(self, manager_id, progress, library_id, scan_index=None, decision_cache=None):
         manager = FileTesterThread("FileTesterThread-{}".format(manager_id), self.files_to_test,
-                                   self.files_to_process, status_updates, library_id, self.event,
-                                   pause_flag=self.scan_pause_flag)
+                                   self.files_to_process, progress, library_id, self.event,
+                                   pause_flag=self.scan_pause_flag, scan_index=scan_index,
+                                   use_processes=self.settings.get_enable_file_test_processes(),
+                                   decision_cache=decision_cache)
         manager.daemon = True
         manager.start()
         self.file_test_managers[manager_id] = manager
@@ -375,17 +435,57 @@ class LibraryScannerManager(threading.Thread):
             }
         )
 
-    def file_tests_in_progress(self):
+    def file_test_managers_alive(self):
         """
-        Check if any file tester threads are still processing a file.
+        Check if any file tester threads are still running.
 
         :return: bool
         """
         for manager in self.file_test_managers.values():
-            if getattr(manager, "is_testing_file", None) and manager.is_testing_file():
+            if manager.is_alive():
                 return True
         return False
 
+    def forward_files_to_process(self, library_id, timeout=None):
+        """
+        Forward the results from the file tester threads to the task handler.
+        If a timeout is given, block for up to that long waiting for the first result.
+
+        :param library_id:
+        :param timeout:
+        :return:
+        """
+        while True:
+            try:
+                if timeout:
+                    item = self.files_to_process.get(timeout=timeout)
+                    timeout = None
+                else:
+                    item = self.files_to_process.get_nowait()
+            except queue.Empty:
+                return
+            self.add_path_to_queue(item.get('path'), library_id, item.get('priority_score'))
+
+    def queue_file_to_test(self, file_path, library_id, frontend_messages, progress):
+        """
+        Place a path in the bounded 'files_to_test' queue.
+        Blocks while the queue is full, forwarding results so that the testers can keep draining it.
+
+        :param file_path:
+        :param library_id:
+        :param frontend_messages:
+        :param progress:
+        :return: False if the scan was cancelled
+        """
+        while True:
+            if not self.wait_if_paused_or_cancelled(frontend_messages, progress.get_status_message() or 'Library scan paused'):
+                return False
+            try:
+                self.files_to_test.put(file_path, timeout=.2)
+                return True
+            except queue.Full:
+                self.forward_files_to_process(library_id)
+
     def scan_library_path(self, library_name, library_path, library_id):
         """
         Run a scan of the given library path
@@ -406,12 +506,36 @@ class LibraryScannerManager(threading.Thread):
         self.clear_queue(self.files_to_test)
         self.clear_queue(self.files_to_process)
 
+        # Load the file index and the file test result cache for this library
+        config_hash = Library(library_id).get_configuration_hash()
+        scan_index = LibraryScanIndex(library_id, config_hash)
+        scan_index.load()
+        decision_cache = FileTestDecisionCache(library_id, config_hash, buffered=True)
+
+        # Compile the library and plugin prefilters. Files they reject are never passed to the file testers
+        plugin_modules = PluginsHandler().get_enabled_plugin_modules_by_type('library_management.file_test',
+                                                                             library_id=library_id)
+        prefilters = LibraryPrefilters.for_library(library_id, plugin_modules)
+        file_filter = None
+        if not prefilters.is_empty():
+            def prefilter_entry(entry):
+                def get_size():
+                    try:
+                        return entry.stat().st_size
+                    except OSError:
+                        return None
+
+                return prefilters.check(entry.path, get_size) is None
+
+            file_filter = prefilter_entry
+
         # Start X number of FileTesterThread threads
-        concurrent_file_testers = self.settings.get_concurrent_file_testers()
-        status_updates = queue.Queue()
+        concurrent_file_testers = max(1, int(self.settings.get_concurrent_file_testers()))
+        progress = LibraryScanProgress()
         self.file_test_managers = {}
-        for results_manager_id in range(int(concurrent_file_testers)):
-            self.start_results_manager_thread(results_manager_id, status_updates, library_id)
+        for results_manager_id in range(concurrent_file_testers):
+            self.start_results_manager_thread(results_manager_id, progress, library_id, scan_index=scan_index,
+                                              decision_cache=decision_cache)
 
         scan_start_time = time.time()
 
@@ -425,79 +549,52 @@ class LibraryScannerManager(threading.Thread):
             }
         )
 
+        # Feed the file testers from the walker
         follow_symlinks = self.settings.get_follow_symlinks()
-        total_file_count = 0
-        current_file = ''
-        percent_completed_string = ''
-        for root, subFolders, files in os.walk(library_path, followlinks=follow_symlinks):
-            if not self.wait_if_paused_or_cancelled(frontend_messages, percent_completed_string or 'Library scan paused'):
-                break
-            if self.settings.get_debugging():
-                self.logger.debug(json.dumps(files, indent=2))
-            # Add all files in this path that match our container filter
-            for file_path in files:
-                if not self.wait_if_paused_or_cancelled(frontend_messages, percent_completed_string or 'Library scan paused'):
+        walker = LibraryWalker(library_path, scan_index=scan_index, follow_symlinks=follow_symlinks,
+                               stop_event=self.scan_cancel_flag, pause_event=self.scan_pause_flag,
+                               file_filter=file_filter)
+        walk_completed = True
+        last_progress_update = 0
+        walked_files = walker.walk()
+        try:
+            for file_path in walked_files:
+                if not self.queue_file_to_test(file_path, library_id, frontend_messages, progress):
+                    walk_completed = False
                     break
-
-                # Place file's full path in queue to be tested
-                self.files_to_test.put(os.path.join(root, file_path))
-                total_file_count += 1
+                progress.file_discovered()
 
                 # Update status messages while fetching file list
-                if not status_updates.empty():
-                    current_file = status_updates.get()
-                    percent_completed_string = 'Testing: {}'.format(current_file)
-                    self.update_scan_progress(frontend_messages, percent_completed_string)
+                if time.time() - last_progress_update > 1:
+                    last_progress_update = time.time()
+                    self.update_scan_progress(frontend_messages, progress.get_status_message())
+                    self.forward_files_to_process(library_id)
+                    scan_index.flush()
+                    decision_cache.flush()
+        finally:
+            walked_files.close()
 
-        # Loop while waiting for all threads to finish
-        double_check = 0
-        while not self.abort_flag.is_set():
-            if not self.wait_if_paused_or_cancelled(frontend_messages, percent_completed_string or 'Library scan paused'):
-                break
-            self.update_scan_progress(frontend_messages, percent_completed_string)
-            # Check if all files have been tested
-            if self.files_to_test.empty() and self.files_to_process.empty() and status_updates.empty():
-                # Do not exit this loop until all tester threads report idle
-                if self.file_tests_in_progress():
-                    double_check = 0
-                    self.event.wait(.5)
-                    continue
-                percent_completed_string = '100%'
-                # Add a "double check" section.
-                # This is used to ensure that the loop does not prematurely exit when the last file tests still
-                # progressing that have not yet made it to the "files_to_process" queue.
-                double_check += 1
-                if double_check > 5:
-                    # There are not more files to test. Mark manager threads as completed
-                    self.stop_all_file_test_managers()
+        # Signal each tester that no more files are coming
+        if walk_completed:
+            for _ in self.file_test_managers:
+                if not self.queue_file_to_test(FileTesterThread.end_of_queue, library_id, frontend_messages, progress):
                     break
-                self.event.wait(1)
-                continue
 
-            # Calculate percent of files tested
-            if not self.files_to_test.empty():
-                current_queue_size = self.files_to_test.qsize()
-                if int(total_file_count) > 0 and int(current_queue_size) > 0:
-                    percent_remaining = int((int(current_queue_size) / int(total_file_count)) * 100)
-                    percent_completed = int(100 - percent_remaining)
-                    percent_completed_string = '{}% - Testing: {}'.format(percent_completed, current_file)
-                elif current_file:
-                    percent_completed_string = '{}% - Testing: {}'.format('???', current_file)
-
-            # Fetch frontend messages from queue
-            if not status_updates.empty():
-                current_file = status_updates.get()
-                percent_completed_string = 'Testing: {}'.format(current_file)
-                self.update_scan_progress(frontend_messages, percent_completed_string)
-                continue
-            elif not self.files_to_process.empty():
-                item = self.files_to_process.get()
-                self.add_path_to_queue(item.get('path'), library_id, item.get('priority_score'))
-                continue
-            else:
-                self.event.wait(.1)
+        # Wait for all testers to finish their queued files and exit
+        while not self.abort_flag.is_set():
+            if not self.wait_if_paused_or_cancelled(frontend_messages, progress.get_status_message() or 'Library scan paused'):
+                break
+            self.update_scan_progress(frontend_messages, progress.get_status_message())
+            # Write completed directories to the file index
+            scan_index.flush()
+            decision_cache.flush()
+            if not self.file_test_managers_alive():
+                # Testers put their results before exiting. Forward anything that remains and finish
+                self.forward_files_to_process(library_id)
+                break
+            self.forward_files_to_process(library_id, timeout=.5)
 
-        # Wait for threads to finish
+        # Stop any testers that are still running (if the scan was cancelled)
         for manager_id in self.file_test_managers:
             self.file_test_managers[manager_id].abort_flag.set()
             self.file_test_managers[manager_id].join(2)
@@ -506,6 +603,15 @@ class LibraryScannerManager(threading.Thread):
 
         self.clear_queue(self.files_to_test)
         self.clear_queue(self.files_to_process)
+        total_file_count = progress.files_discovered
+
+        # Save the file index. Stale entries are only removed when the whole library was walked
+        scan_completed = not self.scan_cancel_flag.is_set() and not self.abort_flag.is_set()
+        try:
+            scan_index.finish(complete=scan_completed)
+            decision_cache.flush()
+        except Exception as e:
+            self.logger.exception("Failed to update the file index for library '%s': %s", library_name, e)
 
         scan_end_time = time.time()
         scan_duration = str((scan_end_time - scan_start_time))
@@ -516,7 +622,14 @@ class LibraryScannerManager(threading.Thread):
                               library_id=library_id,
                               scan_start_time=scan_start_time,
                               scan_end_time=scan_end_time,
-                              scan_duration=scan_duration)
+                              scan_duration=scan_duration,
+                              files_scanned_count=total_file_count,
+                              files_unchanged_count=scan_index.files_unchanged_count,
+                              directories_unchanged_count=scan_index.directories_unchanged_count,
+                              directories_ignored_count=walker.directories_ignored_count,
+                              prefilter_rejected_counts=dict(prefilters.rejected_counts),
+                              file_test_cache_hit_count=decision_cache.hit_count,
+                              file_test_cache_miss_count=decision_cache.miss_count)
         UnmanicLogging.data("last_library_scan",
                             data_search_key=library_id,  # Key this metric by the library_id
                             library_name=library_name,
@@ -525,7 +638,13 @@ class LibraryScannerManager(threading.Thread):
                             scan_start_time=scan_start_time,
                             scan_end_time=scan_end_time,
                             scan_duration=scan_duration,
-                            files_scanned_count=total_file_count)
+                            files_scanned_count=total_file_count,
+                            files_unchanged_count=scan_index.files_unchanged_count,
+                            directories_unchanged_count=scan_index.directories_unchanged_count,
+                            directories_ignored_count=walker.directories_ignored_count,
+                            prefilter_rejected_counts=dict(prefilters.rejected_counts),
+                            file_test_cache_hit_count=decision_cache.hit_count,
+                            file_test_cache_miss_count=decision_cache.miss_count)
 
         if not self.scan_cancel_flag.is_set() and not self.abort_flag.is_set():
             # Execute event plugin runners
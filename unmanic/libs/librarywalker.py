@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.librarywalker.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import collections
+import os
+import queue
+import threading
+
+from unmanic.libs.logs import UnmanicLogging
+from unmanic.libs.unmanicignore import UnmanicIgnoreFiles
+
+
+class LibraryWalker(object):
+    """
+    LibraryWalker
+
+    Walks a library path with os.scandir, fanning directory listings out over a bounded pool of threads.
+
+    Each thread works depth-first through its own deque of directories and steals the oldest
+    (shallowest) directory from another thread's deque when its own runs dry. This keeps every
+    thread busy with its own subtree while still spreading wide trees across the pool, which
+    matters most on network mounts where each listing is latency bound.
+
+    Directory types are taken from the listing (d_type) rather than stat'ing every entry again.
+    Symlinked directories are only descended when following links (matching os.walk(followlinks=...)),
+    and a directory is never descended if it is one of its own ancestors.
+
+    Directories excluded by a '.unmanicignore' file are pruned, so ignored subtrees are never listed.
+    If a file_filter callable is provided, it is given the os.DirEntry of each file and files it returns
+    False for are skipped.
+
+    If a LibraryScanIndex is provided, settled directories are not listed and only files that need to
+    be tested are yielded.
+
+    Files are handed to the consumer through a bounded queue, so a slow consumer holds back the walk.
+
+    """
+
+    DEFAULT_MAX_WORKERS = 8
+    _done = object()
+
+    def __init__(self, library_path, scan_index=None, follow_symlinks=True, max_workers=None, stop_event=None,
+                 pause_event=None, file_filter=None):
+        self.logger = UnmanicLogging.get_logger(name=__class__.__name__)
+        self.library_path = library_path
+        self.scan_index = scan_index
+        self.follow_symlinks = follow_symlinks
+        self.max_workers = max(1, int(max_workers or self.DEFAULT_MAX_WORKERS))
+        self.stop_event = stop_event
+        self.pause_event = pause_event
+        self.file_filter = file_filter
+        self._stop = threading.Event()
+        self._ignore_files = UnmanicIgnoreFiles()
+
+        self._deques = []
+        self._condition = threading.Condition()
+        self._outstanding = 0
+        self._finished = threading.Event()
+        self._results = queue.Queue(maxsize=self.max_workers * 4)
+
+        self.directories_listed_count = 0
+        self.directories_ignored_count = 0
+        self.symlink_loops_count = 0
+
+    def __iter__(self):
+        return self.walk()
+
+    def walk(self):
+        """
+        Walk the library path yielding the full path of each file found
+
+        :return:
+        """
+        self._deques = [collections.deque() for _ in range(self.max_workers)]
+        self._stop.clear()
+        self._finished.clear()
+        self._outstanding = 1
+        self._deques[0].append((self.library_path, self.__ancestors_of(self.library_path, None)))
+
+        threads = []
+        for worker_id in range(self.max_workers):
+            thread = threading.Thread(target=self.__worker, args=(worker_id,),
+                                      name="LibraryWalker-{}".format(worker_id), daemon=True)
+            thread.start()
+            threads.append(thread)
+
+        try:
+            finished_workers = 0
+            while finished_workers < self.max_workers:
+                item = self._results.get()
+                if item is self._done:
+                    finished_workers += 1
+                    continue
+                for file_path in item:
+                    yield file_path
+        finally:
+            # Release the workers if the consumer stopped early
+            self.stop()
+            for thread in threads:
+                thread.join()
+
+    def stop(self):
+        self._stop.set()
+        with self._condition:
+            self._condition.notify_all()
+
+    def __stopped(self):
+        if self.stop_event is not None and self.stop_event.is_set():
+            return True
+        return self._stop.is_set() or self._finished.is_set()
+
+    def __ancestors_of(self, path, parent_ancestors):
+        """
+        Return the set of (device, inode) keys for a directory and its ancestors.
+        Only required when following symlinks, as os.walk never descends a symlink otherwise.
+
+        :param path:
+        :param parent_ancestors:
+        :return:
+        """
+        if not self.follow_symlinks:
+            return None
+        try:
+            dir_stat = os.stat(path)
+        except OSError:
+            return parent_ancestors
+        dir_key = (dir_stat.st_dev, dir_stat.st_ino)
+        if parent_ancestors is None:
+            return frozenset([dir_key])
+        return parent_ancestors | {dir_key}
+
+    def __next_directory(self, worker_id):
+        # Work depth-first through our own deque
+        try:
+            return self._deques[worker_id].pop()
+        except IndexError:
+            pass
+        # Steal the shallowest directory from another worker
+        for offset in range(1, self.max_workers):
+            victim = self._deques[(worker_id + offset) % self.max_workers]
+            try:
+                return victim.popleft()
+            except IndexError:
+                continue
+        return None
+
+    def __worker(self, worker_id):
+        try:
+            while not self.__stopped():
+                if self.pause_event is not None and self.pause_event.is_set():
+                    self._stop.wait(.2)
+                    continue
+                item = self.__next_directory(worker_id)
+                if item is None:
+                    with self._condition:
+                        if self._outstanding <= 0:
+                            self._finished.set()
+                            self._condition.notify_all()
+                            break
+                        self._condition.wait(.1)
+                    continue
+                try:
+                    self.__process_directory(worker_id, *item)
+                except Exception as e:
+                    self.logger.exception("Exception while walking directory '%s': %s", item[0], e)
+                finally:
+                    with self._condition:
+                        self._outstanding -= 1
+                        self._condition.notify_all()
+        finally:
+            self.__put_result(self._done)
+
+    def __queue_directories(self, worker_id, directories):
+        if not directories:
+            return
+        with self._condition:
+            self._outstanding += len(directories)
+        # Reverse so that the first child is the next one popped by this worker
+        self._deques[worker_id].extend(reversed(directories))
+        with self._condition:
+            self._condition.notify_all()
+
+    def __process_directory(self, worker_id, directory, ancestors):
+        scan_index = self.scan_index
+        dir_stat = None
+        if scan_index is not None:
+            try:
+                dir_stat = os.stat(directory)
+            except OSError:
+                return
+            if scan_index.directory_is_settled(directory, dir_stat):
+                children = []
+                for child in scan_index.get_child_directories(directory):
+                    child_ancestors = self.__child_ancestors(child, ancestors)
+                    if child_ancestors is not False:
+                        children.append((child, child_ancestors))
+                self.__queue_directories(worker_id, children)
+                return
+            indexed_files = scan_index.get_indexed_files(directory)
+            scan_index.open_directory(directory, dir_stat)
+
+        files = []
+        child_names = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        # Like os.walk, symlinked directories are only descended when following links
+                        if self.follow_symlinks or not entry.is_symlink():
+                            child_names.append(entry.name)
+                        continue
+                    if self.file_filter is not None and not self.file_filter(entry):
+                        continue
+                    files.append(entry)
+        except OSError:
+            if scan_index is not None:
+                scan_index.discard_directory(directory)
+            return
+        with self._condition:
+            self.directories_listed_count += 1
+        self.logger.debug("Listed directory '%s' - %s files, %s directories", directory, len(files), len(child_names))
+
+        children = []
+        for name in child_names:
+            child = os.path.join(directory, name)
+            if self._ignore_files.is_ignored(child, self.library_path, is_dir=True):
+                with self._condition:
+                    self.directories_ignored_count += 1
+                self.logger.debug("Skipping directory '%s' found in unmanic ignore file", child)
+                if scan_index is not None:
+                    # The directory must be listed again next scan in case the ignore rules change
+                    scan_index.unsettle_directory(directory)
+                continue
+            child_ancestors = self.__child_ancestors(child, ancestors)
+            if child_ancestors is False:
+                continue
+            children.append((child, child_ancestors))
+            if scan_index is not None:
+                scan_index.add_child_directory(directory, name)
+
+        if scan_index is None:
+            files_to_test = [entry.path for entry in files]
+        else:
+            files_to_test = []
+            for entry in files:
+                try:
+                    file_stat = entry.stat()
+                except OSError:
+                    file_stat = None
+                if scan_index.add_file(directory, entry.path, file_stat, indexed_files):
+                    files_to_test.append(entry.path)
+            scan_index.close_directory(directory)
+
+        # Queue child directories before handing over files so idle workers can steal them straight away
+        self.__queue_directories(worker_id, children)
+        if files_to_test:
+            self.__put_result(files_to_test)
+
+    def __put_result(self, item):
+        """
+        Hand a result to the consumer. Blocks while the bounded results queue is full.
+
+        :param item:
+        :return:
+        """
+        while True:
+            try:
+                self._results.put(item, timeout=.2)
+                return
+            except queue.Full:
+                if self._stop.is_set():
+                    return
+
+    def __child_ancestors(self, child, ancestors):
+        """
+        Return the ancestors set for a child directory, or False if descending it would loop
+
+        :param child:
+        :param ancestors:
+        :return:
+        """
+        if ancestors is None:
+            return None
+        try:
+            child_stat = os.stat(child)
+        except OSError:
+            return ancestors
+        child_key = (child_stat.st_dev, child_stat.st_ino)
+        if child_key in ancestors:
+            with self._condition:
+                self.symlink_loops_count += 1
+            self.logger.warning("Skipping symlink loop at '%s'", child)
+            return False
+        return ancestors | {child_key}
@@ -39,9 +39,10 @@ from copy import deepcopy
 from datetime import datetime
 
 from unmanic.libs import common
+from unmanic.libs.filetestcache import FileTestDecisionCache
 from unmanic.libs.logs import UnmanicLogging
 from unmanic.libs.unmodels import FileMetadata, FileMetadataPaths, TaskMetadata, Tasks
-from peewee import fn
+from unmanic.libs.unmodels.searchindexes import contains_search_value
 
 
 class UnmanicFileMetadata:
@@ -63,9 +64,13 @@ class UnmanicFileMetadata:
     _path_cache = OrderedDict()
     _last_prune = 0
 
+    @classmethod
+    def is_available(cls):
+        return os.getpid() == cls._main_pid
+
     @classmethod
     def _ensure_main_process(cls):
-        if os.getpid() != cls._main_pid:
+        if not cls.is_available():
             raise RuntimeError("UnmanicFileMetadata is only available in the main process")
 
     @classmethod
@@ -385,6 +390,8 @@ class UnmanicFileMetadata:
                 created_at=now,
                 updated_at=now,
             )
+        # File test plugins may read this metadata. Test the file again on the next scan
+        FileTestDecisionCache.forget_paths([path])
 
     @classmethod
     def commit_task(cls, task_id, task_success, source_path, destination_paths=None):
@@ -486,7 +493,7 @@ class UnmanicFileMetadata:
         if not search_value:
             return []
         path_rows = FileMetadataPaths.select(FileMetadataPaths.file_metadata).where(
-            fn.LOWER(FileMetadataPaths.path).contains(search_value.lower())
+            contains_search_value(FileMetadataPaths.path, search_value.lower())
         )
         metadata_ids = list({row.file_metadata.id for row in path_rows})
         if not metadata_ids:
@@ -544,6 +551,7 @@ class UnmanicFileMetadata:
         path_rows = FileMetadataPaths.select(FileMetadataPaths.path).where(FileMetadataPaths.file_metadata == row.id)
         paths = [path_row.path for path_row in path_rows]
 
+        FileTestDecisionCache.forget_paths(paths)
         if not plugin_id:
             row.delete_instance()
             cls._invalidate_cached_fingerprint(fingerprint, paths=paths)
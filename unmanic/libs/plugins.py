@@ -43,6 +43,8 @@ import requests
 
 from unmanic import config
 from unmanic.libs import common
+from unmanic.libs.configversion import ConfigVersion
+from unmanic.libs.eventbus import EventPluginBus
 from unmanic.libs.frontend_push_messages import FrontendPushMessages
 from unmanic.libs.library import Library
 from unmanic.libs.logs import UnmanicLogging
@@ -62,6 +64,13 @@ class PluginsHandler(object, metaclass=SingletonType):
     def __init__(self, *args, **kwargs):
         self.settings = config.Config()
         self.logger = UnmanicLogging.get_logger(name=__class__.__name__)
+        # The configuration version and result of the last incompatible plugins check
+        self.incompatible_plugins_checked = (None, [])
+        # Compiled plugin flows keyed by (plugin_type, library_id).
+        # Each value is a tuple of (configuration version, tuple of plugin data dictionaries).
+        self.plugin_flow_snapshots = {}
+        # Executor used to run plugin runners. Created on first use
+        self.plugin_executor = None
 
     def _log(self, message, message2='', level="info"):
         message = common.format_message(message, message2)
@@ -557,6 +566,7 @@ class PluginsHandler(object, metaclass=SingletonType):
         if plugin_info.get('defer_dependency_install', False):
             self.install_plugin_requirements(plugin_directory)
             self.install_npm_modules(plugin_directory)
+        ConfigVersion().bump('plugins.install')
         # Return installed plugin info
         return plugin_info
 
@@ -611,6 +621,7 @@ class PluginsHandler(object, metaclass=SingletonType):
         else:
             # Insert a new entry
             Plugins.insert(plugin_data).execute()
+        ConfigVersion().bump('plugins.install')
 
         return True
 
@@ -734,7 +745,9 @@ class PluginsHandler(object, metaclass=SingletonType):
         EnabledPlugins.delete().where(EnabledPlugins.plugin_id.in_(plugin_table_ids)).execute()
 
         # Delete by ID in DB
-        if not Plugins.delete().where(Plugins.id.in_(plugin_table_ids)).execute():
+        deleted = Plugins.delete().where(Plugins.id.in_(plugin_table_ids)).execute()
+        ConfigVersion().bump('plugins.remove')
+        if not deleted:
             return False
 
         return True
@@ -785,6 +798,7 @@ class PluginsHandler(object, metaclass=SingletonType):
             if not plugin_flow:
                 success = False
 
+        ConfigVersion().bump('plugins.flow')
         return success
 
     @staticmethod
@@ -821,14 +835,30 @@ class PluginsHandler(object, metaclass=SingletonType):
         If no library ID is provided, this will return all installed plugins for that type.
         This case should only be used for plugin runner types that are not associated with a library.
 
+        The plugin flow is compiled once and then only compiled again after the configuration version changes
+        (plugins installed, removed or reloaded, or the library plugins or flow changed).
+        Each call returns copies of the compiled plugin data, so callers are free to modify them.
+
         :param plugin_type:
         :param library_id:
         :return:
         """
-        # Refresh session
-        s = Session()
-        s.register_unmanic()
+        config_version = ConfigVersion().get()
+        compiled_version, plugin_flow = self.plugin_flow_snapshots.get((plugin_type, library_id), (None, ()))
+        if compiled_version != config_version:
+            plugin_flow = self.compile_plugin_flow(plugin_type, library_id, config_version)
+        return [dict(plugin_data) for plugin_data in plugin_flow]
+
+    def compile_plugin_flow(self, plugin_type, library_id, config_version):
+        """
+        Read the enabled plugins for a plugin type from the DB, load their modules and resolve their runners.
+        The result is stored as the plugin flow snapshot for the given configuration version.
 
+        :param plugin_type:
+        :param library_id:
+        :param config_version:
+        :return:
+        """
         # First fetch all enabled plugins
         order = [
             {
@@ -845,10 +875,12 @@ class PluginsHandler(object, metaclass=SingletonType):
 
         # Fetch all plugin modules from the given list of enabled plugins
         plugin_executor = PluginExecutor()
-        plugin_data = plugin_executor.get_plugin_data_by_type(enabled_plugins, plugin_type)
+        plugin_flow = tuple(plugin_executor.get_plugin_data_by_type(enabled_plugins, plugin_type))
 
-        # Return modules
-        return plugin_data
+        self.plugin_flow_snapshots[(plugin_type, library_id)] = (config_version, plugin_flow)
+        self.logger.debug("Compiled '%s' plugin flow for library %s with %s plugins",
+                          plugin_type, library_id, len(plugin_flow))
+        return plugin_flow
 
     def exec_plugin_runner(self, data, plugin_id, plugin_type):
         """
@@ -859,20 +891,21 @@ class PluginsHandler(object, metaclass=SingletonType):
         :param plugin_type:
         :return:
         """
-        plugin_executor = PluginExecutor()
-        return plugin_executor.execute_plugin_runner(data, plugin_id, plugin_type)
+        # Runners are executed on every file test, so reuse the one executor rather than creating one per call
+        if self.plugin_executor is None:
+            self.plugin_executor = PluginExecutor()
+        return self.plugin_executor.execute_plugin_runner(data, plugin_id, plugin_type)
 
     def get_incompatible_enabled_plugins(self, frontend_messages=None):
         """
         Ensure that the currently installed plugins are compatible with this PluginsHandler version
+        The result is only read again from each plugin's info.json after the configuration version changes.
 
         :return:
         :rtype:
         """
         if frontend_messages is None:
             frontend_messages = FrontendPushMessages()
-        # Fetch all libraries
-        all_libraries = Library.get_all_libraries()
 
         def add_frontend_message(plugin_id, name):
             # If the frontend messages queue was included in request, append a message
@@ -887,9 +920,16 @@ class PluginsHandler(object, metaclass=SingletonType):
                     }
                 )
 
+        config_version = ConfigVersion().get()
+        checked_version, incompatible_list = self.incompatible_plugins_checked
+        if checked_version == config_version:
+            for record in incompatible_list:
+                add_frontend_message(record.get('plugin_id'), record.get('name'))
+            return list(incompatible_list)
+
         # Fetch all enabled plugins
         incompatible_list = []
-        for library in all_libraries:
+        for library in Library.get_all_libraries():
             enabled_plugins = self.get_plugin_list_filtered_and_sorted(library_id=library.get('id'))
 
             # Ensure only compatible plugins are enabled
@@ -916,7 +956,8 @@ class PluginsHandler(object, metaclass=SingletonType):
                 )
                 add_frontend_message(record.get('plugin_id'), record.get('name'))
 
-        return incompatible_list
+        self.incompatible_plugins_checked = (config_version, incompatible_list)
+        return list(incompatible_list)
 
     @staticmethod
     def get_plugin_types_with_flows():
@@ -956,15 +997,17 @@ class PluginsHandler(object, metaclass=SingletonType):
             )
         return return_plugin_flow
 
-    def run_event_plugins_for_plugin_type(self, plugin_type, data):
+    def run_event_plugins_for_plugin_type(self, plugin_type, data, synchronous=False):
         """
         Run all enabled plugins for an event plugin type
 
+        Plugins are delivered the event through the EventPluginBus. Runners that only accept the event data
+        are run in the background. Pass synchronous=True if the caller needs to read back changes the plugins
+        make to the data.
+
         :param plugin_type:
         :param data:
+        :param synchronous:
         :return:
         """
-        plugin_modules = self.get_enabled_plugin_modules_by_type(plugin_type)
-        for plugin_module in plugin_modules:
-            if not self.exec_plugin_runner(data, plugin_module.get('plugin_id'), plugin_type):
-                continue
+        EventPluginBus().publish(plugin_type, data, synchronous=synchronous)
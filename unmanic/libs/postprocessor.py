@@ -36,6 +36,7 @@ import time
 
 from unmanic import config
 from unmanic.libs import common, history
+from unmanic.libs.filetestcache import FileTestDecisionCache
 from unmanic.libs.frontend_push_messages import FrontendPushMessages
 from unmanic.libs.library import Library
 from unmanic.libs.logs import UnmanicLogging
@@ -43,6 +44,7 @@ from unmanic.libs.metadata import UnmanicFileMetadata
 from unmanic.libs.notifications import Notifications
 from unmanic.libs.plugins import PluginsHandler
 from unmanic.libs.task import TaskDataStore
+from unmanic.libs.tasklogs import TaskLogStore
 
 """
 
@@ -69,6 +71,9 @@ class PostProcessor(threading.Thread):
 
     """
 
+    # Number of lines at the end of the task log that are passed to the 'events.postprocessor_complete' plugins
+    event_log_line_count = 200
+
     def __init__(self, data_queues, task_queue, event):
         super(PostProcessor, self).__init__(name='PostProcessor')
         self.logger = UnmanicLogging.get_logger(name=__class__.__name__)
@@ -179,7 +184,9 @@ class PostProcessor(threading.Thread):
     def run(self):
         self.logger.info("Starting PostProcessor Monitor loop...")
         while not self.abort_flag.is_set():
-            self.event.wait(1)
+            # Block until a worker has processed a task. There is nothing to do until then
+            if not self.task_queue.wait_for_processed_tasks(timeout=1):
+                continue
 
             if not self.system_configuration_is_valid():
                 self.event.wait(2)
@@ -580,11 +587,14 @@ class PostProcessor(threading.Thread):
                 'start_time':          task_dump.get('start_time', ''),
                 'finish_time':         task_dump.get('finish_time', ''),
                 'processed_by_worker': task_dump.get('processed_by_worker', ''),
-                'log':                 task_dump.get('log', ''),
+                'log_chunks':          TaskLogStore.iter_chunks(self.current_task.get_task_id()),
             }
         )
 
         # Execute event plugin runners
+        # Only the end of the task log is passed to the plugins so that a large log is not held in memory
+        log_lines = TaskLogStore.tail(self.current_task.get_task_id(), self.event_log_line_count)
+        log_tail = ''.join('{}\n'.format(line) for line in log_lines)
         plugin_handler = PluginsHandler()
         plugin_handler.run_event_plugins_for_plugin_type('events.postprocessor_complete', {
             'library_id':                  self.current_task.get_task_library_id(),
@@ -598,12 +608,13 @@ class PostProcessor(threading.Thread):
             'start_time':                  task_dump.get('start_time', ''),
             'finish_time':                 task_dump.get('finish_time', ''),
             'processed_by_worker':         task_dump.get('processed_by_worker', ''),
-            'log':                         task_dump.get('log', ''),
+            'log':                         log_tail,
         })
 
     def commit_task_metadata(self):
         """
         Commit task metadata after all postprocessor runners have finished.
+        Any cached file test results for the task's source and destination files are removed.
         """
         source_data = self.current_task.get_source_data()
         destination_data = self.current_task.get_destination_data()
@@ -619,11 +630,13 @@ class PostProcessor(threading.Thread):
         )
         if committed:
             self.logger.debug("Committed file metadata entries: %s", committed)
+        # The task history (and any metadata) for these paths has changed. Test them again on the next scan
+        FileTestDecisionCache.forget_paths([source_data.get('abspath')] + destination_files)
         return committed
 
     def dump_history_log(self):
         self.logger.debug("Dumping remote task history log.")
-        task_dump = self.current_task.task_dump()
+        task_dump = self.current_task.task_dump(include_log=True)
         destination_data = self.current_task.get_destination_data()
 
         # Dump history log & task state as metadata in the file's path
@@ -652,9 +665,7 @@ class PostProcessor(threading.Thread):
         finish_time = task_dump.get('finish_time', '')
         command_error_log_tail = ""
         if status != "success":
-            task_log = task_dump.get('log', '')
-            if task_log:
-                command_error_log_tail = "\n".join(task_log.splitlines()[-20:])
+            command_error_log_tail = "\n".join(TaskLogStore.tail(self.current_task.get_task_id(), line_count=20))
         try:
             library_id = self.current_task.get_task_library_id()
             library_name = self.current_task.get_task_library_name()
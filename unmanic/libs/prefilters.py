@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.prefilters.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import fnmatch
+import os
+import re
+import threading
+
+from unmanic.libs.logs import UnmanicLogging
+
+
+class FilePrefilter(object):
+    """
+    FilePrefilter
+
+    A cheap, static filter on a file's path and size, evaluated before any file test plugin is run.
+
+    Prefilters are declared as a dictionary (on a library, or under "prefilters" in a plugin's info.json):
+        {
+            "extensions":         ["mkv", "mp4"],     # Only accept files with these extensions
+            "exclude_extensions": ["nfo", "srt"],     # Reject files with these extensions
+            "min_size":           1048576,            # Reject files smaller than this many bytes
+            "max_size":           107374182400,       # Reject files larger than this many bytes
+            "paths":              ["*/Movies/*"],     # Only accept files with a full path matching one of these globs
+            "exclude_paths":      ["*/Extras/*"]      # Reject files with a full path matching any of these globs
+        }
+    Every key is optional. Extensions are matched case-insensitively and without the leading '.'.
+    """
+
+    def __init__(self, name, prefilters=None):
+        self.name = name
+        if not isinstance(prefilters, dict):
+            prefilters = {}
+        self.extensions = self.__parse_extensions(prefilters.get('extensions'))
+        self.exclude_extensions = self.__parse_extensions(prefilters.get('exclude_extensions'))
+        self.min_size = self.__parse_size(prefilters.get('min_size'))
+        self.max_size = self.__parse_size(prefilters.get('max_size'))
+        self.paths = self.__compile_globs(prefilters.get('paths'))
+        self.exclude_paths = self.__compile_globs(prefilters.get('exclude_paths'))
+
+    @staticmethod
+    def __parse_extensions(extensions):
+        if not extensions:
+            return None
+        if isinstance(extensions, str):
+            extensions = [extensions]
+        return frozenset(str(e).lower().lstrip('.') for e in extensions if str(e).strip())
+
+    @staticmethod
+    def __parse_size(size):
+        if size in (None, ''):
+            return None
+        try:
+            return int(size)
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def __compile_globs(globs):
+        """
+        Compile a list of globs into a single regex
+
+        :param globs:
+        :return:
+        """
+        if not globs:
+            return None
+        if isinstance(globs, str):
+            globs = [globs]
+        return re.compile('|'.join('(?:{})'.format(fnmatch.translate(str(g))) for g in globs))
+
+    def is_empty(self):
+        return not any([self.extensions, self.exclude_extensions, self.min_size is not None, self.max_size is not None,
+                        self.paths, self.exclude_paths])
+
+    def needs_size(self):
+        return self.min_size is not None or self.max_size is not None
+
+    @staticmethod
+    def get_extension(path):
+        return os.path.splitext(path)[1][1:].lower()
+
+    def check(self, path, get_size):
+        """
+        Check a path against this prefilter.
+        Returns the name of the rule that rejected the file, or None if the file is accepted.
+
+        :param path:
+        :param get_size: Callable returning the size of the file in bytes (or None if unknown). Only called if required.
+        :return:
+        """
+        if self.extensions is not None or self.exclude_extensions is not None:
+            extension = self.get_extension(path)
+            if self.extensions is not None and extension not in self.extensions:
+                return 'extensions'
+            if self.exclude_extensions is not None and extension in self.exclude_extensions:
+                return 'exclude_extensions'
+        if self.paths is not None and not self.paths.match(path):
+            return 'paths'
+        if self.exclude_paths is not None and self.exclude_paths.match(path):
+            return 'exclude_paths'
+        if self.needs_size():
+            size = get_size()
+            if size is not None:
+                if self.min_size is not None and size < self.min_size:
+                    return 'min_size'
+                if self.max_size is not None and size > self.max_size:
+                    return 'max_size'
+        return None
+
+
+class LibraryPrefilters(object):
+    """
+    LibraryPrefilters
+
+    All prefilters that apply to a library's files, compiled into a single matcher.
+
+    A file is rejected if the library's own prefilter rejects it, or if every file test plugin in the
+    library's flow declares a prefilter and none of them accept it (no plugin could ever add it to
+    the task list). Rejections are counted per prefilter rule.
+    """
+
+    def __init__(self, library_prefilter, plugin_prefilters):
+        self.logger = UnmanicLogging.get_logger(name=__class__.__name__)
+        self._lock = threading.Lock()
+        self.rejected_counts = {}
+
+        self.library_prefilter = None
+        if library_prefilter is not None and not library_prefilter.is_empty():
+            self.library_prefilter = library_prefilter
+
+        # Plugin prefilters only help if every plugin in the flow declares one
+        self.plugin_prefilters = None
+        if plugin_prefilters and all(p is not None and not p.is_empty() for p in plugin_prefilters):
+            self.plugin_prefilters = list(plugin_prefilters)
+
+    @staticmethod
+    def read_plugin_prefilter(plugin_id):
+        """
+        Read the prefilter declared in a plugin's info.json
+
+        :param plugin_id:
+        :return:
+        """
+        from unmanic.libs.plugins import PluginsHandler
+        plugin_info = PluginsHandler().get_plugin_info(plugin_id)
+        return FilePrefilter(plugin_id, plugin_info.get('prefilters'))
+
+    @staticmethod
+    def for_library(library_id, plugin_modules):
+        """
+        Build the prefilters for a library from its configuration and its file test plugins
+
+        :param library_id:
+        :param plugin_modules:
+        :return:
+        """
+        from unmanic.libs.library import Library
+        library_prefilter = FilePrefilter('library', Library(library_id).get_prefilters())
+        plugin_prefilters = []
+        for plugin_module in plugin_modules:
+            plugin_prefilters.append(LibraryPrefilters.read_plugin_prefilter(plugin_module.get('plugin_id')))
+        return LibraryPrefilters(library_prefilter, plugin_prefilters)
+
+    def is_empty(self):
+        return self.library_prefilter is None and self.plugin_prefilters is None
+
+    def __reject(self, key):
+        with self._lock:
+            self.rejected_counts[key] = self.rejected_counts.get(key, 0) + 1
+        return key
+
+    def check(self, path, get_size):
+        """
+        Check a path against all prefilters.
+        Returns the key of the prefilter rule that rejected the file, or None if the file should be tested.
+
+        :param path:
+        :param get_size:
+        :return:
+        """
+        size = []
+
+        def cached_get_size():
+            if not size:
+                size.append(get_size())
+            return size[0]
+
+        if self.library_prefilter is not None:
+            rejected_by = self.library_prefilter.check(path, cached_get_size)
+            if rejected_by is not None:
+                return self.__reject('library.{}'.format(rejected_by))
+        if self.plugin_prefilters is not None:
+            for plugin_prefilter in self.plugin_prefilters:
+                if plugin_prefilter.check(path, cached_get_size) is None:
+                    return None
+            return self.__reject('plugins')
+        return None
@@ -37,13 +37,20 @@ import time
 from copy import deepcopy
 from operator import attrgetter
 
+from peewee import Tuple, fn
 from playhouse.shortcuts import model_to_dict
 
 from unmanic import config
 from unmanic.libs import common
+from unmanic.libs.filetestcache import FileTestDecisionCache
 from unmanic.libs.library import Library
 from unmanic.libs.logs import UnmanicLogging
+from unmanic.libs.singleton import SingletonType
+from unmanic.libs.tasklogs import TaskLogStore
+from unmanic.libs.unmodels.lib import supports_returning
+from unmanic.libs.unmodels.searchindexes import contains_search_value
 from unmanic.libs.unmodels.tasks import IntegrityError, Tasks
+from unmanic.libs.unmodels.taskstatuscounts import TaskStatusCounts
 
 
 def prepare_file_destination_data(pathname, file_extension):
@@ -63,6 +70,34 @@ def prepare_file_destination_data(pathname, file_extension):
     return file_data
 
 
+def generate_cache_path(source_abspath, cache_path, cache_directory=None, file_extension=None):
+    """
+    Generate a unique path within the cache directory for the output of a task
+
+    :param source_abspath:
+    :param cache_path:
+    :param cache_directory:
+    :param file_extension:
+    :return:
+    """
+    # Fetch the file's name without the file extension (this is going to be reset)
+    split_file_name = os.path.splitext(os.path.basename(source_abspath))
+    file_name_without_extension = split_file_name[0]
+
+    if not file_extension:
+        # Get file extension
+        file_extension = split_file_name[1].lstrip('.')
+
+    # Parse an output cache path
+    random_string = '{}-{}'.format(common.random_string(), int(time.time()))
+    out_file = "{}-{}.{}".format(file_name_without_extension, random_string, file_extension)
+    if not cache_directory:
+        out_folder = "unmanic_file_conversion-{}".format(random_string)
+        cache_directory = os.path.join(cache_path, out_folder)
+
+    return os.path.join(cache_directory, out_file)
+
+
 class Task(object):
     """
     Task
@@ -83,23 +118,9 @@ class Task(object):
     def set_cache_path(self, cache_directory=None, file_extension=None):
         if not self.task:
             raise Exception('Unable to set cache path. Task has not been set!')
-        # Fetch the file's name without the file extension (this is going to be reset)
-        split_file_name = os.path.splitext(self.get_source_basename())
-        file_name_without_extension = split_file_name[0]
-
-        if not file_extension:
-            # Get file extension
-            file_extension = split_file_name[1].lstrip('.')
-
-        # Parse an output cache path
-        random_string = '{}-{}'.format(common.random_string(), int(time.time()))
-        out_file = "{}-{}.{}".format(file_name_without_extension, random_string, file_extension)
-        if not cache_directory:
-            out_folder = "unmanic_file_conversion-{}".format(random_string)
-            cache_directory = os.path.join(self.settings.get_cache_path(), out_folder)
-
         # Set cache path class attribute
-        self.task.cache_path = os.path.join(cache_directory, out_file)
+        self.task.cache_path = generate_cache_path(self.get_source_data().get('abspath'), self.settings.get_cache_path(),
+                                                   cache_directory=cache_directory, file_extension=file_extension)
 
     def get_cache_path(self):
         if not self.task:
@@ -184,7 +205,12 @@ class Task(object):
             raise Exception('Unable to fetch task finish time. Task has not been set!')
         return self.task.finish_time
 
-    def task_dump(self):
+    def get_command_log(self):
+        if not self.task:
+            raise Exception('Unable to fetch task command log. Task has not been set!')
+        return TaskLogStore.read(self.task.id)
+
+    def task_dump(self, include_log=False):
         # Generate a copy of this class as a dict
         task_dict = {
             'task_label':          self.get_source_basename(),
@@ -194,8 +220,10 @@ class Task(object):
             'finish_time':         self.task.finish_time,
             'processed_by_worker': self.task.processed_by_worker,
             'errors':              self.errors,
-            'log':                 self.task.log,
         }
+        # The command log is stored outside the task row. Only read it when it is needed.
+        if include_log:
+            task_dict['log'] = self.get_command_log()
         return task_dict
 
     def read_and_set_task_by_absolute_path(self, abspath):
@@ -210,6 +238,15 @@ class Task(object):
         # Get task matching the abspath
         self.task = Tasks.get(abspath=abspath)
 
+    def set_task_from_row(self, task_row):
+        """
+        Sets the task from a Tasks row that has already been read out of the database.
+
+        :param task_row:
+        :return:
+        """
+        self.task = task_row
+
     def create_task_by_absolute_path(self, abspath, task_type='local', library_id=1, priority_score=0):
         """
         Creates the task by its absolute path.
@@ -224,9 +261,13 @@ class Task(object):
         :return:
         """
         try:
+            task_status_counters = TaskStatusCounters()
+            generation = task_status_counters.get_generation()
             self.task = Tasks.create(abspath=abspath, status='creating', library_id=library_id)
+            task_status_counters.transition(self.task.library_id, None, 'creating', generation=generation)
             self.save()
             self.logger.debug("Created new task with ID: %s for %s", self.task, abspath)
+            FileTestDecisionCache.forget_paths([abspath])
 
             # Set the cache path to use during the transcoding
             self.set_cache_path()
@@ -255,6 +296,65 @@ class Task(object):
             self.logger.info("Cancel creating new task for %s - %s", abspath, e)
             return False
 
+    @staticmethod
+    def create_local_tasks(task_rows, chunk_size=100):
+        """
+        Create many local tasks at once.
+
+        Each row is a dictionary with the 'abspath', 'cache_path', 'library_id' and 'priority' of a task.
+        The given priority is an offset. As with create_task_by_absolute_path(), the ID of each new task is added to it.
+        Rows are inserted with multi-row statements that skip any path that already has a task, then all
+        new tasks are set to 'pending' in a single statement.
+        If the SQLite library does not support RETURNING, the new tasks are selected before they are updated.
+
+        Returns a list of the (id, abspath, library_id) of each task that was created.
+
+        :param task_rows:
+        :param chunk_size:
+        :return:
+        """
+        if not task_rows:
+            return []
+        abspaths = []
+        for i in range(0, len(task_rows), chunk_size):
+            chunk = []
+            for row in task_rows[i:i + chunk_size]:
+                abspaths.append(row['abspath'])
+                chunk.append({
+                    'abspath':    row['abspath'],
+                    'cache_path': row['cache_path'],
+                    'library_id': row['library_id'],
+                    'priority':   row['priority'],
+                    'type':       'local',
+                    'status':     'creating',
+                })
+            Tasks.insert_many(chunk).on_conflict_ignore().execute()
+
+        # Apply the task ID to the priority and release the tasks to the workers
+        created = []
+        for i in range(0, len(abspaths), chunk_size):
+            query = Tasks.update(priority=(Tasks.priority + Tasks.id), status='pending')
+            query = query.where(Tasks.status == 'creating')
+            if supports_returning():
+                query = query.where(Tasks.abspath.in_(abspaths[i:i + chunk_size]))
+                query = query.returning(Tasks.id, Tasks.abspath, Tasks.library_id)
+                for row in query.execute():
+                    created.append((row.id, row.abspath, row.library_id))
+                continue
+            select_query = Tasks.select(Tasks.id, Tasks.abspath, Tasks.library_id)
+            select_query = select_query.where(Tasks.status == 'creating')
+            select_query = select_query.where(Tasks.abspath.in_(abspaths[i:i + chunk_size]))
+            rows = list(select_query.tuples())
+            if rows:
+                query = query.where(Tasks.id.in_([row[0] for row in rows]))
+                query.execute()
+                created.extend(rows)
+        if created:
+            TaskStatusCounters().reload()
+            # The new tasks change what file test plugins see for these paths
+            FileTestDecisionCache.forget_paths([abspath for _, abspath, _ in created])
+        return created
+
     def set_status(self, status):
         """
         Sets the task status to either 'pending', 'in_progress', 'processed' or 'complete'
@@ -267,10 +367,15 @@ class Task(object):
             raise Exception('Unable to set status to "{}". Status must be one of [{}].'.format(status, ', '.join(allowed)))
         if not self.task:
             raise Exception('Unable to set status. Task has not been set!')
+        task_status_counters = TaskStatusCounters()
+        generation = task_status_counters.get_generation()
+        old_status = self.task.status
         self.task.status = status
         self.save()
+        task_status_counters.transition(self.task.library_id, old_status, status, generation=generation)
         if status == 'complete':
             TaskDataStore.clear_task(self.task.id)
+            TaskLogStore.clear_task(self.task.id)
 
     def set_success(self, success):
         """
@@ -301,15 +406,14 @@ class Task(object):
 
     def save_command_log(self, log):
         """
-        Sets the task command log
+        Appends a list of lines to the task command log
 
         :param log:
         :return:
         """
         if not self.task:
             raise Exception('Unable to set status. Task has not been set!')
-        self.task.log += ''.join(log)
-        self.save()
+        TaskLogStore.append(self.task.id, log)
 
     def save(self):
         """
@@ -330,14 +434,52 @@ class Task(object):
         if not self.task:
             raise Exception('Unable to save Task. Task has not been set!')
         TaskDataStore.clear_task(self.task.id)
+        TaskLogStore.clear_task(self.task.id)
+        task_status_counters = TaskStatusCounters()
+        generation = task_status_counters.get_generation()
         self.task.delete_instance()
+        task_status_counters.transition(self.task.library_id, self.task.status, None, generation=generation)
 
     def get_total_task_list_count(self):
-        task_query = Tasks.select().order_by(Tasks.id.desc())
-        return task_query.count()
+        return self.get_task_status_count()
+
+    @staticmethod
+    def get_task_status_count(status=None, library_ids=None):
+        """
+        Returns the number of tasks, optionally filtered by status and library IDs.
+        Counts are read from the trigger maintained TaskStatusCounts table rather than counting the tasks table.
+
+        :param status:
+        :param library_ids:
+        :return:
+        """
+        query = TaskStatusCounts.select(fn.COALESCE(fn.SUM(TaskStatusCounts.count), 0))
+        if status:
+            query = query.where(TaskStatusCounts.status.in_([status]))
+        if library_ids:
+            query = query.where(TaskStatusCounts.library_id.in_(library_ids))
+        return int(query.scalar() or 0)
 
     def get_task_list_filtered_and_sorted(self, order=None, start=0, length=None, search_value=None, id_list=None,
-                                          status=None, task_type=None, library_ids=None):
+                                          status=None, task_type=None, library_ids=None, after=None):
+        """
+        Returns a query of tasks as dictionaries filtered by the given params.
+
+        If an 'after' cursor is given as a (priority, id) tuple of the last row of the previous page and
+        the results are ordered by priority, then the page is selected by seeking past that row rather
+        than by an offset. This is constant time no matter how deep into the list the page is.
+
+        :param order:
+        :param start:
+        :param length:
+        :param search_value:
+        :param id_list:
+        :param status:
+        :param task_type:
+        :param library_ids:
+        :param after:
+        :return:
+        """
         try:
             query = (Tasks.select())
 
@@ -345,7 +487,7 @@ class Task(object):
                 query = query.where(Tasks.id.in_(id_list))
 
             if search_value:
-                query = query.where(Tasks.abspath.contains(search_value))
+                query = query.where(contains_search_value(Tasks.abspath, search_value))
 
             if status:
                 query = query.where(Tasks.status.in_([status]))
@@ -365,7 +507,21 @@ class Task(object):
                     order_by = attrgetter(order.get("column"))(Tasks).desc()
 
             if order_by and length:
-                query = query.order_by(order_by).limit(length).offset(start)
+                if order.get("column") == 'priority':
+                    # Break ties on the ID so that every row has a stable position for the cursor
+                    if order.get("dir") == "asc":
+                        query = query.order_by(Tasks.priority.asc(), Tasks.id.asc())
+                        if after is not None:
+                            query = query.where(Tuple(Tasks.priority, Tasks.id) > Tuple(*after))
+                    else:
+                        query = query.order_by(Tasks.priority.desc(), Tasks.id.desc())
+                        if after is not None:
+                            query = query.where(Tuple(Tasks.priority, Tasks.id) < Tuple(*after))
+                    query = query.limit(length)
+                    if after is None:
+                        query = query.offset(start)
+                else:
+                    query = query.order_by(order_by).limit(length).offset(start)
 
         except Tasks.DoesNotExist:
             # No task entries exist yet
@@ -401,7 +557,11 @@ class Task(object):
                             shutil.rmtree(os.path.dirname(remote_task_dirname))
 
                     TaskDataStore.clear_task(task_id.id)
+                    TaskLogStore.clear_task(task_id.id)
+                    task_status_counters = TaskStatusCounters()
+                    generation = task_status_counters.get_generation()
                     task_id.delete_instance(recursive=True)
+                    task_status_counters.transition(task_id.library_id, task_id.status, None, generation=generation)
                 except Exception as e:
                     # Catch delete exceptions
                     self.logger.exception("An error occurred while deleting task ID: %s. %s", task_id, e)
@@ -447,9 +607,9 @@ class Task(object):
         """
         query = Tasks.update(status=status).where(Tasks.id.in_(id_list))
         result = query.execute()
+        TaskStatusCounters().reload()
         if status == 'complete' and id_list:
-            for task_id in id_list:
-                TaskDataStore.clear_task(task_id)
+            TaskDataStore.clear_tasks(id_list)
         return result
 
     @staticmethod
@@ -462,13 +622,18 @@ class Task(object):
         :return:
         """
         query = Tasks.update(library_id=library_id).where(Tasks.id.in_(id_list))
-        return query.execute()
+        result = query.execute()
+        TaskStatusCounters().reload()
+        return result
 
 
 class TaskDataStore:
     """
     Thread-safe in-memory store for task lifecycle data, shared across all plugins and threads.
 
+    The data is held in this process. A PluginChildProcess starts with a copy of the store and
+    records its changes in a journal that is sent back to the parent and applied there in batches.
+
     There are two separate stores:
 
     1. Runner State (immutable)
@@ -525,6 +690,73 @@ class TaskDataStore:
     _task_state = {}
     _lock = threading.RLock()
     _ctx = threading.local()
+    # List of changes made by this process since start_journal() was called, or None if changes are not recorded.
+    # Used by PluginChildProcess to send the changes made in a child process back to the parent in one batch.
+    _journal = None
+
+    @classmethod
+    def _reset_after_fork(cls):
+        # The lock may have been held by another thread at the time of a fork
+        cls._lock = threading.RLock()
+        cls._journal = None
+
+    @classmethod
+    def __record(cls, change):
+        # Must be called with the lock held
+        if cls._journal is not None:
+            cls._journal.append(change)
+
+    @classmethod
+    def start_journal(cls):
+        """
+        Start recording every change made to the store by this process.
+        The recorded changes are collected with pop_journal() and applied to another process' store with apply_journal().
+        """
+        with cls._lock:
+            cls._journal = []
+
+    @classmethod
+    def pop_journal(cls):
+        """
+        Return the changes recorded since the journal was started or last popped, and start a new batch.
+
+        :return: List of changes, or an empty list if the journal was not started.
+        """
+        with cls._lock:
+            if cls._journal is None:
+                return []
+            changes = cls._journal
+            cls._journal = []
+            return changes
+
+    @classmethod
+    def apply_journal(cls, changes):
+        """
+        Apply a batch of changes returned by pop_journal() in another process.
+        Runner values keep their write-once behaviour, so a key that already exists here is not overwritten.
+
+        :param changes: List of changes from pop_journal().
+        """
+        with cls._lock:
+            for change in changes:
+                action = change[0]
+                if action == 'runner':
+                    _, tid, pid, run, key, value = change
+                    cls.__set_runner_value(tid, pid, run, key, value)
+                elif action == 'task':
+                    _, tid, key, value = change
+                    cls.__set_task_state(tid, key, value)
+                elif action == 'delete':
+                    _, tid, key = change
+                    cls.__delete_task_state(tid, key)
+                elif action == 'clear':
+                    cls.__clear_task(change[1])
+
+    @classmethod
+    def __clear_task(cls, task_id):
+        cls._runner_state.pop(task_id, None)
+        cls._task_state.pop(task_id, None)
+        cls.__record(('clear', task_id))
 
     @classmethod
     def clear_task(cls, task_id):
@@ -534,8 +766,20 @@ class TaskDataStore:
         :param task_id: Integer ID of the task to purge.
         """
         with cls._lock:
-            cls._runner_state.pop(task_id, None)
-            cls._task_state.pop(task_id, None)
+            cls.__clear_task(task_id)
+
+    @classmethod
+    def clear_tasks(cls, task_ids=None):
+        """
+        Remove all cached state for many tasks at once.
+
+        :param task_ids: Iterable of task IDs to purge. If None, the state of every task is removed.
+        """
+        with cls._lock:
+            if task_ids is None:
+                task_ids = set(cls._runner_state.keys()) | set(cls._task_state.keys())
+            for task_id in task_ids:
+                cls.__clear_task(task_id)
 
     @classmethod
     def bind_runner_context(cls, task_id, plugin_id, runner):
@@ -581,16 +825,22 @@ class TaskDataStore:
         if None in (tid, pid, run):
             raise RuntimeError("Runner context not bound")
         with cls._lock:
-            task_map = dict(cls._runner_state.get(tid, {}))
-            plugin_map = dict(task_map.get(pid, {}))
-            runner_map = dict(plugin_map.get(run, {}))
-            if key in runner_map:
-                return False
-            runner_map[key] = deepcopy(value)
-            plugin_map[run] = runner_map
-            task_map[pid] = plugin_map
-            cls._runner_state[tid] = task_map
-            return True
+            return cls.__set_runner_value(tid, pid, run, key, deepcopy(value))
+
+    @classmethod
+    def __set_runner_value(cls, tid, pid, run, key, value):
+        # Nested maps are updated in place. The task entry is assigned back so that a store backed by
+        # a dict proxy (which returns copies) sees the change as well.
+        task_map = cls._runner_state.get(tid)
+        if task_map is None:
+            task_map = {}
+        runner_map = task_map.setdefault(pid, {}).setdefault(run, {})
+        if key in runner_map:
+            return False
+        runner_map[key] = value
+        cls._runner_state[tid] = task_map
+        cls.__record(('runner', tid, pid, run, key, value))
+        return True
 
     @classmethod
     def get_runner_value(cls, key, default=None, *, plugin_id=None, runner=None):
@@ -636,10 +886,16 @@ class TaskDataStore:
         if tid is None:
             raise RuntimeError("Task ID not provided or bound")
         with cls._lock:
-            existing = cls._task_state.get(tid, {})
-            new_t = dict(existing)
-            new_t[key] = value
-            cls._task_state[tid] = new_t
+            cls.__set_task_state(tid, key, value)
+
+    @classmethod
+    def __set_task_state(cls, tid, key, value):
+        task_map = cls._task_state.get(tid)
+        if task_map is None:
+            task_map = {}
+        task_map[key] = value
+        cls._task_state[tid] = task_map
+        cls.__record(('task', tid, key, value))
 
     @classmethod
     def get_task_state(cls, key, default=None, task_id=None):
@@ -671,10 +927,17 @@ class TaskDataStore:
         if tid is None:
             raise RuntimeError("Task ID not provided or bound")
         with cls._lock:
-            t = cls._task_state.get(tid, {})
-            t.pop(key, None)
-            if not t:
-                cls._task_state.pop(tid, None)
+            cls.__delete_task_state(tid, key)
+
+    @classmethod
+    def __delete_task_state(cls, tid, key):
+        task_map = cls._task_state.get(tid, {})
+        task_map.pop(key, None)
+        if task_map:
+            cls._task_state[tid] = task_map
+        else:
+            cls._task_state.pop(tid, None)
+        cls.__record(('delete', tid, key))
 
     @classmethod
     def export_task_state(cls, task_id):
@@ -687,6 +950,24 @@ class TaskDataStore:
         with cls._lock:
             return deepcopy(cls._task_state.get(task_id, {}))
 
+    @classmethod
+    def export_task_states(cls, task_ids=None):
+        """
+        Export the mutable state for many tasks at once as deep-copied dicts.
+
+        :param task_ids: Iterable of task IDs to export. If None, every task with state is exported.
+        :return: Dict of task_id→(dict of key→value). Tasks without state are omitted.
+        """
+        with cls._lock:
+            if task_ids is None:
+                return deepcopy(dict(cls._task_state))
+            states = {}
+            for task_id in task_ids:
+                task_map = cls._task_state.get(task_id)
+                if task_map:
+                    states[task_id] = deepcopy(task_map)
+            return states
+
     @classmethod
     def export_task_state_json(cls, task_id, **json_kwargs):
         """
@@ -710,9 +991,8 @@ class TaskDataStore:
         :param new_state: Dict of key→value to merge in.
         """
         with cls._lock:
-            t = cls._task_state.setdefault(task_id, {})
             for k, v in new_state.items():
-                t[k] = v
+                cls.__set_task_state(task_id, k, v)
 
     @classmethod
     def import_task_state_json(cls, task_id, json_data):
@@ -727,3 +1007,190 @@ class TaskDataStore:
         if not isinstance(parsed, dict):
             raise ValueError("Imported JSON must be an object/dict")
         cls.import_task_state(task_id, parsed)
+
+
+os.register_at_fork(after_in_child=TaskDataStore._reset_after_fork)
+
+
+class TaskStatusCounters(object, metaclass=SingletonType):
+    """
+    TaskStatusCounters
+
+    Process-wide count of tasks for each status and library.
+    Loaded from the TaskStatusCounts table on first use, then updated in memory on every task
+    status transition so that checking for work does not need to query the database.
+    Threads may block in wait_for_status() until a task reaches a given status, or register
+    a listener that is called with the new status each time tasks reach it.
+
+    Writes that change the status of a single task should read get_generation() before the database
+    write and pass it to transition() once the write has returned. The counters lock is not held
+    during the write. Statements that change many tasks at once should call reload() once they
+    have executed.
+    """
+
+    def __init__(self):
+        self.logger = UnmanicLogging.get_logger(name=__class__.__name__)
+        self._condition = threading.Condition()
+        # Count of tasks for each (status, library_id)
+        self._counts = None
+        # Incremented each time the counts are loaded from the database or discarded
+        self._generation = 0
+        self._listeners = []
+
+    def __load(self):
+        counts = {}
+        for row in TaskStatusCounts.select().where(TaskStatusCounts.count > 0):
+            counts[(row.status, row.library_id)] = row.count
+        self.logger.debug("Loaded task status counts %s", counts)
+        return counts
+
+    def __notify(self, statuses):
+        self._condition.notify_all()
+        for listener in list(self._listeners):
+            for status in statuses:
+                try:
+                    listener(status)
+                except Exception as e:
+                    self.logger.exception("Exception in task status listener %s", e)
+
+    def __reload(self):
+        # Must be called with the lock held
+        self._counts = self.__load()
+        self._generation += 1
+
+    def __ensure_loaded(self):
+        if self._counts is None:
+            self.__reload()
+
+    def __count(self, status, library_ids=None):
+        self.__ensure_loaded()
+        total = 0
+        for (count_status, library_id), count in self._counts.items():
+            if status is not None and count_status != status:
+                continue
+            if library_ids and library_id not in library_ids:
+                continue
+            total += count
+        return total
+
+    def get_generation(self):
+        """
+        Returns a number that changes each time the counts are loaded from the database or discarded.
+        Read it before a task database write and pass it to transition() once the write has returned.
+
+        :return:
+        """
+        with self._condition:
+            return self._generation
+
+    def reload(self):
+        """
+        Reload all counts from the database and wake any waiting threads
+
+        :return:
+        """
+        with self._condition:
+            self.__reload()
+            self.__notify(set(status for status, library_id in self._counts))
+
+    def reset(self):
+        """
+        Discard all counts. They will be reloaded from the database on next use.
+
+        :return:
+        """
+        with self._condition:
+            self._counts = None
+            self._generation += 1
+
+    def transition(self, library_id, old_status, new_status, count=1, generation=None):
+        """
+        Move tasks of a library from one status to another.
+        An old_status of None records newly created tasks. A new_status of None records deleted tasks.
+
+        If the generation read before the database write is given and the counts have been loaded since,
+        that load may already include the write. The counts are then reloaded rather than updated.
+
+        :param library_id:
+        :param old_status:
+        :param new_status:
+        :param count:
+        :param generation:
+        :return:
+        """
+        with self._condition:
+            if generation is not None and generation != self._generation and self._counts is not None:
+                self.__reload()
+                self.__notify(set(status for status, library_id in self._counts) | {new_status} - {None})
+                return
+            # If nothing is loaded yet, the next load will read the change from the database
+            if self._counts is not None and old_status is not None:
+                key = (old_status, library_id)
+                remaining = self._counts.get(key, 0) - count
+                if remaining > 0:
+                    self._counts[key] = remaining
+                else:
+                    self._counts.pop(key, None)
+            if self._counts is not None and new_status is not None:
+                key = (new_status, library_id)
+                self._counts[key] = self._counts.get(key, 0) + count
+            if new_status is not None:
+                self.__notify([new_status])
+
+    def count(self, status=None, library_ids=None):
+        """
+        Returns the number of tasks, optionally filtered by status and library IDs
+
+        :param status:
+        :param library_ids:
+        :return:
+        """
+        with self._condition:
+            return self.__count(status, library_ids=library_ids)
+
+    def wait_for_status(self, status, timeout=None):
+        """
+        Block until at least one task has the given status, or until the timeout expires or notify_all() is called.
+        Returns True if a task with the given status exists.
+
+        :param status:
+        :param timeout:
+        :return:
+        """
+        with self._condition:
+            if self.__count(status) > 0:
+                return True
+            self._condition.wait(timeout=timeout)
+            return self.__count(status) > 0
+
+    def add_listener(self, listener):
+        """
+        Register a callable that is passed the new status each time tasks transition to it.
+        Listeners are called while the counters lock is held, so they must return quickly.
+
+        :param listener:
+        :return:
+        """
+        with self._condition:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """
+        Remove a listener registered with add_listener()
+
+        :param listener:
+        :return:
+        """
+        with self._condition:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def notify_all(self):
+        """
+        Wake all threads waiting in wait_for_status()
+
+        :return:
+        """
+        with self._condition:
+            self._condition.notify_all()
@@ -38,8 +38,10 @@ from peewee import OperationalError
 
 from unmanic import config
 from unmanic.libs import common, task
+from unmanic.libs.library import Library
 from unmanic.libs.logs import UnmanicLogging
 from unmanic.libs.plugins import PluginsHandler
+from unmanic.libs.tasklogs import TaskLogStore
 from unmanic.libs.unmodels.tasks import Tasks
 
 
@@ -58,6 +60,9 @@ class TaskHandler(threading.Thread):
             -
     """
 
+    # The max number of queued paths that are created as tasks together
+    task_insert_chunk_size = 500
+
     def __init__(self, data_queues, task_queue, event):
         super(TaskHandler, self).__init__(name='TaskHandler')
         self.settings = config.Config()
@@ -88,20 +93,33 @@ class TaskHandler(threading.Thread):
 
         self._log("Leaving TaskHandler Monitor loop...")
 
+    def __drain_queue(self, data_queue):
+        """
+        Fetch up to task_insert_chunk_size items from a data queue without blocking
+
+        :param data_queue:
+        :return:
+        """
+        items = []
+        while len(items) < self.task_insert_chunk_size:
+            try:
+                items.append(data_queue.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
     def process_scheduledtasks_queue(self):
         while not self.abort_flag.is_set() and not self.scheduledtasks.empty():
             # Do not sleep at all here. Process this loop as quick as possible
             try:
-                item = self.scheduledtasks.get_nowait()
-                pathname = item['pathname']
-                library_id = item['library_id']
-                priority_score = item.get('priority_score', 0)
-                if self.add_path_to_task_queue(pathname, library_id, priority_score=priority_score):
-                    self._log("Adding file to task queue", pathname, level='info')
-                else:
-                    self._log("Skipping file as it is already in the queue", pathname, level='info')
-            except queue.Empty:
-                continue
+                items = self.__drain_queue(self.scheduledtasks)
+                added_paths = self.add_paths_to_task_queue(items)
+                for item in items:
+                    pathname = item['pathname']
+                    if os.path.abspath(pathname) in added_paths:
+                        self._log("Adding file to task queue", pathname, level='info')
+                    else:
+                        self._log("Skipping file as it is already in the queue", pathname, level='info')
             except Exception as e:
                 self._log("Exception in processing scheduledtasks", str(e), level='exception')
 
@@ -109,18 +127,16 @@ class TaskHandler(threading.Thread):
         while not self.abort_flag.is_set() and not self.inotifytasks.empty():
             # Do not sleep at all here. Process this loop as quick as possible
             try:
-                item = self.inotifytasks.get_nowait()
-                pathname = item['pathname']
-                library_id = item['library_id']
-                priority_score = item.get('priority_score', 0)
                 # TODO: Ensure the file is not still being modified at this point.
                 #  If it is still being modified here, it is ok to wait for that to finish (should not matter much)
-                if self.add_path_to_task_queue(pathname, library_id, priority_score=priority_score):
-                    self._log("Adding inotify job to queue", pathname, level='info')
-                else:
-                    self._log("Skipping inotify job already in the queue", pathname, level='info')
-            except queue.Empty:
-                continue
+                items = self.__drain_queue(self.inotifytasks)
+                added_paths = self.add_paths_to_task_queue(items)
+                for item in items:
+                    pathname = item['pathname']
+                    if os.path.abspath(pathname) in added_paths:
+                        self._log("Adding inotify job to queue", pathname, level='info')
+                    else:
+                        self._log("Skipping inotify job already in the queue", pathname, level='info')
             except Exception as e:
                 self._log("Exception in processing inotifytasks", str(e), level='exception')
 
@@ -135,14 +151,18 @@ class TaskHandler(threading.Thread):
             if where_clause is not None:
                 select_query = select_query.where(where_clause)
             # Remove any task data associated with the tasks
-            for (task_id,) in select_query.tuples():
-                task.TaskDataStore.clear_task(task_id)
+            task_ids = [task_id for (task_id,) in select_query.tuples()]
+            task.TaskDataStore.clear_tasks(task_ids)
+            for task_id in task_ids:
+                TaskLogStore.clear_task(task_id)
             # Delete the tasks
             delete_query = Tasks.delete()
             if where_clause is not None:
                 delete_query = delete_query.where(where_clause)
             rows_deleted_count = delete_query.execute()
             self._log("Deleted {} items from tasks list".format(rows_deleted_count), level='debug')
+            # Seed the task status counters from what remains
+            task.TaskStatusCounters().reload()
         except OperationalError as error:
             self._log("Skipping task cleanup at startup; tasks table missing", str(error), level='debug')
 
@@ -187,6 +207,67 @@ class TaskHandler(threading.Thread):
 
         return True
 
+    def add_paths_to_task_queue(self, items):
+        """
+        Add many paths to the task queue at once ensuring that each path is only added once
+
+        Each item is a dictionary with the 'pathname', 'library_id' and an optional 'priority_score'
+        (the same as the items read from the scheduledtasks and inotifytasks queues).
+        Paths for a library that cannot be read are skipped.
+        Returns the set of absolute paths that were added as new tasks.
+
+        :param items:
+        :return:
+        """
+        cache_root = self.settings.get_cache_path()
+        library_priority_scores = {}
+        cache_paths = set()
+        task_rows = {}
+        for item in items:
+            abspath = os.path.abspath(item['pathname'])
+            if abspath in task_rows:
+                continue
+            library_id = item['library_id']
+            if library_id not in library_priority_scores:
+                # A path for a library that no longer exists is skipped without dropping the rest of the batch
+                try:
+                    library_priority_scores[library_id] = int(Library(library_id).get_priority_score())
+                except Exception as e:
+                    self._log("Skipping paths for library {}".format(library_id), str(e), level='error')
+                    library_priority_scores[library_id] = None
+            if library_priority_scores[library_id] is None:
+                continue
+            # Ensure the generated cache paths are unique within this batch
+            cache_path = task.generate_cache_path(abspath, cache_root)
+            while cache_path in cache_paths:
+                cache_path = task.generate_cache_path(abspath, cache_root)
+            cache_paths.add(cache_path)
+            task_rows[abspath] = {
+                'abspath':    abspath,
+                'cache_path': cache_path,
+                'library_id': library_id,
+                'priority':   library_priority_scores[library_id] + int(item.get('priority_score', 0)),
+            }
+        created_tasks = task.Task.create_local_tasks(list(task_rows.values()))
+        if not created_tasks:
+            return set()
+
+        # Execute event plugin runners
+        plugin_handler = PluginsHandler()
+        if plugin_handler.get_enabled_plugin_modules_by_type('events.task_queued'):
+            for task_id, abspath, library_id in created_tasks:
+                plugin_handler.run_event_plugins_for_plugin_type('events.task_queued', {
+                    'library_id':  library_id,
+                    'task_id':     task_id,
+                    'task_type':   'local',
+                    'source_data': {
+                        'abspath':  abspath,
+                        'basename': os.path.basename(abspath),
+                    },
+                })
+
+        return set(abspath for _, abspath, _ in created_tasks)
+
     def create_task_from_path(self, pathname, library_id, priority_score=0):
         """
         Generate a Task object from a pathname
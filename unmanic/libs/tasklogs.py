@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.tasklogs.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import os
+import threading
+from collections import deque
+
+from unmanic import config
+
+
+class TaskLogStore(object):
+    """
+    Append-only store for the command logs of running tasks.
+
+    Each task's log is written to its own file in the 'task_logs' directory of the config path.
+    Keeping the logs out of the tasks table means that task listings do not read them and appending
+    a line does not rewrite the whole row. The log is only read when it is explicitly requested.
+    """
+
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_log_directory():
+        settings = config.Config()
+        return os.path.join(settings.get_config_path(), 'task_logs')
+
+    @classmethod
+    def get_log_path(cls, task_id):
+        return os.path.join(cls.get_log_directory(), '{}.log'.format(int(task_id)))
+
+    @classmethod
+    def append(cls, task_id, log_lines):
+        """
+        Append a list of log lines to the task's log
+
+        :param task_id:
+        :param log_lines:
+        :return:
+        """
+        log_path = cls.get_log_path(task_id)
+        with cls._lock:
+            if not os.path.exists(os.path.dirname(log_path)):
+                os.makedirs(os.path.dirname(log_path), exist_ok=True)
+            with open(log_path, 'a', encoding='utf-8') as f:
+                f.writelines(log_lines)
+
+    @classmethod
+    def iter_chunks(cls, task_id, chunk_size=1048576):
+        """
+        Yield the task's log in chunks of up to chunk_size characters
+
+        :param task_id:
+        :param chunk_size:
+        :return:
+        """
+        try:
+            with open(cls.get_log_path(task_id), 'r', encoding='utf-8', errors='replace') as f:
+                while True:
+                    chunk = f.read(chunk_size)
+                    if not chunk:
+                        return
+                    yield chunk
+        except FileNotFoundError:
+            return
+
+    @classmethod
+    def read(cls, task_id):
+        """
+        Return the task's full log as a string
+
+        :param task_id:
+        :return:
+        """
+        return ''.join(cls.iter_chunks(task_id))
+
+    @classmethod
+    def tail(cls, task_id, line_count=20):
+        """
+        Return the last lines of the task's log without reading it all into memory
+
+        :param task_id:
+        :param line_count:
+        :return:
+        """
+        try:
+            with open(cls.get_log_path(task_id), 'r', encoding='utf-8', errors='replace') as f:
+                return [line.rstrip('\n') for line in deque(f, maxlen=line_count)]
+        except FileNotFoundError:
+            return []
+
+    @classmethod
+    def clear_task(cls, task_id):
+        """
+        Remove the task's log
+
+        :param task_id:
+        :return:
+        """
+        try:
+            os.remove(cls.get_log_path(task_id))
+        except FileNotFoundError:
+            pass
@@ -34,6 +34,7 @@ from unmanic.libs import task
 from unmanic.libs import common
 from unmanic.libs.logs import UnmanicLogging
 from unmanic.libs.unmodels import Libraries, LibraryTags, Tags
+from unmanic.libs.unmodels.lib import supports_returning
 from unmanic.libs.unmodels.tasks import Tasks
 
 """
@@ -73,8 +74,30 @@ def build_tasks_query(status, sort_by='id', sort_order='asc', local_only=False,
     :param library_tags:
     :return:
     """
+    query = build_next_task_select_query(status, sort_by=sort_by, sort_order=sort_order, local_only=local_only,
+                                         library_names=library_names, library_tags=library_tags)
+    return query.first()
+
+
+def build_next_task_select_query(status, sort_by='id', sort_order='asc', local_only=False, library_names=None,
+                                 library_tags=None, columns=None):
+    """
+    Return a query that selects the first task item in the task list filtered by status
+    and sorted by the self.sort_by and self.sort_order variables.
+
+    :param status:
+    :param sort_order:
+    :param sort_by:
+    :param local_only:
+    :param library_names:
+    :param library_tags:
+    :param columns:
+    :return:
+    """
     # pick query based on sort params
-    query = Tasks.select().where((Tasks.status == status))
+    if columns is None:
+        columns = []
+    query = Tasks.select(*columns).where((Tasks.status == status))
 
     # Limit to one result
     if local_only:
@@ -98,7 +121,7 @@ def build_tasks_query(status, sort_by='id', sort_order='asc', local_only=False,
         query = query.order_by(sort_by.asc())
     else:
         query = query.order_by(sort_by.desc())
-    return query.first()
+    return query
 
 
 def build_tasks_query_full_task_list(status, sort_by='id', sort_order='asc', limit=None):
@@ -152,6 +175,58 @@ def fetch_next_task_filtered(status, sort_by='id', sort_order='asc', local_only=
     return next_task
 
 
+def claim_next_task_filtered(status, new_status, sort_by='id', sort_order='asc', local_only=False, library_names=None,
+                             library_tags=None):
+    """
+    Claims the next task in the task list for a given status by setting it to the new status.
+
+    The task is selected, updated and read back in a single UPDATE ... RETURNING statement.
+    The update also requires the task to still be in the given status, so two callers can never claim the same task.
+    If the SQLite library does not support RETURNING, the task is selected first and then claimed with a
+    conditional UPDATE. When another caller claimed it in between, the next task is selected.
+
+    :param status:
+    :param new_status:
+    :param sort_order:
+    :param sort_by:
+    :param local_only:
+    :param library_names:
+    :param library_tags:
+    :return:
+    """
+    next_task_id_query = build_next_task_select_query(status, sort_by=sort_by, sort_order=sort_order,
+                                                      local_only=local_only, library_names=library_names,
+                                                      library_tags=library_tags, columns=[Tasks.id])
+    # The counters lock is not held while the update waits for the database writer
+    task_status_counters = task.TaskStatusCounters()
+    generation = task_status_counters.get_generation()
+    if supports_returning():
+        query = Tasks.update(status=new_status)
+        query = query.where(Tasks.id.in_(next_task_id_query))
+        query = query.where(Tasks.status == status)
+        query = query.returning(Tasks)
+        task_rows = list(query.execute())
+    else:
+        task_rows = []
+        while not task_rows:
+            task_id = next_task_id_query.scalar()
+            if task_id is None:
+                break
+            query = Tasks.update(status=new_status)
+            query = query.where(Tasks.id == task_id)
+            query = query.where(Tasks.status == status)
+            # If another caller claimed this task first, no row is updated and the next task is selected
+            if query.execute():
+                task_rows = [Tasks.get_by_id(task_id)]
+    for task_row in task_rows:
+        task_status_counters.transition(task_row.library_id, status, new_status, generation=generation)
+    if not task_rows:
+        return False
+    next_task = task.Task()
+    next_task.set_task_from_row(task_rows[0])
+    return next_task
+
+
 class TaskQueue(object):
     """
     TaskQueue
@@ -226,20 +301,17 @@ class TaskQueue(object):
 
     def get_next_pending_tasks(self, local_only=False, library_names=None, library_tags=None):
         """
-        Fetch the next pending task.
-        Set that task status as 'in_progress' and then return it.
+        Claim the next pending task.
+        The task status is set to 'in_progress' in the same statement that selects it.
 
         :param local_only:
         :param library_names:
         :param library_tags:
         :return:
         """
-        # Fetch Task item matching the filters specified
-        task_item = fetch_next_task_filtered('pending', sort_by=self.sort_by, sort_order=self.sort_order,
-                                             local_only=local_only, library_names=library_names, library_tags=library_tags)
-        if task_item:
-            self.mark_item_in_progress(task_item)
-        return task_item
+        # Claim the Task item matching the filters specified
+        return claim_next_task_filtered('pending', 'in_progress', sort_by=self.sort_by, sort_order=self.sort_order,
+                                        local_only=local_only, library_names=library_names, library_tags=library_tags)
 
     def get_next_processed_tasks(self):
         # Fetch Task item matching the filters specified
@@ -251,32 +323,40 @@ class TaskQueue(object):
         return task_handler.reorder_tasks([task_id], 'bottom')
 
     """
-    Check if a particular task list is empty
+    Check if a particular task list is empty.
+    These read the in-memory task status counters rather than querying the database
     """
 
     @staticmethod
     def task_list_pending_is_empty():
-        # Fetch only on result in order to know that there are any at all
-        pending_query_count = build_tasks_count_query('pending')
-        if pending_query_count > 0:
-            return False
-        return True
+        return task.TaskStatusCounters().count(status='pending') == 0
 
     @staticmethod
     def task_list_in_progress_is_empty():
-        # Fetch only on result in order to know that there are any at all
-        pending_query_count = build_tasks_count_query('in_progress')
-        if pending_query_count > 0:
-            return False
-        return True
+        return task.TaskStatusCounters().count(status='in_progress') == 0
 
     @staticmethod
     def task_list_processed_is_empty():
-        # Fetch only on result in order to know that there are any at all
-        pending_query_count = build_tasks_count_query('processed')
-        if pending_query_count > 0:
-            return False
-        return True
+        return task.TaskStatusCounters().count(status='processed') == 0
+
+    @staticmethod
+    def task_list_processed_count():
+        return task.TaskStatusCounters().count(status='processed')
+
+    """
+    Wait for a particular task list to have items
+    """
+
+    @staticmethod
+    def wait_for_processed_tasks(timeout=None):
+        """
+        Block until there is at least one 'processed' task or the timeout expires.
+        Returns True if there are processed tasks.
+
+        :param timeout:
+        :return:
+        """
+        return task.TaskStatusCounters().wait_for_status('processed', timeout=timeout)
 
     """
     Set the status of a task item
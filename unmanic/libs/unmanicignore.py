@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.unmanicignore.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+import os
+import re
+import threading
+import time
+
+from unmanic.libs.logs import UnmanicLogging
+from unmanic.libs.singleton import SingletonType
+
+IGNORE_FILE_NAME = '.unmanicignore'
+
+
+class UnmanicIgnoreRule(object):
+    """
+    UnmanicIgnoreRule
+
+    A single compiled line from a '.unmanicignore' file.
+
+    Patterns follow the '.gitignore' syntax:
+        - Blank lines and lines starting with '#' are skipped
+        - A leading '!' re-includes paths excluded by an earlier rule
+        - A trailing '/' only matches directories
+        - A pattern containing a '/' is relative to the directory of the ignore file,
+          otherwise it matches a name at any depth below it
+        - '*', '?', '[...]' and '**' globs are supported
+
+    For compatibility with older ignore files, a line that is exactly a file's name always matches it,
+    even if that name contains glob characters (eg. 'Movie [1080p].mkv').
+    """
+
+    def __init__(self, line):
+        self.negate = False
+        self.dir_only = False
+        self.literal = None
+        self.regex = None
+
+        pattern = line.rstrip('\n').rstrip('\r')
+        # Trailing spaces are ignored unless escaped
+        if not pattern.endswith('\\ '):
+            pattern = pattern.rstrip()
+        if not pattern or pattern.startswith('#'):
+            return
+        if pattern.startswith('!'):
+            self.negate = True
+            pattern = pattern[1:]
+        elif pattern.startswith('\\#') or pattern.startswith('\\!'):
+            pattern = pattern[1:]
+        if not self.negate:
+            self.literal = pattern
+        if pattern.endswith('/'):
+            self.dir_only = True
+            pattern = pattern.rstrip('/')
+        if not pattern:
+            return
+        anchored = '/' in pattern
+        pattern = pattern.lstrip('/')
+        regex = self.translate(pattern)
+        if not anchored:
+            regex = '(?:.*/)?' + regex
+        self.regex = re.compile('^' + regex + '$', re.DOTALL)
+
+    @staticmethod
+    def translate(pattern):
+        """
+        Convert a '.gitignore' glob to a regular expression matched against a '/' separated relative path
+
+        :param pattern:
+        :return:
+        """
+        regex = ''
+        i = 0
+        length = len(pattern)
+        while i < length:
+            c = pattern[i]
+            if c == '*':
+                if pattern[i:i + 2] == '**':
+                    at_start = (i == 0 or pattern[i - 1] == '/')
+                    at_end = (i + 2 == length or pattern[i + 2] == '/')
+                    if at_start and at_end:
+                        if i + 2 == length:
+                            # 'dir/**' matches everything inside
+                            regex += '.*'
+                        else:
+                            # '**/' matches zero or more directories
+                            regex += '(?:.*/)?'
+                            i += 1
+                        i += 2
+                        continue
+                regex += '[^/]*'
+            elif c == '?':
+                regex += '[^/]'
+            elif c == '[':
+                end = pattern.find(']', i + 2 if pattern[i + 1:i + 2] in ('!', '^') else i + 1)
+                if end == -1:
+                    regex += re.escape(c)
+                else:
+                    char_class = pattern[i + 1:end]
+                    if char_class[:1] in ('!', '^'):
+                        char_class = '^' + char_class[1:]
+                    regex += '[' + char_class.replace('\\', '\\\\') + ']'
+                    i = end
+            elif c == '\\' and i + 1 < length:
+                i += 1
+                regex += re.escape(pattern[i])
+            else:
+                regex += re.escape(c)
+            i += 1
+        return regex
+
+    def is_valid(self):
+        return self.regex is not None
+
+    def matches(self, relative_path, is_dir):
+        """
+        Check if a '/' separated path, relative to the ignore file's directory, matches this rule
+
+        :param relative_path:
+        :param is_dir:
+        :return:
+        """
+        if self.dir_only and not is_dir:
+            return False
+        if self.literal is not None and relative_path.rsplit('/', 1)[-1] == self.literal:
+            return True
+        return self.regex.match(relative_path) is not None
+
+
+class UnmanicIgnoreFiles(object, metaclass=SingletonType):
+    """
+    UnmanicIgnoreFiles
+
+    Process-wide cache of the compiled rules of every '.unmanicignore' file looked up.
+
+    Each directory is checked for an ignore file at most once every VALIDATE_INTERVAL seconds.
+    The compiled rules are only re-read when the ignore file's mtime changes.
+    """
+
+    # Seconds between checks of a directory's ignore file for changes
+    VALIDATE_INTERVAL = 1.0
+    # Max number of directories held in the cache
+    MAX_ENTRIES = 100000
+
+    def __init__(self):
+        self.logger = UnmanicLogging.get_logger(name=__class__.__name__)
+        self._lock = threading.Lock()
+        # Map of directory to [checked_at, mtime_ns, rules]
+        self._directories = {}
+
+    def clear(self):
+        with self._lock:
+            self._directories = {}
+
+    def __read_rules(self, ignore_file):
+        rules = []
+        try:
+            with open(ignore_file, errors='replace') as f:
+                for line in f:
+                    rule = UnmanicIgnoreRule(line)
+                    if rule.is_valid():
+                        rules.append(rule)
+        except OSError as e:
+            self.logger.warning("Unable to read ignore file '%s' - %s", ignore_file, e)
+        return rules
+
+    def get_rules(self, directory):
+        """
+        Return the compiled rules of the ignore file in a directory (an empty list if there is none)
+
+        :param directory:
+        :return:
+        """
+        now = time.monotonic()
+        with self._lock:
+            cached = self._directories.get(directory)
+            if cached is not None and (now - cached[0]) < self.VALIDATE_INTERVAL:
+                return cached[2]
+
+        ignore_file = os.path.join(directory, IGNORE_FILE_NAME)
+        try:
+            mtime_ns = os.stat(ignore_file).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+
+        if cached is not None and cached[1] == mtime_ns:
+            rules = cached[2]
+        elif mtime_ns is None:
+            rules = []
+        else:
+            rules = self.__read_rules(ignore_file)
+
+        with self._lock:
+            if len(self._directories) >= self.MAX_ENTRIES:
+                self._directories = {}
+            self._directories[directory] = [now, mtime_ns, rules]
+        return rules
+
+    def is_ignored(self, path, root, is_dir=False):
+        """
+        Check if a path is excluded by the '.unmanicignore' files in any directory from root down to its parent.
+
+        As with '.gitignore' files, the last matching rule wins, and nothing within an ignored
+        directory can be re-included.
+
+        :param path:
+        :param root:
+        :param is_dir:
+        :return:
+        """
+        path = os.path.normpath(path)
+        root = os.path.normpath(root) if root else None
+        if not root or os.path.commonpath([path, root]) != root or path == root:
+            root = os.path.dirname(path)
+        parts = os.path.relpath(path, root).split(os.sep)
+
+        rules_by_depth = []
+        directory = root
+        for depth in range(len(parts)):
+            if depth:
+                directory = os.path.join(directory, parts[depth - 1])
+            rules_by_depth.append(self.get_rules(directory))
+
+        # Check each ancestor directory below root, then the path itself
+        for end in range(1, len(parts) + 1):
+            candidate_is_dir = end < len(parts) or is_dir
+            ignored = False
+            for depth in range(end):
+                rules = rules_by_depth[depth]
+                if not rules:
+                    continue
+                relative_path = '/'.join(parts[depth:end])
+                for rule in rules:
+                    if rule.matches(relative_path, candidate_is_dir):
+                        ignored = not rule.negate
+            if ignored:
+                return True
+        return False
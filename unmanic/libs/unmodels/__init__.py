@@ -37,14 +37,17 @@ from .completedtasks import CompletedTasks
 from .enabledplugins import EnabledPlugins
 from .filemetadata import FileMetadata
 from .filemetadatapaths import FileMetadataPaths
+from .filetestdecisions import FileTestDecisions
 from .installation import Installation
 from .pluginrepos import PluginRepos
 from .plugins import Plugins
 from .libraries import Libraries, LibraryTags
+from .libraryfileindex import LibraryFileIndex
 from .librarypluginflow import LibraryPluginFlow
 from .tags import Tags
 from .taskmetadata import TaskMetadata
 from .tasks import Tasks
+from .taskstatuscounts import TaskStatusCounts
 from .workergroups import WorkerGroupTags, WorkerGroups
 from .workerschedules import WorkerSchedules
 
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.filetestdecisions.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+
+from peewee import *
+
+from unmanic.libs.unmodels.lib import BaseModel
+
+
+class FileTestDecisions(BaseModel):
+    """
+    FileTestDecisions
+
+    Records the result of running a file through a library's 'library_management.file_test' plugin flow.
+    A result is only reused while the file's size and mtime, and the library's configuration hash, are unchanged.
+    """
+    library_id = IntegerField(null=False, index=True)
+    path = TextField(null=False)
+    size = BigIntegerField(null=False, default=0)
+    mtime_ns = BigIntegerField(null=False, default=0)
+    config_hash = TextField(null=False, default='')
+    add_file_to_pending_tasks = BooleanField(null=True)
+    issues = TextField(null=False, default='[]')
+    priority_score = BigIntegerField(null=False, default=0)
+    decision_plugin = TextField(null=False, default='null')
+
+    class Meta:
+        table_name = 'file_test_decisions'
+        indexes = (
+            (('library_id', 'path'), True),
+        )
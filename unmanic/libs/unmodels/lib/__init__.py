@@ -35,6 +35,7 @@ from __future__ import absolute_import
 from .basemodel import BaseModel
 from .basemodel import Database
 from .basemodel import db
+from .basemodel import supports_returning
 
 __author__ = 'Josh.5 (jsunnex@gmail.com)'
 
@@ -42,4 +43,5 @@ __all__ = (
     'BaseModel',
     'Database',
     'db',
+    'supports_returning',
 )
@@ -30,6 +30,8 @@
 
 """
 
+import sqlite3
+
 from peewee import *
 from playhouse.sqliteq import SqliteQueueDatabase
 from datetime import datetime
@@ -50,6 +52,15 @@ DATETIME_FORMAT = DATETIME_BASE.format(DATE_FORMAT, TIME_FORMAT)
 DATETIME_FORMAT_ALT = DATETIME_BASE.format(DATE_FORMAT, TIME_FORMAT_ALT)
 
 
+def supports_returning():
+    """
+    Check if the SQLite library supports the RETURNING clause (added in SQLite 3.35.0).
+    Queries that use it should fall back to separate SELECT and write statements when it is not supported.
+
+    """
+    return sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
 def strpdatetime(string):
     """
     Parses the datetime from a string.
@@ -47,6 +47,8 @@ class Libraries(BaseModel):
     enable_scanner = BooleanField(null=False, default=False)
     enable_inotify = BooleanField(null=False, default=False)
     priority_score = BigIntegerField(null=False, default=0)
+    # JSON encoded file prefilters. See unmanic.libs.prefilters.FilePrefilter
+    prefilters = TextField(null=False, default='{}')
     # ManyToMany Linking field. Does not create a column in the DB. See linking table below
     tags = ManyToManyField(Tags, backref='tags')
 
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.searchindexes.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+
+from peewee import SQL
+
+from unmanic.libs.unmodels.lib import db
+
+# The (table, column) pairs that have a full-text search index for substring searches
+SEARCHABLE_COLUMNS = (
+    ('tasks', 'abspath'),
+    ('completedtasks', 'task_label'),
+    ('file_metadata_paths', 'path'),
+)
+
+# The trigram tokenizer can only match search values of at least 3 characters
+MIN_SEARCH_INDEX_LENGTH = 3
+
+_search_index_available = {}
+
+
+def search_index_name(table_name):
+    return '{}_search'.format(table_name)
+
+
+def create_search_index_statements(table_name, column_name):
+    """
+    Returns the SQL statements that create an FTS5 trigram index for a column,
+    the triggers that keep it in step with the table, and fill it with the table's current rows.
+
+    :param table_name:
+    :param column_name:
+    :return:
+    """
+    params = {
+        'index':  search_index_name(table_name),
+        'table':  table_name,
+        'column': column_name,
+    }
+    return [
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS {index} USING fts5(
+            {column}, content='{table}', content_rowid='id', tokenize='trigram'
+        )
+        """.format(**params),
+        """
+        CREATE TRIGGER IF NOT EXISTS {index}_after_insert AFTER INSERT ON {table}
+        BEGIN
+            INSERT INTO {index} (rowid, {column}) VALUES (NEW.id, NEW.{column});
+        END
+        """.format(**params),
+        """
+        CREATE TRIGGER IF NOT EXISTS {index}_after_delete AFTER DELETE ON {table}
+        BEGIN
+            INSERT INTO {index} ({index}, rowid, {column}) VALUES ('delete', OLD.id, OLD.{column});
+        END
+        """.format(**params),
+        """
+        CREATE TRIGGER IF NOT EXISTS {index}_after_update AFTER UPDATE OF {column} ON {table}
+        BEGIN
+            INSERT INTO {index} ({index}, rowid, {column}) VALUES ('delete', OLD.id, OLD.{column});
+            INSERT INTO {index} (rowid, {column}) VALUES (NEW.id, NEW.{column});
+        END
+        """.format(**params),
+        "INSERT INTO {index} ({index}) VALUES ('rebuild')".format(**params),
+    ]
+
+
+def drop_search_index_statements(table_name):
+    """
+    Returns the SQL statements that remove a column's search index and its triggers
+
+    :param table_name:
+    :return:
+    """
+    index_name = search_index_name(table_name)
+    return [
+        "DROP TRIGGER IF EXISTS {}_after_insert".format(index_name),
+        "DROP TRIGGER IF EXISTS {}_after_delete".format(index_name),
+        "DROP TRIGGER IF EXISTS {}_after_update".format(index_name),
+        "DROP TABLE IF EXISTS {}".format(index_name),
+    ]
+
+
+def search_index_available(table_name):
+    """
+    Check if the search index for a table exists in the current database.
+    The index is not created if the SQLite library does not provide FTS5 with the trigram tokenizer.
+
+    :param table_name:
+    :return:
+    """
+    key = (id(db.obj), table_name)
+    if key not in _search_index_available:
+        cursor = db.execute_sql("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                                (search_index_name(table_name),))
+        _search_index_available[key] = cursor.fetchone() is not None
+    return _search_index_available[key]
+
+
+def contains_search_value(field, search_value):
+    """
+    Returns a where clause expression matching rows where the field contains the search value (case-insensitive).
+
+    The column's search index is used when it is available and the search value is long enough.
+    Otherwise, this falls back to a LIKE expression.
+
+    :param field:
+    :param search_value:
+    :return:
+    """
+    table_name = field.model._meta.table_name
+    if len(search_value) >= MIN_SEARCH_INDEX_LENGTH and search_index_available(table_name):
+        index_name = search_index_name(table_name)
+        phrase = '"{}"'.format(search_value.replace('"', '""'))
+        return field.model._meta.primary_key.in_(
+            SQL('(SELECT rowid FROM {0} WHERE {0} MATCH ?)'.format(index_name), [phrase])
+        )
+    return field.contains(search_value)
@@ -50,4 +50,10 @@ class Tasks(BaseModel):
     start_time = DateTimeField(null=True, default=datetime.datetime.now)
     finish_time = DateTimeField(null=True, default=datetime.datetime.now)
     processed_by_worker = TextField(null=True)
-    log = TextField(null=False, default='')
+    log = TextField(null=False, default='')  # Deprecated. Running task logs are kept in the TaskLogStore
+
+    class Meta:
+        indexes = (
+            # Serves the pending task listing and the next task claim ordered by priority
+            (('status', 'priority'), False),
+        )
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    unmanic.taskstatuscounts.py
+
+    Written by:               Josh.5 <jsunnex@gmail.com>
+    Date:                     17 Oct 2026
+
+    Copyright:
+           Copyright (C) Josh Sunnex - All Rights Reserved
+
+           Permission is hereby granted, free of charge, to any person obtaining a copy
+           of this software and associated documentation files (the "Software"), to deal
+           in the Software without restriction, including without limitation the rights
+           to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+           copies of the Software, and to permit persons to whom the Software is
+           furnished to do so, subject to the following conditions:
+
+           The above copyright notice and this permission notice shall be included in all
+           copies or substantial portions of the Software.
+
+           THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+           EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+           MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+           IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+           DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR
+           OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE
+           OR OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+
+from peewee import *
+
+from unmanic.libs.unmodels.lib import BaseModel
+
+# Triggers that keep the task_status_counts table in step with every insert, delete
+# and status or library change on the tasks table.
+TASK_STATUS_COUNT_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_status_counts_after_insert AFTER INSERT ON tasks
+    BEGIN
+        INSERT OR IGNORE INTO task_status_counts (library_id, status, count) VALUES (NEW.library_id, NEW.status, 0);
+        UPDATE task_status_counts SET count = count + 1 WHERE library_id = NEW.library_id AND status = NEW.status;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_status_counts_after_delete AFTER DELETE ON tasks
+    BEGIN
+        UPDATE task_status_counts SET count = count - 1 WHERE library_id = OLD.library_id AND status = OLD.status;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_status_counts_after_update AFTER UPDATE OF status, library_id ON tasks
+    WHEN OLD.status IS NOT NEW.status OR OLD.library_id IS NOT NEW.library_id
+    BEGIN
+        UPDATE task_status_counts SET count = count - 1 WHERE library_id = OLD.library_id AND status = OLD.status;
+        INSERT OR IGNORE INTO task_status_counts (library_id, status, count) VALUES (NEW.library_id, NEW.status, 0);
+        UPDATE task_status_counts SET count = count + 1 WHERE library_id = NEW.library_id AND status = NEW.status;
+    END
+    """,
+]
+
+# Rebuild all counts from the tasks table
+TASK_STATUS_COUNT_REBUILD = [
+    "DELETE FROM task_status_counts",
+    """
+    INSERT INTO task_status_counts (library_id, status, count)
+    SELECT library_id, status, COUNT(*) FROM tasks GROUP BY library_id, status
+    """,
+]
+
+
+class TaskStatusCounts(BaseModel):
+    """
+    TaskStatusCounts
+
+    The number of tasks in each status for each library.
+    Rows are maintained by triggers on the tasks table (see TASK_STATUS_COUNT_TRIGGERS),
+    so reading a count does not need to scan the tasks table.
+    """
+    library_id = IntegerField(null=False)
+    status = TextField(null=False)
+    count = BigIntegerField(null=False, default=0)
+
+    class Meta:
+        table_name = 'task_status_counts'
+        indexes = (
+            (('library_id', 'status'), True),
+        )
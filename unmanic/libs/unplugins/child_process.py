@@ -29,14 +29,15 @@
            OR OTHER DEALINGS IN THE SOFTWARE.
 
 """
-import queue
 import signal
 import threading
 import time
+from multiprocessing.connection import wait
 
 import psutil
 
 from unmanic.libs.logs import UnmanicLogging
+from unmanic.libs.task import TaskDataStore
 
 # Configure a global shared manager
 _shared_manager = None
@@ -146,11 +147,74 @@ def kill_all_plugin_processes():
 
 
 def set_shared_manager(mgr):
-    """Called once at service startup to inject the shared Manager."""
+    """
+    Inject a shared Manager.
+    PluginChildProcess and the TaskDataStore no longer need one. It is kept for existing callers.
+    """
     global _shared_manager
     _shared_manager = mgr
 
 
+class _ChildLogPipe:
+    """
+    Passed to the child target as 'log_queue'.
+    Sends each log line straight to the parent over the write end of a pipe.
+    """
+
+    def __init__(self, conn, send_lock):
+        self._conn = conn
+        self._send_lock = send_lock
+
+    def put(self, message, block=True, timeout=None):
+        with self._send_lock:
+            self._conn.send(('log', message))
+
+    put_nowait = put
+
+
+class _ChildProgressPipe:
+    """
+    Passed to the child target as 'prog_queue'.
+    Progress only needs the latest value, so updates are coalesced and sent to the parent at most
+    once every 'min_interval' seconds. A pending update is sent by a timer once the interval has passed.
+    """
+
+    def __init__(self, conn, send_lock, min_interval=0.1):
+        self._conn = conn
+        self._send_lock = send_lock
+        self._min_interval = min_interval
+        self._pending = None
+        self._has_pending = False
+        self._last_sent = 0
+        self._timer = None
+
+    def __send_pending(self):
+        # Must be called with the send lock held
+        self._conn.send(('progress', self._pending))
+        self._has_pending = False
+        self._last_sent = time.monotonic()
+
+    def put(self, progress, block=True, timeout=None):
+        with self._send_lock:
+            self._pending = progress
+            self._has_pending = True
+            wait_seconds = self._min_interval - (time.monotonic() - self._last_sent)
+            if wait_seconds <= 0:
+                self.__send_pending()
+            elif self._timer is None:
+                self._timer = threading.Timer(wait_seconds, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    put_nowait = put
+
+    def flush(self):
+        with self._send_lock:
+            self._timer = None
+            if self._has_pending:
+                self.__send_pending()
+
+
 class PluginChildProcess:
     def __init__(self, plugin_id, data):
         """
@@ -163,11 +227,9 @@ class PluginChildProcess:
             name=f'Plugin.{plugin_id}.{__class__.__name__}'
         )
         self.data = data
-        if _shared_manager is None:
-            raise RuntimeError("PluginChildProcess must be initialized after shared Manager is set")
-        self.manager = _shared_manager
-        self._log_q = self.manager.Queue()
-        self._prog_q = self.manager.Queue()
+        # Logs and progress are sent from the child over a one-way pipe
+        self._reader = None
+        self._writer = None
         self._proc = None
         self._term_lock = threading.Lock()
 
@@ -198,13 +260,16 @@ class PluginChildProcess:
                 target_name = getattr(target, "__name__", "child_process")
                 self._set_current_command(f"PluginChildProcess: {target_name}")
         # Start child as before
-        from multiprocessing import Process
+        from multiprocessing import Pipe, Process
+        self._reader, self._writer = Pipe(duplex=False)
         self._proc = Process(
             target=self._child_entry,
             args=(target, args, kwargs),
             daemon=True
         )
         self._proc.start()
+        # Only the child writes to the pipe
+        self._writer.close()
         if self._proc.pid is not None:
             _register_pid(self._proc.pid)
         self.logger.info("Started child PID %s", self._proc.pid)
@@ -223,6 +288,7 @@ class PluginChildProcess:
         # When the child process is done, unregister
         if self._proc.pid is not None:
             _unregister_pid(self._proc.pid)
+        self._reader.close()
         self._clear_current_command()
 
         # Return success status
@@ -233,49 +299,66 @@ class PluginChildProcess:
         Runs inside the child process.
         Injects our two required queues into the call.
         """
+        self._reader.close()
+        send_lock = threading.Lock()
+        prog_queue = _ChildProgressPipe(self._writer, send_lock)
+        # Record changes to the TaskDataStore so that they can be sent back to the parent
+        TaskDataStore.start_journal()
         try:
-            kwargs['log_queue'] = self._log_q
-            kwargs['prog_queue'] = self._prog_q
+            kwargs['log_queue'] = _ChildLogPipe(self._writer, send_lock)
+            kwargs['prog_queue'] = prog_queue
             target(*args, **kwargs)
         except Exception:
             self.logger.exception("Exception in child target")
             raise
+        finally:
+            # Send all TaskDataStore changes in one batch and the final progress value before exiting
+            task_data_changes = TaskDataStore.pop_journal()
+            if task_data_changes:
+                with send_lock:
+                    self._writer.send(('task_data', task_data_changes))
+            prog_queue.flush()
 
     def _monitor(self):
         """
-        Parent loop: pull from log_q -> data['worker_log'],
-                     pull from prog_q -> call parser(...)
+        Parent loop: read log lines -> data['worker_log'],
+                     read progress updates -> call parser(...)
+                     read TaskDataStore changes -> apply them to this process' store
+        Blocks until the child sends something or exits.
         """
-        exit_ok = False
         parser = self.data.get('command_progress_parser')
+        sentinel = self._proc.sentinel
+        reader_open = True
 
         while True:
-            # 1) drain logs
-            try:
-                while True:
-                    msg = self._log_q.get_nowait()
-                    self.data['worker_log'].append(f"{msg}\n")
-            except queue.Empty:
-                pass
+            ready = wait([self._reader, sentinel] if reader_open else [sentinel])
 
-            # 2) drain progress updates
+            # Read everything that is available. Only the latest progress value is passed to the parser
+            progress = None
             try:
-                while True:
-                    pct = self._prog_q.get_nowait()
-                    if callable(parser):
-                        parser(str(pct))
-            except queue.Empty:
-                pass
-
-            # 3) if the child exited, we’re done. Unset parser PID
-            if self._proc is not None and not self._proc.is_alive():
-                exit_ok = (self._proc.exitcode == 0)
+                # Cap the number of messages read per pass so that the parser is still updated for a chatty child
+                for _ in range(1000):
+                    if not (reader_open and self._reader.poll()):
+                        break
+                    kind, value = self._reader.recv()
+                    if kind == 'log':
+                        self.data['worker_log'].append(f"{value}\n")
+                    elif kind == 'task_data':
+                        TaskDataStore.apply_journal(value)
+                    else:
+                        progress = value
+            except (EOFError, OSError):
+                # The child (and anything it started) closed the pipe
+                reader_open = False
+            if progress is not None and callable(parser):
+                parser(str(progress))
+
+            # If the child exited, we’re done once everything it sent has been read. Unset parser PID
+            if sentinel in ready:
+                if reader_open and self._reader.poll():
+                    continue
+                self._proc.join()
                 if callable(parser):
                     # tell parser to unset its internal proc state
                     parser(None, unset=True)
-                break
-
-            # Add a short wait here to prevent CPU pinning
-            time.sleep(0.1)
-
-        return exit_ok
+                return self._proc.exitcode == 0
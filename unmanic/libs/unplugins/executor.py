@@ -40,12 +40,18 @@ import sys
 from unmanic import config
 from . import plugin_types
 from unmanic.libs import common
+from unmanic.libs.configversion import ConfigVersion
 from ..logs import UnmanicLogging
 from ..task import TaskDataStore
 from unmanic.libs.metadata import UnmanicFileMetadata
 
 
 class PluginExecutor(object):
+    # Runner function names keyed by plugin type
+    _plugin_runner_names = {}
+    # Runner call adapters keyed by (plugin_id, plugin_type).
+    # Each value is a tuple of (runner function, call adapter, runner uses legacy positional helper args)
+    _runner_adapters = {}
 
     def __init__(self, plugins_directory=None):
         # Set plugins directory
@@ -209,6 +215,8 @@ class PluginExecutor(object):
                 # This will force it to be reloaded again
                 self.logger.exception("Exception encountered while trying to reload module '%s'", module_name)
                 del sys.modules[module_name]
+            # Compiled plugin flows hold references to the previous runner functions
+            ConfigVersion().bump('plugins.reload')
 
     @staticmethod
     def unload_plugin_module(plugin_id):
@@ -230,6 +238,8 @@ class PluginExecutor(object):
 
         for mn in module_names:
             del sys.modules[mn]
+        if module_names:
+            ConfigVersion().bump('plugins.unload')
 
     @staticmethod
     def get_plugin_type_meta(plugin_type):
@@ -259,29 +269,91 @@ class PluginExecutor(object):
 
         return return_plugin_types
 
+    @staticmethod
+    def get_plugin_runner_name(plugin_type):
+        """
+        Returns the name of the runner function for a given plugin type
+
+        :param plugin_type:
+        :return:
+        """
+        plugin_runner = PluginExecutor._plugin_runner_names.get(plugin_type)
+        if plugin_runner is None:
+            plugin_runner = PluginExecutor.get_plugin_type_meta(plugin_type).plugin_runner()
+            PluginExecutor._plugin_runner_names[plugin_type] = plugin_runner
+        return plugin_runner
+
+    @staticmethod
+    def build_runner_adapter(runner):
+        """
+        Inspect a runner function once and return a function that calls it with the helper arguments it accepts.
+        Also returns True if the runner is using the legacy positional helper arguments.
+
+        :param runner:
+        :return:
+        """
+        params = inspect.signature(runner).parameters
+
+        def supports_kwarg(name):
+            if name in params:
+                return True
+            for param in params.values():
+                if param.kind == inspect.Parameter.VAR_KEYWORD:
+                    return True
+            return False
+
+        def has_required_positional_after_data():
+            positional = []
+            for param in params.values():
+                if param.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD):
+                    positional.append(param)
+            # First positional is expected to be `data`
+            remaining = positional[1:]
+            for param in remaining:
+                if param.default is inspect._empty:
+                    return True
+            return False
+
+        kwargs = {}
+        if supports_kwarg("task_data_store"):
+            kwargs["task_data_store"] = TaskDataStore
+        if supports_kwarg("file_metadata"):
+            kwargs["file_metadata"] = UnmanicFileMetadata
+
+        if kwargs and not has_required_positional_after_data():
+            return lambda data: runner(data, **kwargs), False
+        # Backward compatibility: positional helpers (legacy; will be removed in a future release)
+        if len(params) >= 3:
+            return lambda data: runner(data, TaskDataStore, UnmanicFileMetadata), True
+        elif len(params) >= 2:
+            return lambda data: runner(data, TaskDataStore), True
+        return runner, True
+
     def execute_plugin_runner(self, data, plugin_id, plugin_type):
         """
         Given a data, a plugin ID, and a plugin type
         Load that plugin module and execute the runner
         Return the modified data
 
+        The way a runner is called is worked out the first time it is run and then reused until the
+        plugin module is reloaded.
+
         :param data:
         :param plugin_id:
         :param plugin_type:
         :return:
         """
-        # Get the path for this plugin
-        plugin_path = self.__get_plugin_directory(plugin_id)
-
-        # Load this plugin module
-        plugin_module = self.__load_plugin_module(plugin_id, plugin_path)
-        if not plugin_module:
-            self.logger.error("No module found with plugin_id '%s' and plugin_path '%s'", plugin_id, plugin_path)
-            return False
+        # Load this plugin module. It will only need to be imported on the first call
+        plugin_module = sys.modules.get('{}.plugin'.format(plugin_id))
+        if plugin_module is None:
+            plugin_path = self.__get_plugin_directory(plugin_id)
+            plugin_module = self.__load_plugin_module(plugin_id, plugin_path)
+            if not plugin_module:
+                self.logger.error("No module found with plugin_id '%s' and plugin_path '%s'", plugin_id, plugin_path)
+                return False
 
         # Get the called runner function for the given plugin type
-        plugin_type_meta = self.get_plugin_type_meta(plugin_type)
-        plugin_runner = plugin_type_meta.plugin_runner()
+        plugin_runner = self.get_plugin_runner_name(plugin_type)
 
         # Check if this module contains the given plugin type runner
         runner = getattr(plugin_module, plugin_runner, None)
@@ -292,6 +364,13 @@ class PluginExecutor(object):
         run_successfully = False
         task_id = data.get("task_id")
         try:
+            # Fetch the call adapter for this runner. Reloading the plugin module replaces the runner function
+            cached_runner, call_runner, uses_legacy_args = PluginExecutor._runner_adapters.get(
+                (plugin_id, plugin_type), (None, None, False))
+            if cached_runner is not runner:
+                call_runner, uses_legacy_args = self.build_runner_adapter(runner)
+                PluginExecutor._runner_adapters[(plugin_id, plugin_type)] = (runner, call_runner, uses_legacy_args)
+
             # if we have a task_id, bind context for store-based calls
             if task_id is not None:
                 TaskDataStore.bind_runner_context(
@@ -300,59 +379,23 @@ class PluginExecutor(object):
                     runner=plugin_runner,
                 )
 
-            metadata_path = data.get("path") or data.get("file_path")
-            UnmanicFileMetadata.bind_runner_context(
-                plugin_id=plugin_id,
-                task_id=task_id,
-                path=metadata_path,
-            )
-
-            sig = inspect.signature(runner)
-            params = sig.parameters
-
-            def supports_kwarg(name):
-                if name in params:
-                    return True
-                for param in params.values():
-                    if param.kind == inspect.Parameter.VAR_KEYWORD:
-                        return True
-                return False
-
-            def has_required_positional_after_data():
-                positional = []
-                for param in params.values():
-                    if param.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD):
-                        positional.append(param)
-                # First positional is expected to be `data`
-                remaining = positional[1:]
-                for param in remaining:
-                    if param.default is inspect._empty:
-                        return True
-                return False
+            # File metadata is only available in the main process (not in file test child processes)
+            if UnmanicFileMetadata.is_available():
+                metadata_path = data.get("path") or data.get("file_path")
+                UnmanicFileMetadata.bind_runner_context(
+                    plugin_id=plugin_id,
+                    task_id=task_id,
+                    path=metadata_path,
+                )
 
-            kwargs = {}
-            if supports_kwarg("task_data_store"):
-                kwargs["task_data_store"] = TaskDataStore
-            if supports_kwarg("file_metadata"):
-                kwargs["file_metadata"] = UnmanicFileMetadata
-
-            if kwargs and not has_required_positional_after_data():
-                runner(data, **kwargs)
-            else:
-                # Backward compatibility: positional helpers (legacy; will be removed in a future release)
-                if self.settings.get_debugging():
-                    self.logger.warning(
-                        "Plugin '%s' runner '%s' is using legacy positional helper args. "
-                        "Please update to keyword args (task_data_store, file_metadata).",
-                        plugin_id,
-                        plugin_runner,
-                    )
-                if len(params) >= 3:
-                    runner(data, TaskDataStore, UnmanicFileMetadata)
-                elif len(params) >= 2:
-                    runner(data, TaskDataStore)
-                else:
-                    runner(data)
+            if uses_legacy_args and self.settings.get_debugging():
+                self.logger.warning(
+                    "Plugin '%s' runner '%s' is using legacy positional helper args. "
+                    "Please update to keyword args (task_data_store, file_metadata).",
+                    plugin_id,
+                    plugin_runner,
+                )
+            call_runner(data)
 
             run_successfully = True
         except Exception:
@@ -415,6 +458,7 @@ class PluginExecutor(object):
                     "description":   plugin_description,
                     "plugin_module": plugin_module,
                     "plugin_path":   plugin_path,
+                    "runner":        getattr(plugin_module, plugin_runner),
                 }
                 plugin_modules.append(plugin_runner_data)
 
@@ -462,7 +506,8 @@ class PluginExecutor(object):
 
             # Build form first so any in-memory defaults are applied without persisting
             plugin_form_settings = copy.deepcopy(plugin_settings.get_form_settings())
-            all_plugin_settings = copy.deepcopy(plugin_settings.get_setting())
+            # The settings returned are already a copy of the cached settings
+            all_plugin_settings = plugin_settings.get_setting()
         except Exception as e:
             self.logger.exception("Exception while fetching settings for plugin '%s' %s", plugin_id, e)
             all_plugin_settings = {}
@@ -55,7 +55,8 @@ class PostprocessorComplete(PluginType):
         start_time           - Float, UNIX timestamp when the task began.
         finish_time          - Float, UNIX timestamp when the task completed.
         processed_by_worker  - String, identifier of the worker that processed it.
-        log                  - String, full text of the task log.
+        log                  - String, the last lines of the task log (up to 200 lines).
+                               The full log is saved with the completed task in the history.
 
     If this runner needs shared task state or persisted file metadata, update the function signature
     to accept the injected keyword helpers:
@@ -29,11 +29,60 @@
            OR OTHER DEALINGS IN THE SOFTWARE.
 
 """
+import copy
 import json
 import os
 import sys
+import threading
 
 from unmanic import config
+from unmanic.libs.configversion import ConfigVersion
+
+# Process-wide cache of plugin settings files that have been read.
+# Keyed by (plugin_id, library_id), each value is a tuple of
+# (settings file, file signature, plugin defaults, configured settings, configured settings contain containers).
+# An entry is only used while the file on disk still has the same signature, so changes written by
+# other processes (such as a PluginChildProcess) are picked up on the next read.
+_settings_cache = {}
+_settings_cache_lock = threading.Lock()
+# Plugin directories keyed by the plugin module file
+_plugin_directories = {}
+# Profile directories that have been created (and migrated) by this process, keyed by (userdata_path, plugin_directory)
+_profile_directories = {}
+
+
+def _reset_settings_cache_lock():
+    # The lock may have been held by another thread at the time of a fork
+    global _settings_cache_lock
+    _settings_cache_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_settings_cache_lock)
+
+
+def _file_signature(path):
+    """
+    Returns a signature of the file that changes each time it is written, or None if the file does not exist.
+    Settings are written by replacing the file, so the inode changes even when the mtime resolution is coarse.
+
+    :param path:
+    :return:
+    """
+    try:
+        stat_result = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size
+
+
+def clear_settings_cache():
+    """
+    Discard all cached plugin settings.
+
+    :return:
+    """
+    with _settings_cache_lock:
+        _settings_cache.clear()
 
 
 class PluginSettings(object):
@@ -73,17 +122,7 @@ class PluginSettings(object):
                 raise Exception("Library ID needs to be an integer. You have provided '{}'".format(self.library_id))
 
     def __get_plugin_settings_file(self, force_library_settings=False):
-        plugin_directory = self.get_plugin_directory()
         profile_directory = self.get_profile_directory()
-        # Temp code to migrate settings to userdata
-        # TODO: Remove after initial release
-        if not os.path.exists(os.path.join(profile_directory, 'settings.json')):
-            if os.path.exists(os.path.join(plugin_directory, 'settings.json')):
-                import shutil
-                shutil.move(
-                    os.path.join(plugin_directory, 'settings.json'),
-                    os.path.join(profile_directory, 'settings.json')
-                )
         # If provided with a library ID, then the settings file will be different
         plugin_settings_file = os.path.join(profile_directory, 'settings.json')
         if self.library_id:
@@ -93,6 +132,26 @@ class PluginSettings(object):
                 plugin_settings_file = os.path.join(profile_directory, 'settings.json')
         return plugin_settings_file
 
+    def __stat_plugin_settings_file(self):
+        """
+        Returns the settings file that would be read for this plugin and library along with its signature.
+        The signature is None if no settings file exists yet.
+
+        :return:
+        """
+        profile_directory = self.get_profile_directory()
+        if self.library_id:
+            plugin_settings_file = os.path.join(profile_directory, 'settings.{}.json'.format(self.library_id))
+            signature = _file_signature(plugin_settings_file)
+            if signature is not None:
+                return plugin_settings_file, signature
+        # If the library file does not yet exist, then resort to using the default settings file
+        plugin_settings_file = os.path.join(profile_directory, 'settings.json')
+        return plugin_settings_file, _file_signature(plugin_settings_file)
+
+    def __cache_key(self):
+        return os.path.basename(self.get_plugin_directory()), self.library_id
+
     def __export_configured_settings(self):
         """
         Write settings to settings file
@@ -101,16 +160,36 @@ class PluginSettings(object):
         """
         plugin_settings_file = self.__get_plugin_settings_file(force_library_settings=True)
 
-        with open(plugin_settings_file, 'w') as f:
+        # Write to a temp file and move it into place so that readers never see a partially written file
+        os.makedirs(os.path.dirname(plugin_settings_file), exist_ok=True)
+        tmp_settings_file = '{}.{}.{}.tmp'.format(plugin_settings_file, os.getpid(), threading.get_ident())
+        with open(tmp_settings_file, 'w') as f:
             json.dump(self.settings_configured, f, indent=2)
+        os.replace(tmp_settings_file, plugin_settings_file)
+
+        # The next read will parse the new file
+        with _settings_cache_lock:
+            _settings_cache.pop(self.__cache_key(), None)
 
     def __import_configured_settings(self):
         """
-        Read settings from settings file
+        Read settings from settings file.
+        The file is only read and parsed again if it has changed since it was last read by this process.
 
         :return:
         """
-        plugin_settings_file = self.__get_plugin_settings_file()
+        cache_key = self.__cache_key()
+        plugin_settings_file, signature = self.__stat_plugin_settings_file()
+        cached_entry = _settings_cache.get(cache_key)
+        if signature is not None and cached_entry is not None:
+            cached_file, cached_signature, cached_defaults, cached_settings, cached_has_containers = cached_entry
+            if cached_file == plugin_settings_file and cached_signature == signature and cached_defaults == self.settings:
+                # Do not hand out references to the cached copy
+                if cached_has_containers:
+                    self.settings_configured = copy.deepcopy(cached_settings)
+                else:
+                    self.settings_configured = dict(cached_settings)
+                return
 
         # Default the configured settings to the plugin defaults
         # Loop over the self.settings object to clone the keys/values
@@ -119,8 +198,9 @@ class PluginSettings(object):
             self.settings_configured[key] = self.settings[key]
 
         # if the file does not yet exist, create it
-        if not os.path.exists(plugin_settings_file):
+        if signature is None:
             self.__export_configured_settings()
+            plugin_settings_file, signature = self.__stat_plugin_settings_file()
 
         # Read plugin settings from file
         with open(plugin_settings_file) as infile:
@@ -135,6 +215,16 @@ class PluginSettings(object):
                     value = self.settings.get(key)
                 self.settings_configured[key] = value
 
+        has_containers = any(isinstance(value, (dict, list)) for value in self.settings_configured.values())
+        with _settings_cache_lock:
+            _settings_cache[cache_key] = (
+                plugin_settings_file,
+                signature,
+                copy.deepcopy(self.settings),
+                copy.deepcopy(self.settings_configured),
+                has_containers,
+            )
+
     def reset_settings_to_defaults(self):
         """
         Remove all currently configured settings by deleting the settings.json file
@@ -151,6 +241,9 @@ class PluginSettings(object):
         # if the file does not yet exist, create it
         if os.path.exists(plugin_settings_file):
             os.remove(plugin_settings_file)
+            with _settings_cache_lock:
+                _settings_cache.pop(self.__cache_key(), None)
+            ConfigVersion().bump('plugin_settings.reset')
 
         if not os.path.exists(plugin_settings_file):
             return True
@@ -163,7 +256,12 @@ class PluginSettings(object):
 
         :return:
         """
-        return os.path.dirname(os.path.abspath(sys.modules[self.__class__.__module__].__file__))
+        module_file = sys.modules[self.__class__.__module__].__file__
+        plugin_directory = _plugin_directories.get(module_file)
+        if plugin_directory is None:
+            plugin_directory = os.path.dirname(os.path.abspath(module_file))
+            _plugin_directories[module_file] = plugin_directory
+        return plugin_directory
 
     def get_profile_directory(self):
         """
@@ -177,9 +275,22 @@ class PluginSettings(object):
         userdata_path = settings.get_userdata_path()
         plugin_directory = self.get_plugin_directory()
         plugin_id = os.path.basename(plugin_directory)
+        profile_directory = _profile_directories.get((userdata_path, plugin_directory))
+        if profile_directory is not None:
+            return profile_directory
         profile_directory = os.path.join(userdata_path, plugin_id)
         if not os.path.exists(profile_directory):
             os.makedirs(profile_directory)
+        # Temp code to migrate settings to userdata
+        # TODO: Remove after initial release
+        if not os.path.exists(os.path.join(profile_directory, 'settings.json')):
+            if os.path.exists(os.path.join(plugin_directory, 'settings.json')):
+                import shutil
+                shutil.move(
+                    os.path.join(plugin_directory, 'settings.json'),
+                    os.path.join(profile_directory, 'settings.json')
+                )
+        _profile_directories[(userdata_path, plugin_directory)] = profile_directory
         return profile_directory
 
     def get_form_settings(self):
@@ -240,6 +351,7 @@ class PluginSettings(object):
 
         # Export the settings again
         self.__export_configured_settings()
+        ConfigVersion().bump('plugin_settings.set')
 
         return True
 
@@ -476,12 +476,14 @@ class Worker(threading.Thread):
 
     worker_runners_info = {}
 
-    def __init__(self, thread_id, name, worker_group_id, pending_queue, complete_queue, event):
+    def __init__(self, thread_id, name, worker_group_id, pending_queue, complete_queue, event, idle_callback=None):
         super(Worker, self).__init__(name=name)
         self.thread_id = thread_id
         self.name = name
         self.worker_group_id = worker_group_id
         self.event = event
+        # Called each time this worker becomes idle and is ready for a task
+        self.idle_callback = idle_callback
 
         self.current_task = None
         self.current_command_ref = None
@@ -497,6 +499,10 @@ class Worker(threading.Thread):
         self.paused_flag = threading.Event()
         self.paused_flag.clear()
 
+        # Create 'wake' flag. This is set when a task is set, or when the paused or redundant flags change
+        self.wake_flag = threading.Event()
+        self.wake_flag.clear()
+
         # Create logger for this worker
         self.logger = UnmanicLogging.get_logger(name=__class__.__name__)
 
@@ -507,31 +513,40 @@ class Worker(threading.Thread):
         self.worker_subprocess_monitor = WorkerSubprocessMonitor(self)
         self.worker_subprocess_monitor.start()
 
+        announced_idle = False
         while not self.redundant_flag.is_set():
-            self.event.wait(1)  # Add delay for preventing loop maxing compute resources
+            self.wake_flag.clear()
 
             # If the Foreman has paused this worker, then don't do anything
             if self.paused_flag.is_set():
                 self.paused = True
-                # If the worker is paused, wait for 5 seconds before continuing the loop
-                self.event.wait(5)
+                announced_idle = False
+                # If the worker is paused, sleep until it is woken (or for 5 seconds) before continuing the loop
+                self.wake_flag.wait(5)
                 continue
             self.paused = False
 
-            # Set the worker as Idle - This will announce to the Foreman that it's ready for a task
-            self.idle = True
-
-            # Wait for task
-            while not self.redundant_flag.is_set() and self.current_task:
-                self.event.wait(0.5)  # Add delay for preventing loop maxing compute resources
-
+            # Process the set task
+            if self.current_task:
+                announced_idle = False
                 try:
-                    # Process the set task
                     self.__process_task_queue_item()
                 except queue.Empty:
                     continue
                 except Exception as e:
                     self.logger.exception("Exception in processing job with %s: %s", self.name, e)
+                    self.event.wait(0.5)  # Add delay for preventing loop maxing compute resources
+                continue
+
+            # Set the worker as Idle - This will announce to the Foreman that it's ready for a task
+            self.idle = True
+            if not announced_idle:
+                announced_idle = True
+                if self.idle_callback:
+                    self.idle_callback()
+
+            # Sleep until the Foreman sets a task
+            self.wake_flag.wait(5)
 
         self.logger.info("Stopping worker")
         self.worker_subprocess_monitor.stop()
@@ -547,6 +562,11 @@ class Worker(threading.Thread):
         self.current_task = new_task
         self.worker_log = []
         self.idle = False
+        self.wake()
+
+    def wake(self):
+        """Wake the worker loop to check for a new task or a change of the paused or redundant flags"""
+        self.wake_flag.set()
 
     def get_status(self):
         """
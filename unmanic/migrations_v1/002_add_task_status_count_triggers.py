@@ -0,0 +1,52 @@
+"""Peewee migrations -- 002_add_task_status_count_triggers.py.
+
+Some examples (model - class or model name)::
+
+    > Model = migrator.orm['model_name']            # Return model in current state by name
+
+    > migrator.sql(sql)                             # Run custom SQL
+    > migrator.python(func, *args, **kwargs)        # Run python code
+    > migrator.create_model(Model)                  # Create a model (could be used as decorator)
+    > migrator.remove_model(model, cascade=True)    # Remove a model
+    > migrator.add_fields(model, **fields)          # Add fields to a model
+    > migrator.change_fields(model, **fields)       # Change fields
+    > migrator.remove_fields(model, *field_names, cascade=True)
+    > migrator.rename_field(model, old_field_name, new_field_name)
+    > migrator.rename_table(model, new_table_name)
+    > migrator.add_index(model, *col_names, unique=False)
+    > migrator.drop_index(model, *col_names)
+    > migrator.add_not_null(model, *field_names)
+    > migrator.drop_not_null(model, *field_names)
+    > migrator.add_default(model, field_name, default)
+
+"""
+
+import peewee as pw
+from decimal import ROUND_HALF_EVEN
+
+from unmanic.libs.unmodels.taskstatuscounts import TASK_STATUS_COUNT_REBUILD, TASK_STATUS_COUNT_TRIGGERS
+
+try:
+    import playhouse.postgres_ext as pw_pext
+except ImportError:
+    pass
+
+SQL = pw.SQL
+
+"""Note:
+The task_status_counts table is created by the schema auto-sync before this migration runs.
+This adds the triggers that keep it up to date and fills it from any tasks that already exist.
+"""
+
+
+def migrate(migrator, database, fake=False, **kwargs):
+    """Write your migrations here."""
+    for statement in TASK_STATUS_COUNT_TRIGGERS + TASK_STATUS_COUNT_REBUILD:
+        migrator.sql(statement)
+
+
+def rollback(migrator, database, fake=False, **kwargs):
+    """Write your rollback migrations here."""
+    migrator.sql("DROP TRIGGER IF EXISTS tasks_status_counts_after_insert")
+    migrator.sql("DROP TRIGGER IF EXISTS tasks_status_counts_after_delete")
+    migrator.sql("DROP TRIGGER IF EXISTS tasks_status_counts_after_update")
@@ -0,0 +1,65 @@
+"""Peewee migrations -- 003_add_path_search_indexes.py.
+
+Some examples (model - class or model name)::
+
+    > Model = migrator.orm['model_name']            # Return model in current state by name
+
+    > migrator.sql(sql)                             # Run custom SQL
+    > migrator.python(func, *args, **kwargs)        # Run python code
+    > migrator.create_model(Model)                  # Create a model (could be used as decorator)
+    > migrator.remove_model(model, cascade=True)    # Remove a model
+    > migrator.add_fields(model, **fields)          # Add fields to a model
+    > migrator.change_fields(model, **fields)       # Change fields
+    > migrator.remove_fields(model, *field_names, cascade=True)
+    > migrator.rename_field(model, old_field_name, new_field_name)
+    > migrator.rename_table(model, new_table_name)
+    > migrator.add_index(model, *col_names, unique=False)
+    > migrator.drop_index(model, *col_names)
+    > migrator.add_not_null(model, *field_names)
+    > migrator.drop_not_null(model, *field_names)
+    > migrator.add_default(model, field_name, default)
+
+"""
+
+import peewee as pw
+from decimal import ROUND_HALF_EVEN
+
+from unmanic.libs.unmodels.searchindexes import (SEARCHABLE_COLUMNS, create_search_index_statements,
+                                                 drop_search_index_statements)
+
+try:
+    import playhouse.postgres_ext as pw_pext
+except ImportError:
+    pass
+
+SQL = pw.SQL
+
+
+def create_search_indexes(database):
+    for table_name, column_name in SEARCHABLE_COLUMNS:
+        statements = create_search_index_statements(table_name, column_name)
+        try:
+            database.execute_sql(statements[0])
+        except pw.OperationalError:
+            # This SQLite library was built without FTS5 or the trigram tokenizer (added in SQLite 3.34.0).
+            # Searches will continue to use LIKE.
+            return
+        for statement in statements[1:]:
+            database.execute_sql(statement)
+
+
+"""Note:
+The search indexes are FTS5 virtual tables. These are not models, so they are not created by the schema auto-sync.
+"""
+
+
+def migrate(migrator, database, fake=False, **kwargs):
+    """Write your migrations here."""
+    migrator.run(create_search_indexes, database)
+
+
+def rollback(migrator, database, fake=False, **kwargs):
+    """Write your rollback migrations here."""
+    for table_name, _ in SEARCHABLE_COLUMNS:
+        for statement in drop_search_index_statements(table_name):
+            migrator.sql(statement)
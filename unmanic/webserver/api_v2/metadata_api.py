@@ -35,7 +35,7 @@ from datetime import datetime
 
 from unmanic.libs.metadata import UnmanicFileMetadata
 from unmanic.libs.unmodels import CompletedTasks, FileMetadata, FileMetadataPaths
-from peewee import fn
+from unmanic.libs.unmodels.searchindexes import contains_search_value
 from unmanic.webserver.api_v2.base_api_handler import BaseApiError, BaseApiHandler
 from unmanic.webserver.api_v2.schema.schemas import MetadataSearchResultsSchema, RequestMetadataSearchSchema, \
     RequestMetadataByTaskSchema, RequestMetadataUpdateSchema, RequestMetadataDeleteSchema, \
@@ -118,7 +118,7 @@ class ApiMetadataHandler(BaseApiHandler):
                 base = (FileMetadata
                         .select(FileMetadata.id)
                         .join(FileMetadataPaths)
-                        .where(fn.LOWER(FileMetadataPaths.path).contains(search_value))
+                        .where(contains_search_value(FileMetadataPaths.path, search_value))
                         .distinct())
                 total_count = base.count()
                 page_ids = [row.id for row in base.order_by(FileMetadata.updated_at.desc()).limit(limit).offset(offset)]
@@ -39,7 +39,8 @@ from unmanic.webserver.api_v2.base_api_handler import BaseApiHandler, BaseApiErr
 from unmanic.webserver.api_v2.schema.schemas import PendingTasksTableResultsSchema, RequestPendingTaskCreateSchema, \
     RequestPendingTasksLibraryUpdateSchema, RequestPendingTasksReorderSchema, PendingTasksSchema, \
     RequestPendingTableDataSchema, RequestPendingTasksBulkActionSchema, TaskDownloadLinkSchema, \
-    RequestPendingTaskTestSchema, PendingTaskTestResultSchema, RequestTableUpdateByIdList, LibraryScanStatusSchema
+    RequestPendingTaskTestSchema, PendingTaskTestResultSchema, RequestTableUpdateByIdList, LibraryScanStatusSchema, \
+    PendingTasksBulkOperationSchema, PendingTasksBulkOperationsSchema, RequestPendingTasksBulkOperationSchema
 from unmanic.webserver.downloads import DownloadsLinks
 from unmanic.webserver.helpers import pending_tasks
 
@@ -61,6 +62,16 @@ class ApiPendingHandler(BaseApiHandler):
             "supported_methods": ["DELETE"],
             "call_method":       "delete_pending_tasks",
         },
+        {
+            "path_pattern":      r"/pending/bulk/status",
+            "supported_methods": ["GET"],
+            "call_method":       "get_pending_tasks_bulk_operations",
+        },
+        {
+            "path_pattern":      r"/pending/bulk/cancel",
+            "supported_methods": ["POST"],
+            "call_method":       "cancel_pending_tasks_bulk_operation",
+        },
         {
             "path_pattern":      r"/pending/rescan",
             "supported_methods": ["POST"],
@@ -193,6 +204,7 @@ class ApiPendingHandler(BaseApiHandler):
                 'length':       json_request.get('length', '10'),
                 'search_value': json_request.get('search_value', ''),
                 'library_ids':  json_request.get('library_ids', []),
+                'cursor':       json_request.get('cursor'),
                 'order':        {
                     "column": json_request.get('order_by', 'priority'),
                     "dir":    json_request.get('order_direction', 'desc'),
@@ -206,6 +218,7 @@ class ApiPendingHandler(BaseApiHandler):
                     "recordsTotal":    task_list.get('recordsTotal'),
                     "recordsFiltered": task_list.get('recordsFiltered'),
                     "results":         task_list.get('results'),
+                    "next_cursor":     task_list.get('next_cursor'),
                 }
             )
             self.write_success(response)
@@ -222,6 +235,8 @@ class ApiPendingHandler(BaseApiHandler):
         Pending - delete
         ---
         description: Delete a list of pending tasks.
+            With the 'all_filtered' selection mode, the matching tasks are deleted in the background and the
+            progress of the new bulk operation is returned.
         requestBody:
             description: Requested list of items to delete.
             required: True
@@ -231,7 +246,7 @@ class ApiPendingHandler(BaseApiHandler):
                         RequestPendingTasksBulkActionSchema
         responses:
             200:
-                description: 'Successful request; Returns success status'
+                description: 'Successful request; Returns success status or the bulk operation progress'
                 content:
                     application/json:
                         schema:
@@ -270,9 +285,13 @@ class ApiPendingHandler(BaseApiHandler):
                     'library_ids':  json_request.get('library_ids'),
                 }
                 exclude_ids = json_request.get('exclude_ids', [])
-                id_list = pending_tasks.get_filtered_pending_task_ids(filter_params, exclude_ids=exclude_ids)
-            else:
-                id_list = json_request.get('id_list', [])
+                operation = pending_tasks.start_filtered_pending_tasks_bulk_operation('delete', filter_params,
+                                                                                      exclude_ids=exclude_ids)
+                response = self.build_response(PendingTasksBulkOperationSchema(), operation)
+                self.write_success(response)
+                return
+
+            id_list = json_request.get('id_list', [])
 
             if not id_list:
                 self.set_status(self.STATUS_ERROR_EXTERNAL, reason="No pending tasks selected")
@@ -293,6 +312,121 @@ class ApiPendingHandler(BaseApiHandler):
             self.set_status(self.STATUS_ERROR_INTERNAL, reason=str(e))
             self.write_error()
 
+    async def get_pending_tasks_bulk_operations(self):
+        """
+        Pending - bulk operations status
+        ---
+        description: Returns the progress of running and recently finished pending tasks bulk operations.
+        responses:
+            200:
+                description: 'Sample response: Returns the progress of pending tasks bulk operations.'
+                content:
+                    application/json:
+                        schema:
+                            PendingTasksBulkOperationsSchema
+            400:
+                description: Bad request; Check `messages` for any validation errors
+                content:
+                    application/json:
+                        schema:
+                            BadRequestSchema
+            404:
+                description: Bad request; Requested endpoint not found
+                content:
+                    application/json:
+                        schema:
+                            BadEndpointSchema
+            405:
+                description: Bad request; Requested method is not allowed
+                content:
+                    application/json:
+                        schema:
+                            BadMethodSchema
+            500:
+                description: Internal error; Check `error` for exception
+                content:
+                    application/json:
+                        schema:
+                            InternalErrorSchema
+        """
+        try:
+            response = self.build_response(
+                PendingTasksBulkOperationsSchema(),
+                {
+                    "operations": pending_tasks.get_pending_tasks_bulk_operations(),
+                }
+            )
+            self.write_success(response)
+            return
+        except BaseApiError as bae:
+            tornado.log.app_log.error("BaseApiError.{}: {}".format(self.route.get('call_method'), str(bae)))
+            return
+        except Exception as e:
+            self.set_status(self.STATUS_ERROR_INTERNAL, reason=str(e))
+            self.write_error()
+
+    async def cancel_pending_tasks_bulk_operation(self):
+        """
+        Pending - cancel bulk operation
+        ---
+        description: Cancel a running pending tasks bulk operation.
+            Chunks that have already been processed are not reverted.
+        requestBody:
+            description: The ID of the bulk operation to cancel.
+            required: True
+            content:
+                application/json:
+                    schema:
+                        RequestPendingTasksBulkOperationSchema
+        responses:
+            200:
+                description: 'Successful request; Returns success status'
+                content:
+                    application/json:
+                        schema:
+                            BaseSuccessSchema
+            400:
+                description: Bad request; Check `messages` for any validation errors
+                content:
+                    application/json:
+                        schema:
+                            BadRequestSchema
+            404:
+                description: Bad request; Requested endpoint not found
+                content:
+                    application/json:
+                        schema:
+                            BadEndpointSchema
+            405:
+                description: Bad request; Requested method is not allowed
+                content:
+                    application/json:
+                        schema:
+                            BadMethodSchema
+            500:
+                description: Internal error; Check `error` for exception
+                content:
+                    application/json:
+                        schema:
+                            InternalErrorSchema
+        """
+        try:
+            json_request = self.read_json_request(RequestPendingTasksBulkOperationSchema())
+
+            if not pending_tasks.cancel_pending_tasks_bulk_operation(json_request.get('id')):
+                self.set_status(self.STATUS_ERROR_EXTERNAL, reason="No bulk operation found with the given ID")
+                self.write_error()
+                return
+
+            self.write_success()
+            return
+        except BaseApiError as bae:
+            tornado.log.app_log.error("BaseApiError.{}: {}".format(self.route.get('call_method'), str(bae)))
+            return
+        except Exception as e:
+            self.set_status(self.STATUS_ERROR_INTERNAL, reason=str(e))
+            self.write_error()
+
     async def trigger_library_rescan(self):
         """
         Pending - trigger a library scan
@@ -433,6 +567,8 @@ class ApiPendingHandler(BaseApiHandler):
         Pending - reorder
         ---
         description: Reorder a list of pending tasks.
+            With the 'all_filtered' selection mode, the matching tasks are reordered in the background and the
+            progress of the new bulk operation is returned.
         requestBody:
             description: Requested list of items to reorder.
             required: True
@@ -442,7 +578,7 @@ class ApiPendingHandler(BaseApiHandler):
                         RequestPendingTasksReorderSchema
         responses:
             200:
-                description: 'Successful request; Returns success status'
+                description: 'Successful request; Returns success status or the bulk operation progress'
                 content:
                     application/json:
                         schema:
@@ -481,9 +617,13 @@ class ApiPendingHandler(BaseApiHandler):
                     'library_ids':  json_request.get('library_ids'),
                 }
                 exclude_ids = json_request.get('exclude_ids', [])
-                id_list = pending_tasks.get_filtered_pending_task_ids(filter_params, exclude_ids=exclude_ids)
-            else:
-                id_list = json_request.get('id_list', [])
+                operation = pending_tasks.start_filtered_pending_tasks_bulk_operation(
+                    'reorder', filter_params, exclude_ids=exclude_ids, position=json_request.get('position', 'top'))
+                response = self.build_response(PendingTasksBulkOperationSchema(), operation)
+                self.write_success(response)
+                return
+
+            id_list = json_request.get('id_list', [])
 
             if not id_list:
                 self.set_status(self.STATUS_ERROR_EXTERNAL, reason="No pending tasks selected")
@@ -651,6 +651,14 @@ class RequestPendingTableDataSchema(RequestTableDataSchema):
         load_default=[],
         validate=validate.Length(min=0),
     )
+    cursor = fields.Str(
+        required=False,
+        description="The 'next_cursor' returned with the previous page. When ordered by priority, the page starts "
+                    "after this position and 'start' is ignored",
+        example="1500:42",
+        allow_none=True,
+        load_default=None,
+    )
 
 
 class RequestPendingTasksBulkActionSchema(BaseSchema):
@@ -748,6 +756,12 @@ class PendingTasksSchema(TableRecordsSuccessSchema):
         many=True,
         validate=validate.Length(min=0),
     )
+    next_cursor = fields.Str(
+        required=False,
+        allow_none=True,
+        description="Cursor to request the next page with. Null when there are no more results",
+        example="1500:42",
+    )
 
 
 class LibraryScanStatusSchema(BaseSchema):
@@ -810,6 +824,78 @@ class RequestPendingTasksReorderSchema(RequestPendingTasksBulkActionSchema):
     )
 
 
+class PendingTasksBulkOperationSchema(BaseSchema):
+    """Schema for returning the progress of a pending tasks bulk operation"""
+
+    id = fields.Str(
+        required=True,
+        description="The bulk operation ID",
+        example="5a1d2c3b4e5f60718293a4b5c6d7e8f9",
+    )
+    action = fields.Str(
+        required=True,
+        description="The bulk operation action",
+        example="delete",
+        validate=validate.OneOf(["delete", "reorder"]),
+    )
+    state = fields.Str(
+        required=True,
+        description="The current state of the bulk operation",
+        example="running",
+        validate=validate.OneOf(["pending", "running", "complete", "cancelled", "failed"]),
+    )
+    processed = fields.Int(
+        required=True,
+        description="The number of tasks processed so far",
+        example=1500,
+    )
+    total = fields.Int(
+        required=True,
+        description="The number of tasks that matched the filter when the operation started",
+        example=250000,
+    )
+    started_at = fields.Float(
+        required=False,
+        allow_none=True,
+        description="Unix timestamp of when the operation started",
+        example=1700000000.0,
+    )
+    finished_at = fields.Float(
+        required=False,
+        allow_none=True,
+        description="Unix timestamp of when the operation finished",
+        example=None,
+    )
+    error = fields.Str(
+        required=False,
+        allow_none=True,
+        description="The error that caused the operation to fail",
+        example=None,
+    )
+
+
+class PendingTasksBulkOperationsSchema(BaseSchema):
+    """Schema for returning the progress of all pending tasks bulk operations"""
+
+    operations = fields.Nested(
+        PendingTasksBulkOperationSchema,
+        required=True,
+        description="Running and recently finished bulk operations",
+        many=True,
+        validate=validate.Length(min=0),
+    )
+
+
+class RequestPendingTasksBulkOperationSchema(BaseSchema):
+    """Schema for requesting a pending tasks bulk operation by its ID"""
+
+    id = fields.Str(
+        required=True,
+        description="The bulk operation ID",
+        example="5a1d2c3b4e5f60718293a4b5c6d7e8f9",
+    )
+
+
 class RequestPendingTaskCreateSchema(BaseSchema):
     """Schema for requesting the creation of a pending task"""
 
@@ -1704,6 +1790,11 @@ class SettingsLibraryConfigReadAndWriteSchema(BaseSchema):
             "enable_scanner": False,
             "enable_inotify": False,
             "priority_score": 0,
+            "prefilters":     {
+                "extensions":    ["mkv", "mp4", "avi"],
+                "min_size":      1048576,
+                "exclude_paths": ["*/Extras/*"],
+            },
             "tags":           [],
         },
     )
@@ -129,6 +129,11 @@ class ApiSettingsHandler(BaseApiHandler):
             "supported_methods": ["DELETE"],
             "call_method":       "remove_library",
         },
+        {
+            "path_pattern":      r"/settings/library/flush_file_test_cache",
+            "supported_methods": ["POST"],
+            "call_method":       "flush_library_file_test_cache",
+        },
         {
             "path_pattern":      r"/settings/library/export",
             "supported_methods": ["POST"],
@@ -970,6 +975,7 @@ class ApiSettingsHandler(BaseApiHandler):
                     "enable_scanner":     False,
                     "enable_inotify":     False,
                     "priority_score":     0,
+                    "prefilters":         {},
                 },
                 "plugins":        {
                     "enabled_plugins": [],
@@ -988,6 +994,7 @@ class ApiSettingsHandler(BaseApiHandler):
                         "enable_scanner":     library_config.get_enable_scanner(),
                         "enable_inotify":     library_config.get_enable_inotify(),
                         "priority_score":     library_config.get_priority_score(),
+                        "prefilters":         library_config.get_prefilters(),
                         "tags":               library_config.get_tags(),
                     },
                     "plugins":        {
@@ -1140,6 +1147,66 @@ class ApiSettingsHandler(BaseApiHandler):
             self.set_status(self.STATUS_ERROR_INTERNAL, reason=str(e))
             self.write_error()
 
+    async def flush_library_file_test_cache(self):
+        """
+        Settings - flush a library's file test cache
+        ---
+        description: Discard the cached file test results for a library so that every file is tested again on the next scan
+        requestBody:
+            description: Requested a library to flush the file test cache of.
+            required: True
+            content:
+                application/json:
+                    schema:
+                        RequestLibraryByIdSchema
+        responses:
+            200:
+                description: 'Successful request; Returns success status'
+                content:
+                    application/json:
+                        schema:
+                            BaseSuccessSchema
+            400:
+                description: Bad request; Check `messages` for any validation errors
+                content:
+                    application/json:
+                        schema:
+                            BadRequestSchema
+            404:
+                description: Bad request; Requested endpoint not found
+                content:
+                    application/json:
+                        schema:
+                            BadEndpointSchema
+            405:
+                description: Bad request; Requested method is not allowed
+                content:
+                    application/json:
+                        schema:
+                            BadMethodSchema
+            500:
+                description: Internal error; Check `error` for exception
+                content:
+                    application/json:
+                        schema:
+                            InternalErrorSchema
+        """
+        try:
+            json_request = self.read_json_request(RequestLibraryByIdSchema())
+
+            # Fetch existing library by ID
+            library = Library(json_request.get('id'))
+            library.flush_file_test_cache()
+
+            self.write_success()
+            return
+        except BaseApiError as bae:
+            tornado.log.app_log.error("BaseApiError.{}: {}".format(self.route.get('call_method'), str(bae)))
+            return
+        except Exception as e:
+            self.set_status(self.STATUS_ERROR_INTERNAL, reason=str(e))
+            self.write_error()
+
     async def export_library_plugin_config(self):
         """
         Settings - export the plugin configuration of one library
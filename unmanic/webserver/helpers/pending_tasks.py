@@ -32,6 +32,7 @@
 import os
 from unmanic.libs import task
 from unmanic.libs import filetest
+from unmanic.libs.bulkoperations import PendingTasksBulkOperations
 from unmanic.libs.library import Library
 from unmanic.libs.logs import UnmanicLogging
 
@@ -39,6 +40,50 @@ from unmanic.libs.logs import UnmanicLogging
 logger = UnmanicLogging.get_logger(name=__name__)
 
 
+def build_pending_tasks_cursor(pending_task):
+    """
+    Returns a cursor string that points to the position of a pending task in a list ordered by priority
+
+    :param pending_task:
+    :return:
+    """
+    return "{}:{}".format(pending_task['priority'], pending_task['id'])
+
+
+def parse_pending_tasks_cursor(cursor):
+    """
+    Returns the (priority, id) tuple for a cursor string.
+    Returns None if no valid cursor was given.
+
+    :param cursor:
+    :return:
+    """
+    if not cursor:
+        return None
+    try:
+        priority, task_id = str(cursor).split(':', 1)
+        return int(priority), int(task_id)
+    except ValueError:
+        logger.warning("Ignoring invalid pending tasks cursor '%s'", cursor)
+        return None
+
+
+def count_filtered_pending_tasks(task_handler, search_value='', library_ids=None):
+    """
+    Returns the number of pending tasks matching the filters.
+    Without a search value this is read from the task status counts rather than counting the tasks table.
+
+    :param task_handler:
+    :param search_value:
+    :param library_ids:
+    :return:
+    """
+    if not search_value:
+        return task_handler.get_task_status_count(status='pending', library_ids=library_ids)
+    return task_handler.get_task_list_filtered_and_sorted(order=None, start=0, length=0, search_value=search_value,
+                                                          status='pending', library_ids=library_ids).count()
+
+
 def prepare_filtered_pending_tasks_for_table(request_dict):
     """
     Returns a object of records filtered and sorted
@@ -67,9 +112,7 @@ def prepare_filtered_pending_tasks_for_table(request_dict):
     # Get total count
     records_total_count = task_handler.get_total_task_list_count()
     # Get quantity after filters (without pagination)
-    records_filtered_count = task_handler.get_task_list_filtered_and_sorted(order=order, start=0, length=0,
-                                                                            search_value=search_value,
-                                                                            status='pending').count()
+    records_filtered_count = count_filtered_pending_tasks(task_handler, search_value=search_value)
     # Get filtered/sorted results
     pending_task_results = task_handler.get_task_list_filtered_and_sorted(order=order, start=start, length=length,
                                                                           search_value=search_value, status='pending')
@@ -104,12 +147,16 @@ def prepare_filtered_pending_tasks(params, include_library=False):
     Returns a object of records filtered and sorted
     according to the provided request.
 
+    If the params include a 'cursor' (the 'next_cursor' returned with the previous page) and the list
+    is ordered by priority, then the next page is fetched from that position rather than from 'start'.
+
     :param params:
     :param include_library:
     :return:
     """
     start = params.get('start', 0)
     length = params.get('length', 0)
+    cursor = parse_pending_tasks_cursor(params.get('cursor'))
 
     search_value = params.get('search_value', '')
     library_ids = params.get('library_ids') or []
@@ -124,14 +171,8 @@ def prepare_filtered_pending_tasks(params, include_library=False):
     # Get total count
     records_total_count = task_handler.get_total_task_list_count()
     # Get quantity after filters (without pagination)
-    records_filtered_count = task_handler.get_task_list_filtered_and_sorted(
-        order=order,
-        start=0,
-        length=0,
-        search_value=search_value,
-        status='pending',
-        library_ids=library_ids
-    ).count()
+    records_filtered_count = count_filtered_pending_tasks(task_handler, search_value=search_value,
+                                                          library_ids=library_ids)
     # Get filtered/sorted results
     pending_task_results = task_handler.get_task_list_filtered_and_sorted(
         order=order,
@@ -139,16 +180,24 @@ def prepare_filtered_pending_tasks(params, include_library=False):
         length=length,
         search_value=search_value,
         status='pending',
-        library_ids=library_ids
+        library_ids=library_ids,
+        after=cursor
     )
 
     # Build return data
     return_data = {
         "recordsTotal":    records_total_count,
         "recordsFiltered": records_filtered_count,
-        "results":         []
+        "results":         [],
+        "next_cursor":     None,
     }
 
+    # Fetch the library names once rather than for each task
+    library_names = {}
+    if include_library:
+        for library in Library.get_all_libraries():
+            library_names[library.get('id')] = library.get('name')
+
     # Iterate over tasks and append them to the task data
     for pending_task in pending_task_results:
         # Set params as required in template
@@ -160,49 +209,54 @@ def prepare_filtered_pending_tasks(params, include_library=False):
             'status':   pending_task['status'],
         }
         if include_library:
-            # Get library
-            library = Library(pending_task['library_id'])
-            item['library_id'] = library.get_id()
-            item['library_name'] = library.get_name()
+            item['library_id'] = pending_task['library_id']
+            item['library_name'] = library_names.get(pending_task['library_id'], '')
         return_data["results"].append(item)
 
+    # Return a cursor for the next page if this page was full
+    if order.get('column') == 'priority' and length and len(return_data["results"]) == int(length):
+        return_data["next_cursor"] = build_pending_tasks_cursor(return_data["results"][-1])
+
     # Return results
     return return_data
 
 
-def get_filtered_pending_task_ids(params, exclude_ids=None):
+def start_filtered_pending_tasks_bulk_operation(action, params, exclude_ids=None, position='top'):
     """
-    Returns a list of pending task IDs filtered according to the provided request.
+    Starts a background operation to delete or reorder all pending tasks matching the filters.
+    Returns the progress of the new operation.
 
+    :param action:
     :param params:
     :param exclude_ids:
+    :param position:
     :return:
     """
-    search_value = params.get('search_value', '')
-    library_ids = params.get('library_ids') or []
+    bulk_operations = PendingTasksBulkOperations()
+    return bulk_operations.start(action, search_value=params.get('search_value', ''),
+                                 library_ids=params.get('library_ids') or [], exclude_ids=exclude_ids,
+                                 position=position)
 
-    exclude_set = set(exclude_ids or [])
 
-    task_handler = task.Task()
-    query = task_handler.get_task_list_filtered_and_sorted(
-        order=None,
-        start=0,
-        length=0,
-        search_value=search_value,
-        status='pending',
-        library_ids=library_ids
-    )
+def get_pending_tasks_bulk_operations():
+    """
+    Returns the progress of all running and recently finished pending task bulk operations
+
+    :return:
+    """
+    bulk_operations = PendingTasksBulkOperations()
+    return bulk_operations.get_progress()
 
-    id_list = []
-    for record in query:
-        task_id = record.get('id')
-        if task_id is None:
-            continue
-        if task_id in exclude_set:
-            continue
-        id_list.append(task_id)
 
-    return id_list
+def cancel_pending_tasks_bulk_operation(operation_id):
+    """
+    Cancels a running pending task bulk operation
+
+    :param operation_id:
+    :return:
+    """
+    bulk_operations = PendingTasksBulkOperations()
+    return bulk_operations.cancel(operation_id)
 
 
 def remove_pending_tasks(pending_task_ids):
@@ -73,6 +73,7 @@ def save_library_config(library_id, library_config=None, plugin_config=None):
         library.set_enable_scanner(library_config.get('enable_scanner', library.get_enable_scanner()))
         library.set_enable_inotify(library_config.get('enable_inotify', library.get_enable_inotify()))
         library.set_priority_score(library_config.get('priority_score', library.get_priority_score()))
+        library.set_prefilters(library_config.get('prefilters', library.get_prefilters()))
         library.set_tags(library_config.get('tags', library.get_tags()))
 
     # Update enabled plugins (if the data was given)